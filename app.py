@@ -1,32 +1,48 @@
+import time
+BOOT_STARTED = time.perf_counter()
+
 from twilio.twiml.voice_response import VoiceResponse, Gather, Say, Play, Record, Dial, Pause
-from twilio.rest import Client
 from functools import wraps
 import re
 from urllib.parse import urlencode
-from flask import Flask, request, jsonify, render_template_string, session, make_response
+from flask import Flask, request, jsonify, render_template_string, session, make_response, g, has_request_context
 from flask_cors import CORS
 import requests
-from bs4 import BeautifulSoup
-import phonenumbers
-from phonenumbers import NumberParseException
-from twilio.rest import Client
-import anthropic
+from requests.adapters import HTTPAdapter
 import os
 import logging
 from dotenv import load_dotenv
-from difflib import get_close_matches
 import json
-import time
-import base64
 import asyncio
 from datetime import datetime, timedelta
 from typing import Optional, Tuple, Dict, Any, List
-import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timedelta, timezone
 import uuid
+import random
 import hashlib
+import hmac
+import threading
+import atexit
+from concurrent.futures import Future, ThreadPoolExecutor
+from tts_cache import TTSAudioCache, normalize_tts_text
+from audio_store import AudioStore
+from faq_index import FAQIndex
+from intent_router import IntentRouter
+from site_index import SiteKnowledgeIndex
+from resilience import CircuitBreaker, LatencyStats
+from call_events import CallEventQueue, BATCH_REJECTED
+from outbox import CRMOutbox, RejectedWrite
+from slot_cache import SlotCache
+from notifications import NotificationQueue
+from smtp_pool import SMTPConnectionPool
+from sms_dispatcher import SMSDispatcher
+from page_cache import PageCache
+from asset_pipeline import AssetPipeline
+from log_pipeline import LogPipeline, parse_sample_rates
+from metrics import registry as metrics, instrument_session
+from tts_client import ElevenLabsClient, RACHEL_VOICE_ID, DEFAULT_MODEL_ID, DEFAULT_VOICE_SETTINGS, MIN_AUDIO_BYTES
 
 # Client Configuration - ADD THIS SECTION
 CLIENT_ID = os.getenv('CLIENT_ID', 'default')
@@ -41,17 +57,31 @@ app = Flask(__name__)
 app.secret_key = os.getenv('SECRET_KEY', 'your-default-secret-key-change-this')
 CORS(app, origins="*", allow_headers="*", methods="*")
 
-# Setup Enhanced Logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[
-        logging.FileHandler("ringlypro.log"),
-        logging.StreamHandler()
-    ]
-)
+def log_sampling_scope():
+    """Per-request memo for LOG_SAMPLE_RATES, so a sampled request keeps all of its hot-path lines"""
+    if not has_request_context():
+        return None
+    if 'log_sampling' not in g:
+        g.log_sampling = {}
+    return g.log_sampling
+
+# Setup Enhanced Logging - request threads only enqueue records; a listener thread writes the
+# size-rotated file and the console
+log_pipeline = LogPipeline(
+    os.getenv("LOG_FILE", "ringlypro.log"),
+    level=getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO),
+    max_bytes=int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024))),
+    backup_count=int(os.getenv("LOG_BACKUP_COUNT", "5")),
+    sample_rates=parse_sample_rates(os.getenv("LOG_SAMPLE_RATES", "ringlypro.hotpath=10")),
+    queue_size=int(os.getenv("LOG_QUEUE_SIZE", "10000")),
+    sample_scope=log_sampling_scope
+).install()
+atexit.register(log_pipeline.stop)
 logger = logging.getLogger(__name__)
 
+# Per-message chat lines go here so LOG_SAMPLE_RATES can thin them out
+hot_path_logger = logging.getLogger("ringlypro.hotpath")
+
 # API Keys validation
 anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
 openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -66,6 +96,8 @@ TWILIO_WEBHOOK_BASE_URL = os.getenv("WEBHOOK_BASE_URL", "https://voice-bot-r91r.
 
 # CRM Configuration - PostgreSQL Backend
 CRM_WEBHOOK_URL = "https://ringlypro-crm.onrender.com/api/calls/webhook/voice"
+# Batched call events only when the CRM's batch endpoint is configured explicitly
+CRM_WEBHOOK_BATCH_URL = os.getenv("CRM_WEBHOOK_BATCH_URL", "")
 
 # Email Configuration
 smtp_server = os.getenv("SMTP_SERVER", "smtp.gmail.com")
@@ -74,11 +106,99 @@ email_user = os.getenv("EMAIL_USER")
 email_password = os.getenv("EMAIL_PASSWORD")
 from_email = os.getenv("FROM_EMAIL", email_user)
 
+# Warm, authenticated SMTP sessions shared by every confirmation email in this worker
+smtp_pool = SMTPConnectionPool(
+    smtp_server,
+    smtp_port,
+    email_user,
+    email_password,
+    size=int(os.getenv("SMTP_POOL_SIZE", "2")),
+    timeout=float(os.getenv("SMTP_TIMEOUT", "10")),
+    max_age=float(os.getenv("SMTP_CONNECTION_MAX_AGE", "300")),
+    max_messages=int(os.getenv("SMTP_CONNECTION_MAX_MESSAGES", "100"))
+)
+
+# One Twilio REST client per worker, reusing its HTTP connections; built on first use because
+# Client() refuses to construct without credentials and twilio.rest is slow to import
+_twilio_client = None
+_twilio_client_lock = threading.Lock()
+
+def get_twilio_client():
+    """Shared Twilio REST client with a pooled keep-alive session"""
+    global _twilio_client
+    with _twilio_client_lock:
+        if _twilio_client is None:
+            from twilio.rest import Client
+            from twilio.http.http_client import TwilioHttpClient
+            _twilio_client = Client(
+                twilio_account_sid,
+                twilio_auth_token,
+                http_client=TwilioHttpClient(
+                    pool_connections=True,
+                    timeout=float(os.getenv("TWILIO_TIMEOUT", "10")),
+                    max_retries=int(os.getenv("TWILIO_RETRIES", "2"))
+                )
+            )
+            instrument_session(_twilio_client.http_client.session, 'twilio', metrics)
+        return _twilio_client
+
+def send_twilio_sms(to: str, body: str, from_: str) -> str:
+    """Dispatcher sender: one message through the shared client, returning its SID"""
+    return get_twilio_client().messages.create(body=body, from_=from_, to=to).sid
+
+# Outbound SMS leave the request thread, paced per sender number and de-duplicated per recipient
+sms_dispatcher = SMSDispatcher(
+    send_twilio_sms,
+    rate_per_second=float(os.getenv("SMS_RATE_PER_SECOND", "1")),
+    burst=int(os.getenv("SMS_BURST", "3")),
+    dedup_window=float(os.getenv("SMS_DEDUP_SECONDS", "300")),
+    workers=int(os.getenv("SMS_WORKERS", "2"))
+)
+SMS_SEND_TIMEOUT = float(os.getenv("SMS_SEND_TIMEOUT", "30"))
+
 # HubSpot Configuration
 hubspot_api_token = os.getenv("HUBSPOT_ACCESS_TOKEN")
 hubspot_portal_id = os.getenv("HUBSPOT_PORTAL_ID")
 hubspot_owner_id = os.getenv("HUBSPOT_OWNER_ID")
 
+# ElevenLabs Configuration
+ELEVENLABS_API_BASE = os.getenv("ELEVENLABS_API_BASE", "https://api.elevenlabs.io")
+TTS_STREAMING_ENABLED = os.getenv("TTS_STREAMING", "false").lower() == "true"
+
+# Key for signing /audio/stream URLs; a guessable key would let anyone spend ElevenLabs quota, so
+# without AUDIO_STREAM_SECRET (or an explicit SECRET_KEY) streaming stays off and the route refuses
+AUDIO_STREAM_SECRET = os.getenv("AUDIO_STREAM_SECRET") or os.getenv("SECRET_KEY")
+if TTS_STREAMING_ENABLED and not AUDIO_STREAM_SECRET:
+    logger.error("TTS_STREAMING needs AUDIO_STREAM_SECRET or SECRET_KEY to sign stream URLs - streaming disabled")
+    TTS_STREAMING_ENABLED = False
+
+# Shared keep-alive ElevenLabs client, one connection pool per worker
+tts_client = ElevenLabsClient(
+    elevenlabs_api_key,
+    base_url=ELEVENLABS_API_BASE,
+    pool_size=int(os.getenv("TTS_POOL_SIZE", "10")),
+    timeout=float(os.getenv("TTS_TIMEOUT", "10"))
+)
+instrument_session(tts_client.session, 'elevenlabs', metrics)
+
+# Bounded pool so every utterance of one TwiML response is synthesized concurrently
+tts_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("TTS_PARALLELISM", "4")),
+    thread_name_prefix="tts"
+)
+
+# TTS Audio Cache Configuration
+tts_cache_max_mb = int(os.getenv("TTS_CACHE_MAX_MB", "32"))
+tts_audio_cache = TTSAudioCache(max_bytes=tts_cache_max_mb * 1024 * 1024)
+
+# Audio Store Configuration - memory tier above, shared disk tier with TTL expiry
+audio_store = AudioStore(
+    directory=os.getenv("AUDIO_STORE_DIR", "/tmp/ringlypro_audio"),
+    memory=tts_audio_cache,
+    ttl_seconds=int(os.getenv("AUDIO_TTL_SECONDS", "3600")),
+    max_disk_bytes=int(os.getenv("AUDIO_STORE_MAX_MB", "256")) * 1024 * 1024
+)
+
 # Zoom Configuration
 zoom_meeting_url = "https://us06web.zoom.us/j/7269045564?pwd=MnR6TXVio652a69JpgaDtMcemiwT9X.1"
 zoom_meeting_id = "726 904 5564"
@@ -110,44 +230,159 @@ CRM_HEADERS = {
 class CRMAPIClient:
     """Client for RinglyPro CRM API integration with PostgreSQL backend"""
     
+    # Idempotent methods are safe to retry after a timeout or a 5xx
+    RETRYABLE_METHODS = ('GET',)
+    # Client errors that say "not now" rather than "never"
+    TRANSIENT_CLIENT_ERRORS = (408, 429)
+    # Fixed path segments of the CRM API; anything else (codes, ids, slugs) is a parameter
+    ROUTE_SEGMENTS = frozenset({
+        'health', 'appointments', 'confirmation', 'available-slots', 'calls', 'webhook', 'voice',
+        'inquiries', 'admin', 'stats'
+    })
+    
     def __init__(self):
         self.base_url = CRM_BASE_URL
         self.headers = CRM_HEADERS
-        self.timeout = 10
+        self.timeout = (float(os.getenv("CRM_CONNECT_TIMEOUT", "3.05")), float(os.getenv("CRM_READ_TIMEOUT", "10")))
+        self.max_retries = int(os.getenv("CRM_RETRIES", "2"))
+        self.retry_backoff = float(os.getenv("CRM_RETRY_BACKOFF", "0.25"))
+        self.failure_threshold = int(os.getenv("CRM_BREAKER_FAILURES", "5"))
+        self.reset_timeout = float(os.getenv("CRM_BREAKER_RESET_SECONDS", "30"))
+        
+        # One keep-alive pool per worker instead of a new connection per call
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=int(os.getenv("CRM_POOL_SIZE", "10")))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(self.headers)
+        instrument_session(self.session, 'crm', metrics)
+        
+        self.breakers = {}
+        self.latency = {}
+        self._stats_lock = threading.Lock()
     
-    def _make_request(self, method, endpoint, data=None, params=None):
-        """Make HTTP request to CRM API with PostgreSQL backend"""
+    @staticmethod
+    def endpoint_key(method, endpoint):
+        """Group endpoints by route template so /appointments/confirmation/<code> shares one breaker"""
+        path = endpoint.split('?', 1)[0].strip('/')
+        segments = [segment if segment in CRMAPIClient.ROUTE_SEGMENTS else ':id'
+                    for segment in path.split('/') if segment]
+        return f"{method.upper()} /{'/'.join(segments)}"
+    
+    def _endpoint_state(self, key):
+        with self._stats_lock:
+            if key not in self.breakers:
+                self.breakers[key] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                self.latency[key] = LatencyStats()
+            return self.breakers[key], self.latency[key]
+    
+    @staticmethod
+    def _error_detail(response) -> str:
         try:
-            url = f"{self.base_url}/{endpoint.lstrip('/')}"
-            
-            if method.upper() == 'GET':
-                response = requests.get(url, headers=self.headers, params=params, timeout=self.timeout)
-            elif method.upper() == 'POST':
-                response = requests.post(url, headers=self.headers, json=data, timeout=self.timeout)
-            elif method.upper() == 'PUT':
-                response = requests.put(url, headers=self.headers, json=data, timeout=self.timeout)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            response.raise_for_status()
-            return response.json()
-            
-        except requests.exceptions.Timeout:
-            logger.error(f"CRM API timeout for {endpoint}")
-            return None
-        except requests.exceptions.ConnectionError:
-            logger.error(f"CRM API connection error for {endpoint}")
-            return None
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"CRM API HTTP error for {endpoint}: {e.response.status_code}")
+            body = response.json()
+            if isinstance(body, dict):
+                return str(body.get('error') or body.get('message') or body)
+        except ValueError:
+            pass
+        return response.text[:200]
+    
+    def _make_request(self, method, endpoint, data=None, params=None, headers=None, raise_rejections=False):
+        """Make HTTP request to CRM API with PostgreSQL backend.
+        Returns None on any failure; with raise_rejections a permanent 4xx raises RejectedWrite instead"""
+        method = method.upper()
+        if method not in ('GET', 'POST', 'PUT'):
+            logger.error(f"CRM API unexpected error for {endpoint}: Unsupported HTTP method: {method}")
             return None
-        except Exception as e:
-            logger.error(f"CRM API unexpected error for {endpoint}: {e}")
+        
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        key = self.endpoint_key(method, endpoint)
+        breaker, latency = self._endpoint_state(key)
+        
+        if not breaker.allow():
+            logger.warning(f"CRM API circuit open for {key} - failing fast")
             return None
+        
+        attempts = 1 + (self.max_retries if method in self.RETRYABLE_METHODS else 0)
+        started = time.perf_counter()
+        rejection = None
+        for attempt in range(attempts):
+            if attempt:
+                # Full jitter keeps workers from retrying a cold-starting CRM in lockstep
+                time.sleep(random.uniform(0, self.retry_backoff * (2 ** (attempt - 1))))
+            
+            try:
+                response = self.session.request(method, url, params=params, json=data, headers=headers,
+                                                timeout=self.timeout)
+                
+                if response.status_code >= 500 and attempt + 1 < attempts:
+                    logger.warning(f"CRM API {response.status_code} for {endpoint} - retrying")
+                    continue
+                
+                response.raise_for_status()
+                try:
+                    result = response.json()
+                except ValueError:
+                    # Accepted with a non-JSON body (e.g. an empty 201/204): the write landed, so it must
+                    # not look like an outage and be replayed; a GET without data is still a miss
+                    logger.warning(f"CRM API {response.status_code} for {endpoint} with a non-JSON body")
+                    result = {'success': True} if method != 'GET' else None
+                breaker.record_success()
+                latency.record((time.perf_counter() - started) * 1000, ok=result is not None)
+                return result
+                
+            except requests.exceptions.Timeout:
+                logger.error(f"CRM API timeout for {endpoint}")
+                failed = True
+            except requests.exceptions.ConnectionError:
+                logger.error(f"CRM API connection error for {endpoint}")
+                failed = True
+            except requests.exceptions.HTTPError as e:
+                logger.error(f"CRM API HTTP error for {endpoint}: {e.response.status_code}")
+                # A 4xx means the CRM is up and answering; only server errors count against the breaker
+                status_code = e.response.status_code
+                failed = status_code >= 500
+                if raise_rejections and status_code < 500 and status_code not in self.TRANSIENT_CLIENT_ERRORS:
+                    rejection = RejectedWrite(status_code, self._error_detail(e.response))
+                break
+            except Exception as e:
+                logger.error(f"CRM API unexpected error for {endpoint}: {e}")
+                failed = False
+                break
+        
+        if failed:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        latency.record((time.perf_counter() - started) * 1000, ok=False)
+        if rejection is not None:
+            raise rejection
+        return None
+    
+    def stats(self):
+        """Breaker state and latency per endpoint for health reporting"""
+        with self._stats_lock:
+            keys = sorted(self.breakers)
+        return {
+            key: {"breaker": self.breakers[key].snapshot(), "latency": self.latency[key].snapshot()}
+            for key in keys
+        }
 
 # Global CRM client instance
 crm_client = CRMAPIClient()
 
+def deliver_crm_write(method, endpoint, data, idempotency_key):
+    """Outbox sender: replays carry the same key so the CRM can drop duplicates; a 4xx raises RejectedWrite"""
+    return crm_client._make_request(method, endpoint, data=data, headers={'Idempotency-Key': idempotency_key},
+                                    raise_rejections=True)
+
+# Every CRM write lands in the local outbox first, so a CRM outage delays leads instead of losing them
+crm_outbox = CRMOutbox(
+    os.getenv("CRM_OUTBOX_PATH", "/tmp/ringlypro_outbox.db"),
+    deliver_crm_write,
+    replay_interval=float(os.getenv("CRM_OUTBOX_REPLAY_SECONDS", "5")),
+    max_attempts=int(os.getenv("CRM_OUTBOX_MAX_ATTEMPTS", "50"))
+)
+
 def init_crm_connection():
     """Initialize CRM API connection and verify PostgreSQL connectivity"""
     try:
@@ -194,13 +429,9 @@ def log_call_to_crm(call_data: dict):
             'speechResult': call_data.get('SpeechResult')
         }
         
-        # Send to PostgreSQL via CRM webhook
-        result = crm_client._make_request('POST', '/calls/webhook', data=crm_call_data)
-        
-        if result:
-            logger.info("Call logged to PostgreSQL successfully")
-        else:
-            logger.warning("Call logging to PostgreSQL failed")
+        # Queue for PostgreSQL via CRM webhook; the outbox replayer delivers it
+        crm_outbox.submit('POST', '/calls/webhook', crm_call_data)
+        logger.info("Call queued for PostgreSQL")
             
     except Exception as e:
         logger.warning(f"PostgreSQL call logging error: {e}")
@@ -216,12 +447,8 @@ def log_inquiry_to_crm(phone: str, question: str, source: str = "phone"):
             'status': 'new'
         }
         
-        result = crm_client._make_request('POST', '/inquiries', data=inquiry_data)
-        
-        if result:
-            logger.info(f"Inquiry logged to PostgreSQL: {phone}")
-        else:
-            logger.warning(f"Inquiry logging to PostgreSQL failed: {phone}")
+        crm_outbox.submit('POST', '/inquiries', inquiry_data)
+        logger.info(f"Inquiry queued for PostgreSQL: {phone}")
             
     except Exception as e:
         logger.warning(f"PostgreSQL inquiry logging error: {e}")
@@ -239,14 +466,10 @@ def save_customer_inquiry_to_crm(phone: str, question: str, sms_sent: bool, sms_
             'smsSid': sms_sid
         }
         
-        result = crm_client._make_request('POST', '/inquiries', data=inquiry_data)
-        
-        if result:
-            logger.info(f"Customer inquiry saved to PostgreSQL: {phone}")
-            return True
-        else:
-            logger.warning(f"Failed to save inquiry to PostgreSQL: {phone}")
-            return False
+        # Durably queued counts as saved; the outbox replayer retries until the CRM accepts it
+        crm_outbox.submit('POST', '/inquiries', inquiry_data)
+        logger.info(f"Customer inquiry saved to PostgreSQL outbox: {phone}")
+        return True
             
     except Exception as e:
         logger.error(f"PostgreSQL save error: {e}")
@@ -266,6 +489,8 @@ class HubSpotService:
             "Authorization": f"Bearer {self.api_token}",
             "Content-Type": "application/json"
         }
+        # Keep-alive connections to HubSpot, reused across requests once this service is shared
+        self.session = instrument_session(requests.Session(), 'hubspot', metrics)
         
         if self.api_token:
             logger.info(f"HubSpot service initialized - Token: {self.api_token[:12]}...")
@@ -278,7 +503,7 @@ class HubSpotService:
             return {"success": False, "error": "HubSpot API token not configured"}
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/crm/v3/objects/contacts",
                 headers=self.headers,
                 params={"limit": 1},
@@ -323,7 +548,7 @@ class HubSpotService:
             
             contact_data = {"properties": properties}
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/crm/v3/objects/contacts",
                 headers=self.headers,
                 json=contact_data,
@@ -362,7 +587,7 @@ class HubSpotService:
                 "limit": 1
             }
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/crm/v3/objects/contacts/search",
                 headers=self.headers,
                 json=search_data,
@@ -393,7 +618,7 @@ class HubSpotService:
             updates = {k: v for k, v in updates.items() if v}
             update_data = {"properties": updates}
             
-            response = requests.patch(
+            response = self.session.patch(
                 f"{self.base_url}/crm/v3/objects/contacts/{contact_id}",
                 headers=self.headers,
                 json=update_data,
@@ -438,7 +663,7 @@ class HubSpotService:
                 }
             }
             
-            response = requests.post(
+            response = self.session.post(
                 "https://api.hubapi.com/engagements/v1/engagements",
                 headers=self.headers,
                 json=meeting_data,
@@ -467,11 +692,22 @@ class HubSpotService:
 
 # ==================== APPOINTMENT MANAGEMENT CLASS (POSTGRESQL VIA CRM API) ====================
 
+# Short-lived per-date availability shared by every AppointmentManager in this worker
+slot_cache = SlotCache(ttl_seconds=float(os.getenv("SLOT_CACHE_TTL_SECONDS", "30")))
+
+# Multi-day availability fans out one CRM call per day over this pool
+SLOT_PREFETCH_DAYS = int(os.getenv("SLOT_PREFETCH_DAYS", "14"))
+SLOT_PREFETCH_MAX_DAYS = 31
+slot_prefetch_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("SLOT_PREFETCH_PARALLELISM", "7")),
+    thread_name_prefix="slot-prefetch"
+)
+
 class AppointmentManager:
     """PostgreSQL-based appointment management via CRM API (NO MORE SQLITE)"""
     
-    def __init__(self):
-        self.hubspot_service = HubSpotService()
+    def __init__(self, hubspot_service: Optional[HubSpotService] = None):
+        self.hubspot_service = hubspot_service or HubSpotService()
         self.crm_client = crm_client
     
     @staticmethod
@@ -480,7 +716,24 @@ class AppointmentManager:
         return str(uuid.uuid4())[:8].upper()
     
     def get_available_slots(self, date_str: str, timezone_str: str = 'America/New_York') -> List[str]:
-        """Get available appointment slots from PostgreSQL via CRM API"""
+        """Get available appointment slots from PostgreSQL via CRM API, cached per date"""
+        try:
+            return slot_cache.get_or_load(date_str, self._fetch_available_slots)
+        except Exception as e:
+            logger.error(f"Error getting slots from PostgreSQL: {e}")
+            return self._get_fallback_slots(date_str)
+    
+    def get_available_slots_range(self, start_date: str, days: int = SLOT_PREFETCH_DAYS) -> Dict[str, List[str]]:
+        """Get slots for consecutive days at once, fetched concurrently and cached per date"""
+        start = datetime.strptime(start_date, '%Y-%m-%d').date()
+        dates = [(start + timedelta(days=offset)).strftime('%Y-%m-%d')
+                 for offset in range(max(1, min(days, SLOT_PREFETCH_MAX_DAYS)))]
+        
+        logger.info(f"Getting available slots for {len(dates)} days from {start_date}")
+        return dict(zip(dates, slot_prefetch_executor.map(self.get_available_slots, dates)))
+    
+    def _fetch_available_slots(self, date_str: str) -> Tuple[List[str], bool]:
+        """Fetch slots from the CRM; returns (slots, from_crm) so fallback slots are never cached"""
         try:
             logger.info(f"Getting available slots from PostgreSQL for {date_str}")
             
@@ -493,14 +746,14 @@ class AppointmentManager:
             if result and result.get('success'):
                 slots = result.get('slots', [])
                 logger.info(f"Got {len(slots)} available slots from PostgreSQL")
-                return slots
+                return slots, True
             else:
                 logger.warning("PostgreSQL API failed, falling back to default slots")
-                return self._get_fallback_slots(date_str)
+                return self._get_fallback_slots(date_str), False
                 
         except Exception as e:
             logger.error(f"Error getting slots from PostgreSQL: {e}")
-            return self._get_fallback_slots(date_str)
+            return self._get_fallback_slots(date_str), False
     
     def _get_fallback_slots(self, date_str: str) -> List[str]:
         """Fallback slot generation when PostgreSQL API is unavailable"""
@@ -573,31 +826,29 @@ class AppointmentManager:
                 'duration': 30
             }
             
-            # Send to PostgreSQL via CRM API
+            # Send to PostgreSQL via CRM API, through the outbox so an outage defers the write
+            # instead of losing the booking; the confirmation code doubles as the idempotency key
             logger.info("Sending appointment to PostgreSQL database...")
-            result = self.crm_client._make_request('POST', '/appointments', data=crm_appointment_data)
+            delivery = crm_outbox.submit('POST', '/appointments', crm_appointment_data,
+                                         idempotency_key=confirmation_code, attempt_inline=True)
+            result = delivery['result']
+            
+            if delivery['rejected'] is not None:
+                # The CRM refused the booking (validation, slot already taken); nothing to replay or confirm
+                logger.error(f"CRM rejected appointment {confirmation_code}: {delivery['rejected']}")
+                return False, f"Booking rejected: {delivery['rejected'].detail or delivery['rejected']}", {}
+            
+            if not delivery['delivered']:
+                # Timeouts, connection errors, 5xx and an open breaker: the outbox replays it. The CRM hasn't
+                # accepted the booking yet, so the slot stays listed and confirmations wait for the replay
+                logger.warning(f"CRM unavailable - appointment {confirmation_code} pending in outbox for replay")
+                appointment = self.appointment_from_payload(crm_appointment_data, status='pending')
+                return True, "Appointment request received - confirmation pending", appointment
             
             if result and result.get('success'):
                 logger.info("Appointment successfully created in PostgreSQL database")
-                crm_appointment = result.get('appointment', {})
-                
-                # Create response appointment object
-                appointment = {
-                    'id': crm_appointment.get('id'),
-                    'confirmation_code': confirmation_code,
-                    'customer_name': customer_data['name'],
-                    'customer_email': customer_data['email'],
-                    'customer_phone': formatted_phone,
-                    'date': customer_data['date'],
-                    'time': customer_data['time'],
-                    'purpose': customer_data.get('purpose', 'Phone consultation via Rachel AI'),
-                    'zoom_url': zoom_meeting_url,
-                    'zoom_id': zoom_meeting_id,
-                    'zoom_password': zoom_password
-                }
-                
-                # Send confirmations
-                confirmation_results = self.send_appointment_confirmations(appointment)
+                appointment = self.appointment_from_payload(crm_appointment_data, result.get('appointment') or {})
+                self.confirm_booking(appointment)
                 
                 logger.info(f"Appointment booked: {confirmation_code}")
                 
@@ -613,6 +864,55 @@ class AppointmentManager:
             logger.error(traceback.format_exc())
             return False, f"Booking error: {str(e)}", {}
     
+    @staticmethod
+    def appointment_from_payload(payload: dict, crm_appointment: Optional[dict] = None,
+                                 status: str = 'confirmed') -> dict:
+        """Response/confirmation appointment object for a CRM /appointments payload"""
+        return {
+            'id': (crm_appointment or {}).get('id'),
+            'confirmation_code': payload['confirmationCode'],
+            'customer_name': payload['customerName'],
+            'customer_email': payload['customerEmail'],
+            'customer_phone': payload['customerPhone'],
+            'date': payload['appointmentDate'],
+            'time': payload['appointmentTime'],
+            'purpose': payload['purpose'],
+            'zoom_url': zoom_meeting_url,
+            'zoom_id': zoom_meeting_id,
+            'zoom_password': zoom_password,
+            'status': status,
+            'crm_synced': status == 'confirmed'
+        }
+    
+    @classmethod
+    def confirm_booking(cls, appointment: dict):
+        """The CRM accepted the booking: drop the slot from the picker and send confirmations"""
+        # The booked slot is gone; the next picker load must not see it
+        slot_cache.invalidate(appointment['date'])
+        
+        # Email and SMS go out from the notification workers so the response doesn't wait on SMTP/Twilio
+        cls.queue_appointment_confirmations(appointment)
+    
+    @classmethod
+    def on_booking_replayed(cls, method: str, endpoint: str, payload: dict, result):
+        """Outbox callback: a pending booking reached the CRM"""
+        if method != 'POST' or endpoint != '/appointments':
+            return
+        if not isinstance(result, dict) or not result.get('success'):
+            logger.error(f"CRM did not confirm pending appointment {payload.get('confirmationCode')}: {result}")
+            return
+        logger.info(f"Pending appointment {payload['confirmationCode']} confirmed by the CRM")
+        cls.confirm_booking(cls.appointment_from_payload(payload, result.get('appointment') or {}))
+    
+    @staticmethod
+    def on_booking_dead(method: str, endpoint: str, payload: dict, error: str):
+        """Outbox callback: a pending booking will never reach the CRM; no confirmation was sent for it"""
+        if method != 'POST' or endpoint != '/appointments':
+            return
+        logger.error(f"Pending appointment {payload.get('confirmationCode')} for {payload.get('customerEmail')} "
+                     f"on {payload.get('appointmentDate')} {payload.get('appointmentTime')} was not accepted "
+                     f"by the CRM ({error}); follow up with the customer")
+    
     def get_appointment_by_code(self, confirmation_code: str) -> Optional[dict]:
         """Get appointment by confirmation code from PostgreSQL API"""
         try:
@@ -633,21 +933,23 @@ class AppointmentManager:
             return None
     
     @staticmethod
-    def send_appointment_confirmations(appointment: dict) -> dict:
-        """Send email and SMS confirmations"""
-        results = {'email': 'Failed', 'sms': 'Failed'}
+    def queue_appointment_confirmations(appointment: dict) -> List[str]:
+        """Queue email and SMS confirmations for the configured channels; returns the queued channels"""
+        channels = []
+        if email_user and email_password:
+            channels.append('email')
+        if twilio_account_sid and twilio_auth_token and twilio_phone:
+            channels.append('sms')
+        
+        if not channels:
+            logger.warning("No confirmation channels configured - skipping confirmations")
+            return []
         
         try:
-            email_result = AppointmentManager.send_email_confirmation(appointment)
-            results['email'] = 'Sent' if email_result else 'Failed'
-            
-            sms_result = AppointmentManager.send_sms_confirmation(appointment)
-            results['sms'] = 'Sent' if sms_result else 'Failed'
-            
+            return notification_queue.enqueue(appointment['confirmation_code'], appointment, channels)
         except Exception as e:
-            logger.error(f"Error in send_appointment_confirmations: {e}")
-        
-        return results
+            logger.error(f"Error queueing confirmations for {appointment['confirmation_code']}: {e}")
+            return []
     
     @staticmethod
     def send_email_confirmation(appointment: dict) -> bool:
@@ -705,11 +1007,8 @@ Website: https://ringlypro.com
             msg['Subject'] = subject
             msg.attach(MIMEText(body, 'plain'))
             
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            server.starttls()
-            server.login(email_user, email_password)
-            server.send_message(msg)
-            server.quit()
+            with metrics.track('smtp'):
+                smtp_pool.send_message(msg)
             
             logger.info(f"Email confirmation sent to {appointment['customer_email']}")
             return True
@@ -728,8 +1027,6 @@ Website: https://ringlypro.com
             
             logger.info(f"Attempting to send SMS to: {appointment['customer_phone']}")
             
-            client = Client(twilio_account_sid, twilio_auth_token)
-            
             date_obj = datetime.strptime(appointment['date'], '%Y-%m-%d')
             formatted_date = date_obj.strftime('%m/%d/%Y')
             
@@ -749,19 +1046,124 @@ Password: {appointment['zoom_password']}
 Need help? Reply to this message or call (888) 610-3810.
             """.strip()
             
-            message = client.messages.create(
-                body=message_body,
-                from_=twilio_phone,
-                to=appointment['customer_phone']
-            )
+            # Runs on a notification worker, so waiting here keeps the job's retry semantics
+            sid = sms_dispatcher.submit(appointment['customer_phone'], message_body, twilio_phone).result(
+                timeout=SMS_SEND_TIMEOUT)
             
-            logger.info(f"SMS confirmation sent. SID: {message.sid}")
+            logger.info(f"SMS confirmation sent. SID: {sid}")
             return True
             
         except Exception as e:
             logger.error(f"SMS sending failed: {e}")
             return False
 
+# Booking confirmations persist in SQLite and are sent by worker threads with retries
+notification_queue = NotificationQueue(
+    os.getenv("NOTIFICATION_QUEUE_PATH", "/tmp/ringlypro_notifications.db"),
+    {
+        'email': AppointmentManager.send_email_confirmation,
+        'sms': AppointmentManager.send_sms_confirmation
+    },
+    workers=int(os.getenv("NOTIFICATION_WORKERS", "2")),
+    max_attempts=int(os.getenv("NOTIFICATION_MAX_ATTEMPTS", "5")),
+    retry_base=float(os.getenv("NOTIFICATION_RETRY_SECONDS", "30"))
+)
+
+# Bookings queued during a CRM outage are confirmed (or written off) once the outbox settles them
+crm_outbox.on_delivered = AppointmentManager.on_booking_replayed
+crm_outbox.on_dead = AppointmentManager.on_booking_dead
+
+# ==================== INTENT ROUTING ====================
+
+# Keyword rules per entry point, compiled once; lower priority wins when several intents match
+PHONE_MENU_ROUTER = IntentRouter([
+    ('demo_booking', 1, ['demo', 'consultation', 'appointment', 'meeting', 'schedule']),
+    ('pricing', 2, ['price', 'pricing', 'cost', 'plan', 'package']),
+    ('subscription', 3, ['subscribe', 'subscription', 'sign up', 'signup', 'get started', 'start service',
+                         'want to subscribe', 'i want to subscribe']),
+    ('support', 4, ['support', 'help', 'customer service', 'agent', 'representative'])
+])
+
+PRICING_FOLLOWUP_ROUTER = IntentRouter([
+    ('demo_booking', 1, ['yes', 'book', 'demo', 'consultation', 'schedule']),
+    ('pricing', 2, ['repeat', 'again', 'pricing', 'prices'])
+])
+
+CHAT_ROUTER = IntentRouter([
+    ('start_booking', 1, ['schedule', 'book', 'appointment', 'meeting', 'consultation',
+                          'available', 'calendar', 'time', 'when can', 'set up', 'book an']),
+    ('manage_appointment', 2, ['reschedule', 'change', 'move', 'cancel', 'confirmation code'])
+])
+
+VOICE_ROUTER = IntentRouter([
+    ('subscription', 1, ['subscribe', 'subscription', 'sign up', 'signup', 'get started',
+                         'join', 'register', 'start service', 'want to subscribe',
+                         'i want to subscribe', 'interested in subscribing', 'how to subscribe',
+                         'ready to subscribe', 'start my subscription', 'become a member']),
+    ('booking', 2, ['book', 'schedule', 'appointment', 'meeting', 'consultation',
+                    'available', 'calendar', 'time', 'when can', 'set up',
+                    'book an', 'make an appointment', 'schedule a meeting'])
+])
+
+# ==================== FIXED IVR PROMPTS ====================
+
+# Prompts that never change during a call; pre-rendered at startup by initialize_application
+IVR_PROMPTS = {
+    'greeting': f"""
+        Thank you for calling {CLIENT_NAME}, your A.I. powered business assistant. 
+        I'm Rachel, your virtual receptionist. 
+        To better serve you, please tell me what you'd like to do. 
+        Say book a demo to schedule a consultation, 
+        pricing to hear about our plans, 
+        subscribe to get started with our service, 
+        or support for customer service.
+        """,
+    'demo_booking': """
+        Excellent! I'd be happy to schedule a free consultation for you. 
+        Our team will show you how Ringly Pro can transform your business communications. 
+        I'll need to collect a few details. 
+        First, please say your full name.
+        """,
+    'pricing': """
+        I'd be happy to share our pricing plans with you. 
+        
+        We offer three tiers:
+        
+        The Starter Plan at 97 dollars per month includes 1000 minutes, 
+        text messaging, and appointment scheduling.
+        
+        The Pro Plan at 297 dollars per month includes 3000 minutes, 
+        C.R.M. integrations, and mobile app access.
+        
+        The Premium Plan at 497 dollars per month includes 7500 minutes, 
+        dedicated account management, and marketing automation.
+        
+        Would you like to schedule a consultation to discuss which plan is right for you? 
+        Say yes to book a demo, or repeat to hear the prices again.
+        """,
+    'subscription': """
+            Wonderful! I'm excited to help you get started with Ringly Pro. 
+            I'm sending you our subscription link via text message right now.
+            I'll also connect you with our onboarding specialist 
+            who will walk you through the setup process. 
+            
+            Please hold while I transfer you.
+            """,
+    'support_transfer': "I'll connect you with our customer support team right away. Please hold.",
+    'faq_transfer': "I'd be happy to help with that. Let me connect you with someone who can provide more specific information.",
+    'anything_else': "Is there anything else I can help you with today?"
+}
+
+# Audio URLs produced by the startup warm-up, keyed by prompt name
+prerendered_prompt_urls = {}
+prompt_warmup_ready = threading.Event()
+prompt_warmup_status = {
+    "state": "pending",
+    "rendered": 0,
+    "total": len(IVR_PROMPTS),
+    "duration_seconds": None
+}
+
 # ==================== TELEPHONY CALL HANDLER ====================
 
 class PhoneCallHandler:
@@ -769,69 +1171,134 @@ class PhoneCallHandler:
     
     def __init__(self):
         self.elevenlabs_api_key = elevenlabs_api_key
-        self.rachel_voice_id = "21m00Tcm4TlvDq8ikWAM"
+        self.rachel_voice_id = RACHEL_VOICE_ID
+        self.model_id = DEFAULT_MODEL_ID
+        self.voice_settings = DEFAULT_VOICE_SETTINGS
         self.webhook_base_url = os.getenv("WEBHOOK_BASE_URL", "https://voice-bot-r91r.onrender.com")
     
-    def generate_rachel_audio(self, text: str) -> Optional[str]:
-        """Generate audio URL using Rachel's voice via ElevenLabs"""
+    @staticmethod
+    def prepare_speech_text(text: str) -> str:
+        """Apply Rachel's pronunciation fixes and normalize whitespace"""
+        speech_text = text.replace("RinglyPro", "Ringly Pro")
+        speech_text = speech_text.replace("AI", "A.I.")
+        speech_text = speech_text.replace("$", " dollars")
+        return normalize_tts_text(speech_text)
+    
+    @staticmethod
+    def sign_stream_key(cache_key: str) -> str:
+        """Sign a clip key so /audio/stream only synthesizes text we issued"""
+        if not AUDIO_STREAM_SECRET:
+            raise RuntimeError("AUDIO_STREAM_SECRET is not configured")
+        return hmac.new(AUDIO_STREAM_SECRET.encode('utf-8'), cache_key.encode('utf-8'), hashlib.sha256).hexdigest()[:32]
+    
+    def render_rachel_clip(self, text: str, stream: Optional[bool] = None, pinned: bool = False) -> Optional[str]:
+        """Make Rachel's audio for text available and return its site-relative /audio path"""
         if not self.elevenlabs_api_key:
             return None
+        
+        if stream is None:
+            stream = TTS_STREAMING_ENABLED
+        # Without a signing key there is no stream URL to hand out; synthesize up front instead
+        stream = stream and bool(AUDIO_STREAM_SECRET)
             
         try:
-            url = f"https://api.elevenlabs.io/v1/text-to-speech/{self.rachel_voice_id}"
-            
-            headers = {
-                "Accept": "audio/mpeg",
-                "Content-Type": "application/json",
-                "xi-api-key": self.elevenlabs_api_key
-            }
-            
-            speech_text = text.replace("RinglyPro", "Ringly Pro")
-            speech_text = speech_text.replace("AI", "A.I.")
-            speech_text = speech_text.replace("$", " dollars")
-            
-            tts_data = {
-                "text": speech_text,
-                "model_id": "eleven_monolingual_v1",
-                "voice_settings": {
-                    "stability": 0.5,
-                    "similarity_boost": 0.75
-                }
-            }
-            
-            response = requests.post(url, json=tts_data, headers=headers, timeout=10)
+            speech_text = self.prepare_speech_text(text)
+            
+            # Content-addressed filename so repeated prompts reuse the same clip
+            cache_key = TTSAudioCache.make_key(self.rachel_voice_id, self.model_id, self.voice_settings, speech_text)
+            audio_filename = f"rachel_{cache_key}.mp3"
+            audio_path = f"/audio/{audio_filename}"
+            
+            # Clips rendered earlier by this or another worker are reused
+            if audio_store.exists(cache_key):
+                if pinned:
+                    audio_store.pin(cache_key)
+                logger.info(f"Rachel audio cache hit: {audio_path}")
+                return audio_path
+            
+            # Streaming mode: hand out a URL that synthesizes while it plays
+            if stream:
+                query = urlencode({'text': speech_text, 'sig': self.sign_stream_key(cache_key)})
+                logger.info(f"Rachel audio streaming: {audio_filename}")
+                return f"/audio/stream/{audio_filename}?{query}"
+            
+            tts_result = tts_client.synthesize(
+                speech_text,
+                voice_id=self.rachel_voice_id,
+                model_id=self.model_id,
+                voice_settings=self.voice_settings
+            )
             
-            if response.status_code == 200:
-                audio_filename = f"rachel_{uuid.uuid4()}.mp3"
-                audio_path = f"/tmp/{audio_filename}"
+            if tts_result["success"]:
+                audio_store.put(cache_key, tts_result["audio"], pinned=pinned)
                 
-                with open(audio_path, 'wb') as f:
-                    f.write(response.content)
-                
-                audio_url = f"{self.webhook_base_url}/audio/{audio_filename}"
-                logger.info(f"Rachel audio generated: {audio_url}")
-                return audio_url
+                logger.info(f"Rachel audio generated in {tts_result['elapsed_ms']} ms: {audio_path}")
+                return audio_path
             else:
-                logger.warning(f"ElevenLabs TTS failed: {response.status_code}")
+                logger.warning(f"ElevenLabs TTS failed: {tts_result['error']}")
                 return None
                 
         except Exception as e:
             logger.error(f"Error generating Rachel audio: {e}")
             return None
+    
+    def generate_rachel_audio(self, text: str, stream: Optional[bool] = None, pinned: bool = False) -> Optional[str]:
+        """Generate audio URL using Rachel's voice via ElevenLabs"""
+        audio_path = self.render_rachel_clip(text, stream=stream, pinned=pinned)
+        if not audio_path:
+            return None
+        return f"{self.webhook_base_url}{audio_path}"
+    
+    def generate_rachel_audio_many(self, texts: List[str]) -> List[Optional[str]]:
+        """Synthesize all utterances of one response concurrently, returning URLs in input order"""
+        if len(texts) <= 1:
+            return [self.generate_rachel_audio(text) for text in texts]
+        
+        futures = [tts_executor.submit(self.generate_rachel_audio, text) for text in texts]
+        return [future.result() for future in futures]
+    
+    def stream_rachel_audio(self, speech_text: str, cache_key: str):
+        """Open an ElevenLabs streaming synthesis and yield MP3 chunks as they arrive"""
+        stream_result = tts_client.stream(
+            speech_text,
+            voice_id=self.rachel_voice_id,
+            model_id=self.model_id,
+            voice_settings=self.voice_settings
+        )
+        
+        if not stream_result["success"]:
+            logger.warning(f"ElevenLabs streaming TTS failed: {stream_result['error']}")
+            return None
+        
+        def generate():
+            chunks = []
+            for chunk in stream_result["chunks"]:
+                chunks.append(chunk)
+                yield chunk
+            
+            # Keep the finished clip so the next request for this text is a cache hit, unless it is too
+            # short to be speech (an error body or a dropped stream)
+            audio = b''.join(chunks)
+            if len(audio) > MIN_AUDIO_BYTES:
+                audio_store.put(cache_key, audio)
+                logger.info(f"Rachel audio streamed: {len(audio)} bytes in {len(chunks)} chunks")
+            else:
+                logger.warning(f"Rachel audio stream ended after {len(audio)} bytes - not cached")
+        
+        return generate()
+
+    def get_prompt_audio(self, prompt_name: str) -> Optional[str]:
+        """Return the pre-rendered clip for a fixed prompt, synthesizing on demand if warm-up hasn't finished"""
+        audio_url = prerendered_prompt_urls.get(prompt_name)
+        if audio_url:
+            return audio_url
+        return self.generate_rachel_audio(IVR_PROMPTS[prompt_name])
 
     def create_greeting_response(self) -> VoiceResponse:
         """Create the initial greeting when someone calls"""
         response = VoiceResponse()
         
-        greeting_text = f"""
-        Thank you for calling {CLIENT_NAME}, your A.I. powered business assistant. 
-        I'm Rachel, your virtual receptionist. 
-        To better serve you, please tell me what you'd like to do. 
-        Say book a demo to schedule a consultation, 
-        pricing to hear about our plans, 
-        subscribe to get started with our service, 
-        or support for customer service.
-        """
+        greeting_text = IVR_PROMPTS['greeting']
         
         gather = Gather(
             input='speech',
@@ -842,7 +1309,7 @@ class PhoneCallHandler:
             language='en-US'
         )
         
-        audio_url = self.generate_rachel_audio(greeting_text)
+        audio_url = self.get_prompt_audio('greeting')
         
         if audio_url:
             gather.play(audio_url)
@@ -863,13 +1330,15 @@ class PhoneCallHandler:
         
         logger.info(f"Phone speech input: {speech_result}")
         
-        if any(word in speech_lower for word in ['demo', 'consultation', 'appointment', 'meeting', 'schedule']):
+        intent = PHONE_MENU_ROUTER.intent(speech_lower)
+        
+        if intent == 'demo_booking':
             return self.handle_demo_booking()
-        elif any(word in speech_lower for word in ['price', 'pricing', 'cost', 'plan', 'package']):
+        elif intent == 'pricing':
             return self.handle_pricing_inquiry()
-        elif any(word in speech_lower for word in ['subscribe', 'subscription', 'sign up', 'signup', 'get started', 'start service', 'want to subscribe', 'i want to subscribe']):
+        elif intent == 'subscription':
             return self.handle_subscription()
-        elif any(word in speech_lower for word in ['support', 'help', 'customer service', 'agent', 'representative']):
+        elif intent == 'support':
             return self.handle_support_transfer()
         else:
             faq_response, is_faq = get_faq_response(speech_result)
@@ -878,7 +1347,8 @@ class PhoneCallHandler:
                 if len(faq_response) > 300:
                     faq_response = faq_response[:297] + "..."
                 
-                audio_url = self.generate_rachel_audio(faq_response)
+                followup_text = IVR_PROMPTS['anything_else']
+                audio_url, followup_audio = self.generate_rachel_audio_many([faq_response, followup_text])
                 
                 if audio_url:
                     response.play(audio_url)
@@ -895,9 +1365,6 @@ class PhoneCallHandler:
                     speechTimeout='auto'
                 )
                 
-                followup_text = "Is there anything else I can help you with today?"
-                followup_audio = self.generate_rachel_audio(followup_text)
-                
                 if followup_audio:
                     followup.play(followup_audio)
                 else:
@@ -905,9 +1372,9 @@ class PhoneCallHandler:
                 
                 response.append(followup)
             else:
-                transfer_text = "I'd be happy to help with that. Let me connect you with someone who can provide more specific information."
+                transfer_text = IVR_PROMPTS['faq_transfer']
                 
-                audio_url = self.generate_rachel_audio(transfer_text)
+                audio_url = self.get_prompt_audio('faq_transfer')
                 
                 if audio_url:
                     response.play(audio_url)
@@ -924,12 +1391,7 @@ class PhoneCallHandler:
         """Handle demo booking request"""
         response = VoiceResponse()
         
-        booking_text = """
-        Excellent! I'd be happy to schedule a free consultation for you. 
-        Our team will show you how Ringly Pro can transform your business communications. 
-        I'll need to collect a few details. 
-        First, please say your full name.
-        """
+        booking_text = IVR_PROMPTS['demo_booking']
         
         gather = Gather(
             input='speech',
@@ -939,7 +1401,7 @@ class PhoneCallHandler:
             speechTimeout='auto'
         )
         
-        audio_url = self.generate_rachel_audio(booking_text)
+        audio_url = self.get_prompt_audio('demo_booking')
         
         if audio_url:
             gather.play(audio_url)
@@ -956,23 +1418,7 @@ class PhoneCallHandler:
         """Provide pricing information"""
         response = VoiceResponse()
         
-        pricing_text = """
-        I'd be happy to share our pricing plans with you. 
-        
-        We offer three tiers:
-        
-        The Starter Plan at 97 dollars per month includes 1000 minutes, 
-        text messaging, and appointment scheduling.
-        
-        The Pro Plan at 297 dollars per month includes 3000 minutes, 
-        C.R.M. integrations, and mobile app access.
-        
-        The Premium Plan at 497 dollars per month includes 7500 minutes, 
-        dedicated account management, and marketing automation.
-        
-        Would you like to schedule a consultation to discuss which plan is right for you? 
-        Say yes to book a demo, or repeat to hear the prices again.
-        """
+        pricing_text = IVR_PROMPTS['pricing']
         
         gather = Gather(
             input='speech',
@@ -982,7 +1428,7 @@ class PhoneCallHandler:
             speechTimeout='auto'
         )
         
-        audio_url = self.generate_rachel_audio(pricing_text)
+        audio_url = self.get_prompt_audio('pricing')
         
         if audio_url:
             gather.play(audio_url)
@@ -1003,16 +1449,9 @@ class PhoneCallHandler:
             caller_phone = request.form.get('From', '')
             logger.info(f"Subscription request from: {caller_phone}")
             
-            subscribe_text = """
-            Wonderful! I'm excited to help you get started with Ringly Pro. 
-            I'm sending you our subscription link via text message right now.
-            I'll also connect you with our onboarding specialist 
-            who will walk you through the setup process. 
+            subscribe_text = IVR_PROMPTS['subscription']
             
-            Please hold while I transfer you.
-            """
-            
-            audio_url = self.generate_rachel_audio(subscribe_text)
+            audio_url = self.get_prompt_audio('subscription')
             
             if audio_url:
                 response.play(audio_url)
@@ -1046,9 +1485,9 @@ class PhoneCallHandler:
         """Transfer to customer support"""
         response = VoiceResponse()
         
-        transfer_text = "I'll connect you with our customer support team right away. Please hold."
+        transfer_text = IVR_PROMPTS['support_transfer']
         
-        audio_url = self.generate_rachel_audio(transfer_text)
+        audio_url = self.get_prompt_audio('support_transfer')
         
         if audio_url:
             response.play(audio_url)
@@ -1113,7 +1552,9 @@ class PhoneCallHandler:
                 text1 = f"Perfect! I have your phone number as {value}. I'll send you a text message with a link to schedule your consultation online at your convenience."
                 self.send_booking_sms(value)
             
-            audio_url = self.generate_rachel_audio(text1)
+            text2 = IVR_PROMPTS['anything_else']
+            
+            audio_url, audio_url2 = self.generate_rachel_audio_many([text1, text2])
             
             if audio_url:
                 response.play(audio_url)
@@ -1122,10 +1563,6 @@ class PhoneCallHandler:
             
             response.pause(length=1)
             
-            text2 = "Is there anything else I can help you with today?"
-            
-            audio_url2 = self.generate_rachel_audio(text2)
-            
             if audio_url2:
                 response.play(audio_url2)
             else:
@@ -1148,8 +1585,6 @@ class PhoneCallHandler:
                 logger.warning("Twilio not configured for SMS")
                 return
             
-            client = Client(twilio_account_sid, twilio_auth_token)
-            
             message_body = f"""
 Thank you for calling RinglyPro!
 
@@ -1163,13 +1598,9 @@ Questions? Call us back at 888-610-3810
 - The RinglyPro Team
             """.strip()
             
-            message = client.messages.create(
-                body=message_body,
-                from_=twilio_phone,
-                to=phone_number
-            )
+            sms_dispatcher.submit(phone_number, message_body, twilio_phone)
             
-            logger.info(f"Booking SMS sent to {phone_number}: {message.sid}")
+            logger.info(f"Booking SMS queued for {phone_number}")
             
         except Exception as e:
             logger.error(f"Failed to send booking SMS: {e}")
@@ -1181,8 +1612,6 @@ Questions? Call us back at 888-610-3810
                 logger.warning("Twilio not configured for subscription SMS")
                 return
             
-            client = Client(twilio_account_sid, twilio_auth_token)
-            
             message_body = f"""
 Thanks for wanting to subscribe to RinglyPro!
 
@@ -1196,13 +1625,9 @@ Questions? Call us back at 888-610-3810
 - The RinglyPro Team
             """.strip()
             
-            message = client.messages.create(
-                body=message_body,
-                from_=twilio_phone,
-                to=phone_number
-            )
+            sms_dispatcher.submit(phone_number, message_body, twilio_phone)
             
-            logger.info(f"Subscription SMS sent to {phone_number}: {message.sid}")
+            logger.info(f"Subscription SMS queued for {phone_number}")
             
         except Exception as e:
             logger.error(f"Failed to send subscription SMS: {e}")
@@ -1227,11 +1652,12 @@ Questions? Call us back at 888-610-3810
                 'purpose': f'Phone booking - Call {call_sid[:8]} - NEEDS EMAIL VERIFICATION'
             }
             
-            appointment_manager = AppointmentManager()
+            appointment_manager = services.appointments
             success, message, appointment = appointment_manager.book_appointment(appointment_data)
             
             if success:
-                logger.info(f"Phone appointment created via PostgreSQL: {appointment.get('confirmation_code')}")
+                logger.info(f"Phone appointment created via PostgreSQL: {appointment.get('confirmation_code')} "
+                            f"({appointment.get('status')})")
                 return True, appointment.get('confirmation_code', 'PENDING')
             else:
                 logger.warning(f"Failed to create appointment via PostgreSQL: {message}")
@@ -1241,8 +1667,58 @@ Questions? Call us back at 888-610-3810
             logger.error(f"Failed to create phone appointment via PostgreSQL: {e}")
             return False, None
 
+def post_call_event(crm_payload):
+    """POST one call event to the CRM webhook; runs on the call-event worker thread"""
+    try:
+        response = crm_client.session.post(CRM_WEBHOOK_URL, json=crm_payload, timeout=5)
+        
+        if response.status_code in [200, 201, 204]:
+            logger.info(f"PostgreSQL webhook successful: {response.status_code}")
+            return True
+        else:
+            logger.warning(f"PostgreSQL webhook failed: {response.status_code}")
+            return False
+            
+    except Exception as e:
+        logger.warning(f"PostgreSQL webhook error: {str(e)} - continuing without PostgreSQL logging")
+        return False
+
+def post_call_events_batch(crm_payloads):
+    """POST several call events in one request; None means the CRM has no batch endpoint,
+    BATCH_REJECTED that it refused this batch and the events should go out one by one"""
+    try:
+        response = crm_client.session.post(CRM_WEBHOOK_BATCH_URL, json={'events': crm_payloads}, timeout=5)
+        
+        if response.status_code in [200, 201, 202, 204]:
+            logger.info(f"PostgreSQL batch webhook successful: {len(crm_payloads)} events")
+            return True
+        elif response.status_code in [404, 405, 501]:
+            return None
+        elif response.status_code in [400, 413, 422]:
+            logger.warning(f"PostgreSQL batch webhook rejected {len(crm_payloads)} events: "
+                           f"{response.status_code} {response.text[:200]} - resending them individually")
+            return BATCH_REJECTED
+        else:
+            logger.warning(f"PostgreSQL batch webhook failed: {response.status_code}")
+            return False
+            
+    except Exception as e:
+        logger.warning(f"PostgreSQL batch webhook error: {str(e)} - continuing without PostgreSQL logging")
+        return False
+
+# Call events are delivered in the background so TwiML never waits on the CRM; with a batch
+# endpoint configured, events arriving within the batch window share one request
+CALL_EVENT_BATCHING = bool(CRM_WEBHOOK_BATCH_URL) and os.getenv("CALL_EVENT_BATCHING", "true").lower() == "true"
+call_event_queue = CallEventQueue(
+    post_call_event,
+    maxsize=int(os.getenv("CALL_EVENT_QUEUE_SIZE", "1000")),
+    batch_sender=post_call_events_batch if CALL_EVENT_BATCHING else None,
+    batch_size=int(os.getenv("CALL_EVENT_BATCH_SIZE", "20")),
+    batch_window=int(os.getenv("CALL_EVENT_BATCH_WINDOW_MS", "250")) / 1000
+)
+
 def send_call_data_to_crm(call_data):
-    """Send call data to PostgreSQL via CRM webhook"""
+    """Queue call data for PostgreSQL via CRM webhook"""
     try:
         logger.info(f"Sending call data to PostgreSQL: {call_data.get('CallSid', 'Unknown')}")
         
@@ -1261,25 +1737,61 @@ def send_call_data_to_crm(call_data):
         
         crm_payload = {k: v for k, v in crm_payload.items() if v is not None}
         
-        response = requests.post(
-            CRM_WEBHOOK_URL,
-            headers={'Content-Type': 'application/json'},
-            json=crm_payload,
-            timeout=5
-        )
-        
-        if response.status_code in [200, 201, 204]:
-            logger.info(f"PostgreSQL webhook successful: {response.status_code}")
-        else:
-            logger.warning(f"PostgreSQL webhook failed: {response.status_code}")
+        call_event_queue.submit(crm_payload)
             
     except Exception as e:
         logger.warning(f"PostgreSQL webhook error: {str(e)} - continuing without PostgreSQL logging")
 
+# ==================== SERVICE CONTAINER ====================
+
+class ServiceContainer:
+    """Per-worker singletons shared by every request, each built on first use (i.e. after a fork)"""
+    
+    def __init__(self):
+        self._instances = {}
+        self._lock = threading.RLock()
+        self.build_ms = {}
+    
+    def _get(self, name: str, factory):
+        instance = self._instances.get(name)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(name)
+                if instance is None:
+                    started = time.perf_counter()
+                    instance = factory()
+                    self.build_ms[name] = round((time.perf_counter() - started) * 1000, 3)
+                    self._instances[name] = instance
+        return instance
+    
+    @property
+    def hubspot(self) -> HubSpotService:
+        return self._get('hubspot', HubSpotService)
+    
+    @property
+    def appointments(self) -> AppointmentManager:
+        return self._get('appointments', lambda: AppointmentManager(self.hubspot))
+    
+    @property
+    def phone(self) -> PhoneCallHandler:
+        return self._get('phone', PhoneCallHandler)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Which services this worker has built and what each cost once"""
+        with self._lock:
+            return {"built": sorted(self._instances), "build_ms": dict(self.build_ms)}
+
+# Pooled clients (crm_client, tts_client, smtp_pool, the Twilio client) and shared caches stay
+# module-level; the container owns the request-facing services that wrap them
+services = ServiceContainer()
+
 # ==================== SMS/PHONE HELPER FUNCTIONS ====================
 
 def validate_phone_number(phone_str: str) -> Optional[str]:
     """Validate and format phone number"""
+    import phonenumbers
+    from phonenumbers import NumberParseException
+    
     try:
         number = phonenumbers.parse(phone_str, "US")
         
@@ -1290,15 +1802,14 @@ def validate_phone_number(phone_str: str) -> Optional[str]:
     except NumberParseException:
         return None
 
-def send_sms_notification(customer_phone: str, customer_question: str, source: str = "chat") -> Tuple[bool, str]:
-    """Send SMS notification to customer service"""
+def send_sms_notification(customer_phone: str, customer_question: str,
+                          source: str = "chat") -> Tuple[bool, Optional[Future]]:
+    """Queue an SMS notification to customer service; the Future resolves to the Twilio SID once it is sent"""
     try:
         if not all([twilio_account_sid, twilio_auth_token, twilio_phone]):
             logger.warning("Twilio credentials not configured - SMS notification skipped")
-            return False, "SMS credentials not configured"
+            return False, None
             
-        client = Client(twilio_account_sid, twilio_auth_token)
-        
         message_body = f"""
 New RinglyPro Customer Inquiry
 
@@ -1310,18 +1821,26 @@ Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 Please follow up with this customer.
         """.strip()
         
-        message = client.messages.create(
-            body=message_body,
-            from_=twilio_phone,
-            to='+16566001400'
-        )
+        sms_sid = sms_dispatcher.submit('+16566001400', message_body, twilio_phone)
         
-        logger.info(f"SMS sent successfully. SID: {message.sid}")
-        return True, message.sid
+        logger.info("SMS notification queued for customer service")
+        return True, sms_sid
         
     except Exception as e:
         logger.error(f"SMS sending failed: {str(e)}")
-        return False, str(e)
+        return False, None
+
+def save_customer_inquiry_after_sms(phone: str, question: str, sms_sid: Future, source: str = "chat"):
+    """Save the inquiry once its SMS notification settles, so the CRM gets Twilio's SID or smsSent=False"""
+    def save(future: Future):
+        error = future.exception()
+        if error is None:
+            save_customer_inquiry(phone, question, True, future.result(), source)
+        else:
+            save_customer_inquiry(phone, question, False, "", source)
+    
+    # Runs on the dispatcher thread that sent the SMS (or right away if it already settled)
+    sms_sid.add_done_callback(save)
 
 def save_customer_inquiry(phone: str, question: str, sms_sent: bool, sms_sid: str = "", source: str = "chat") -> bool:
     """Save customer inquiry to PostgreSQL via CRM API"""
@@ -1582,11 +2101,31 @@ FAQ_BRAIN = {
     "what about technical support calls?": "We handle tier-1 support, answer FAQs, create tickets, and escalate complex technical issues to your team with detailed context."
 }
 
+# Inverted BM25 index over FAQ questions, built once at import
+faq_index = FAQIndex(FAQ_BRAIN)
+FAQ_MATCH_CONFIDENCE = 0.6
+
+# Website passages crawled in the background and searched locally on an FAQ miss
+site_index = SiteKnowledgeIndex(
+    start_url=os.getenv("SITE_INDEX_URL", "https://RinglyPro.com"),
+    cache_path=os.getenv("SITE_INDEX_PATH", "/tmp/ringlypro_site_index.json"),
+    refresh_seconds=int(os.getenv("SITE_INDEX_REFRESH_SECONDS", "21600")),
+    max_pages=int(os.getenv("SITE_INDEX_MAX_PAGES", "20"))
+)
+
+def website_snippet(passage: str, max_chars: int = 300) -> str:
+    """Trim a website passage to whole sentences that fit in a spoken answer"""
+    if len(passage) <= max_chars:
+        return passage
+    cut = passage[:max_chars]
+    end = max(cut.rfind(". "), cut.rfind("! "), cut.rfind("? "))
+    return cut[:end + 1] if end > 0 else cut.rsplit(" ", 1)[0] + "..."
+
 # ==================== FAQ PROCESSING FUNCTIONS ====================
 
 def get_faq_response(user_text: str) -> Tuple[str, bool]:
     """
-    Check for FAQ matches with fuzzy matching and web scraping
+    Check for FAQ matches with indexed matching and the website index
     Returns: (response_text, is_faq_match)
     """
     user_text_lower = user_text.lower().strip()
@@ -1595,22 +2134,15 @@ def get_faq_response(user_text: str) -> Tuple[str, bool]:
     if user_text_lower in FAQ_BRAIN:
         return FAQ_BRAIN[user_text_lower], True
     
-    # Try fuzzy matching
-    matched = get_close_matches(user_text_lower, FAQ_BRAIN.keys(), n=1, cutoff=0.6)
+    # Try indexed matching
+    matched = faq_index.best_match(user_text_lower, min_confidence=FAQ_MATCH_CONFIDENCE)
     if matched:
         return FAQ_BRAIN[matched[0]], True
     
-    # Try web scraping RinglyPro.com
-    try:
-        headers = {'User-Agent': 'Mozilla/5.0 (compatible; FAQ-Bot)'}
-        response = requests.get("https://RinglyPro.com", headers=headers, timeout=5)
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
-            text = soup.get_text()
-            if len(text) > 100:
-                return "Based on information from our website: I found some relevant content that might help. For more specific assistance, please contact our support team.", True
-    except Exception as e:
-        logger.warning(f"Web scraping failed: {e}")
+    # Try the crawled RinglyPro.com index
+    website_match = site_index.lookup(user_text_lower)
+    if website_match:
+        return f"Based on information from our website: {website_snippet(website_match['passage'])} For more specific assistance, please contact our support team.", True
     
     # Fallback to customer service
     return "I don't have a specific answer to that question. Please contact our Customer Service team for specialized assistance.", True
@@ -1626,22 +2158,15 @@ def get_faq_response_with_sms(user_text: str) -> Tuple[str, bool, bool]:
     if user_text_lower in FAQ_BRAIN:
         return FAQ_BRAIN[user_text_lower], True, False
     
-    # Try fuzzy matching
-    matched = get_close_matches(user_text_lower, FAQ_BRAIN.keys(), n=1, cutoff=0.6)
+    # Try indexed matching
+    matched = faq_index.best_match(user_text_lower, min_confidence=FAQ_MATCH_CONFIDENCE)
     if matched:
         return FAQ_BRAIN[matched[0]], True, False
     
-    # Try web scraping RinglyPro.com
-    try:
-        headers = {'User-Agent': 'Mozilla/5.0 (compatible; FAQ-Bot)'}
-        response = requests.get("https://RinglyPro.com", headers=headers, timeout=5)
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
-            text = soup.get_text()
-            if len(text) > 100:
-                return "I found some information on our website that might be related, but I'd like to connect you with our customer service team for personalized assistance with your specific question. Could you please provide your phone number so they can reach out to help you?", False, True
-    except Exception as e:
-        logger.warning(f"Web scraping failed: {e}")
+    # Try the crawled RinglyPro.com index
+    website_match = site_index.lookup(user_text_lower)
+    if website_match:
+        return f"Here's what our website says: {website_snippet(website_match['passage'])} I'd also like to connect you with our customer service team for personalized assistance with your specific question. Could you please provide your phone number so they can reach out to help you?", False, True
     
     # Fallback to customer service with phone collection
     return "I don't have a specific answer to that question. I'd like to connect you with our customer service team. Could you please provide your phone number so they can reach out to help you?", False, True
@@ -1655,23 +2180,17 @@ def get_enhanced_faq_response(user_text: str) -> Tuple[str, bool, str]:
     
     logger.info(f"Enhanced FAQ processing: '{user_text_lower}'")
     
-    # Check for appointment booking intent - PRIORITY CHECK
-    booking_keywords = [
-        'schedule', 'book', 'appointment', 'meeting', 'consultation', 
-        'available', 'calendar', 'time', 'when can', 'set up', 'book an'
-    ]
-    
-    booking_detected = any(keyword in user_text_lower for keyword in booking_keywords)
-    logger.info(f"Booking keywords detected: {booking_detected}")
+    # Booking intent outranks rescheduling - PRIORITY CHECK
+    intent = CHAT_ROUTER.intent(user_text_lower)
+    logger.info(f"Booking keywords detected: {intent == 'start_booking'}")
     
-    if booking_detected:
+    if intent == 'start_booking':
         logger.info("Returning booking action")
         return ("I'd be happy to help you schedule an appointment! Let me guide you through the booking process.", 
                 True, "start_booking")
     
     # Check for rescheduling intent
-    reschedule_keywords = ['reschedule', 'change', 'move', 'cancel', 'confirmation code']
-    if any(keyword in user_text_lower for keyword in reschedule_keywords):
+    if intent == 'manage_appointment':
         return ("I can help you manage your existing appointment. Do you have your confirmation code?", 
                 True, "manage_appointment")
     
@@ -1682,8 +2201,8 @@ def get_enhanced_faq_response(user_text: str) -> Tuple[str, bool, str]:
     if user_text_lower in FAQ_BRAIN:
         return FAQ_BRAIN[user_text_lower], True, "none"
     
-    # Try fuzzy matching
-    matched = get_close_matches(user_text_lower, FAQ_BRAIN.keys(), n=1, cutoff=0.6)
+    # Try indexed matching
+    matched = faq_index.best_match(user_text_lower, min_confidence=FAQ_MATCH_CONFIDENCE)
     if matched:
         response = FAQ_BRAIN[matched[0]]
         # Add booking CTA to pricing questions
@@ -2808,9 +3327,9 @@ VOICE_HTML_TEMPLATE = '''
                 if (data.action === 'show_subscription_popup') {
                     console.log('🎯 Subscription popup triggered');
                     
-                    if (data.audio) {
+                    if (data.audio_url) {
                         console.log('Playing audio response');
-                        await this.playPremiumAudio(data.audio, data.response, data.show_text);
+                        await this.playPremiumAudio(data.audio_url, data.response, data.show_text);
                     } else {
                         console.log('No audio, using browser TTS');
                         await this.playBrowserTTS(data.response);
@@ -2825,9 +3344,9 @@ VOICE_HTML_TEMPLATE = '''
                 if (data.action === 'redirect_to_booking') {
                     console.log('🎯 Booking redirect detected');
                     
-                    if (data.audio) {
+                    if (data.audio_url) {
                         console.log('Playing audio response');
-                        await this.playPremiumAudio(data.audio, data.response, data.show_text);
+                        await this.playPremiumAudio(data.audio_url, data.response, data.show_text);
                     } else {
                         console.log('No audio, using browser TTS');
                         await this.playBrowserTTS(data.response);
@@ -2839,9 +3358,9 @@ VOICE_HTML_TEMPLATE = '''
                     return;
                 }
 
-                if (data.audio) {
+                if (data.audio_url) {
                     console.log('Playing Rachel audio response');
-                    await this.playPremiumAudio(data.audio, data.response, data.show_text);
+                    await this.playPremiumAudio(data.audio_url, data.response, data.show_text);
                 } else if (data.response) {
                     console.log('Using browser TTS');
                     await this.playBrowserTTS(data.response);
@@ -2855,7 +3374,7 @@ VOICE_HTML_TEMPLATE = '''
             }
         }
 
-        async playPremiumAudio(audioBase64, responseText, showText = false) {
+        async playPremiumAudio(audioUrl, responseText, showText = false) {
             console.log('🔊 Playing premium audio - Mobile:', this.isMobile, 'Audio Enabled:', this.mobileAudioEnabled);
             
             if (showText || this.isMobile) {
@@ -2883,17 +3402,7 @@ VOICE_HTML_TEMPLATE = '''
             }
             
             try {
-                const audioData = atob(audioBase64);
-                const arrayBuffer = new ArrayBuffer(audioData.length);
-                const uint8Array = new Uint8Array(arrayBuffer);
-                
-                for (let i = 0; i < audioData.length; i++) {
-                    uint8Array[i] = audioData.charCodeAt(i);
-                }
-
-                const audioBlob = new Blob([arrayBuffer], { type: 'audio/mpeg' });
-                const audioUrl = URL.createObjectURL(audioBlob);
-                
+                // The server returns a URL to the MP3; the browser fetches and starts playing it progressively
                 this.currentAudio = new Audio(audioUrl);
                 
                 if (this.isMobile) {
@@ -2913,7 +3422,6 @@ VOICE_HTML_TEMPLATE = '''
                         if (!audioStarted) {
                             console.log('⚠️ Audio timeout - fallback to text');
                             this.currentAudio = null;
-                            URL.revokeObjectURL(audioUrl);
                             
                             if (!showText && !this.isMobile) {
                                 this.updateStatus('💬 ' + responseText.substring(0, 150) + '...');
@@ -2942,7 +3450,6 @@ VOICE_HTML_TEMPLATE = '''
                     this.currentAudio.onended = () => {
                         console.log('✅ Audio playback completed');
                         clearTimeout(playTimeout);
-                        URL.revokeObjectURL(audioUrl);
                         this.audioFinished();
                         resolve();
                     };
@@ -2951,7 +3458,6 @@ VOICE_HTML_TEMPLATE = '''
                         console.error('❌ Audio playback error:', error);
                         clearTimeout(playTimeout);
                         this.currentAudio = null;
-                        URL.revokeObjectURL(audioUrl);
                         
                         if (this.isMobile) {
                             this.updateStatus('💬 ' + responseText);
@@ -3499,12 +4005,13 @@ VOICE_HTML_TEMPLATE = '''
         const options = { weekday: 'long', year: 'numeric', month: 'long', day: 'numeric' };
         const formattedDate = date.toLocaleDateString('en-US', options);
         const formattedTime = formatTimeSlot(appointment.time);
+        const pending = appointment.status === 'pending';
         
         container.innerHTML = `
             <div class="booking-form-header">
                 <button class="close-booking-form" onclick="closeBookingForm()">×</button>
-                <h2>✅ Appointment Confirmed!</h2>
-                <p>Your appointment has been successfully scheduled</p>
+                <h2>${pending ? '⏳ Appointment Request Received' : '✅ Appointment Confirmed!'}</h2>
+                <p>${pending ? 'We are confirming your appointment with our scheduling system' : 'Your appointment has been successfully scheduled'}</p>
             </div>
             
             <div style="background: linear-gradient(135deg, #e8f5e8, #c8e6c9); color: #2e7d32; padding: 20px; border-radius: 12px; margin-bottom: 20px;">
@@ -3519,7 +4026,7 @@ VOICE_HTML_TEMPLATE = '''
                     <strong>💬 Purpose:</strong> ${appointment.purpose}
                 </div>
                 <p style="margin-top: 15px; font-size: 14px;">
-                    You'll receive email and SMS confirmations shortly. Save your confirmation code for any changes needed.
+                    ${pending ? "You'll receive email and SMS confirmations as soon as your slot is confirmed." : "You'll receive email and SMS confirmations shortly."} Save your confirmation code for any changes needed.
                 </p>
             </div>
             
@@ -3529,7 +4036,7 @@ VOICE_HTML_TEMPLATE = '''
         `;
         
         if (window.voiceBot) {
-            window.voiceBot.updateStatus('✅ Appointment booked successfully!');
+            window.voiceBot.updateStatus(pending ? '⏳ Appointment request received' : '✅ Appointment booked successfully!');
         }
     }
 
@@ -4174,6 +4681,8 @@ ENHANCED_CHAT_TEMPLATE = '''
         let bookingStep = 'none';
         let bookingData = {};
         let selectedTimeSlot = null;
+        let slotsByDate = {};
+        let slotPrefetch = Promise.resolve();
 
         function handleKeyPress(event) {
             if (event.key === 'Enter' && !isWaitingForResponse) {
@@ -4289,35 +4798,51 @@ ENHANCED_CHAT_TEMPLATE = '''
             setTimeout(() => {
                 document.getElementById('customerName').focus();
             }, 100);
+            
+            prefetchAvailableSlots(document.getElementById('appointmentDate').min);
         }
 
-        function loadAvailableSlots() {
-            const date = document.getElementById('appointmentDate').value;
-            if (!date) return;
-            
-            fetch('/get-available-slots', {
+        function prefetchAvailableSlots(startDate) {
+            // One request for the next couple of weeks so browsing dates renders instantly
+            slotPrefetch = fetch('/get-available-slots-range', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ date: date })
+                body: JSON.stringify({ start_date: startDate })
             })
             .then(response => response.json())
             .then(data => {
-                const container = document.getElementById('timeSlotsContainer');
-                const slotsDiv = document.getElementById('availableSlots');
-                
-                if (data.slots && data.slots.length > 0) {
-                    slotsDiv.innerHTML = '';
-                    data.slots.forEach(slot => {
-                        const slotBtn = document.createElement('div');
-                        slotBtn.className = 'time-slot';
-                        slotBtn.textContent = formatTimeSlot(slot);
-                        slotBtn.onclick = () => selectTimeSlot(slot, slotBtn);
-                        slotsDiv.appendChild(slotBtn);
-                    });
-                    container.style.display = 'block';
-                } else {
-                    slotsDiv.innerHTML = '<p style="color: #f44336;">No available slots for this date. Please choose another date.</p>';
-                    container.style.display = 'block';
+                if (data.days) {
+                    slotsByDate = data.days;
+                }
+            })
+            .catch(error => {
+                console.error('Error prefetching slots:', error);
+            });
+        }
+
+        function loadAvailableSlots() {
+            const date = document.getElementById('appointmentDate').value;
+            if (!date) return;
+            
+            if (slotsByDate[date]) {
+                renderAvailableSlots(slotsByDate[date]);
+                return;
+            }
+            
+            slotPrefetch
+            .then(() => {
+                if (slotsByDate[date]) return slotsByDate[date];
+                return fetch('/get-available-slots', {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ date: date })
+                })
+                .then(response => response.json())
+                .then(data => data.slots || []);
+            })
+            .then(slots => {
+                if (document.getElementById('appointmentDate').value === date) {
+                    renderAvailableSlots(slots);
                 }
             })
             .catch(error => {
@@ -4325,6 +4850,26 @@ ENHANCED_CHAT_TEMPLATE = '''
             });
         }
 
+        function renderAvailableSlots(slots) {
+            const container = document.getElementById('timeSlotsContainer');
+            const slotsDiv = document.getElementById('availableSlots');
+            
+            if (slots && slots.length > 0) {
+                slotsDiv.innerHTML = '';
+                slots.forEach(slot => {
+                    const slotBtn = document.createElement('div');
+                    slotBtn.className = 'time-slot';
+                    slotBtn.textContent = formatTimeSlot(slot);
+                    slotBtn.onclick = () => selectTimeSlot(slot, slotBtn);
+                    slotsDiv.appendChild(slotBtn);
+                });
+                container.style.display = 'block';
+            } else {
+                slotsDiv.innerHTML = '<p style="color: #f44336;">No available slots for this date. Please choose another date.</p>';
+                container.style.display = 'block';
+            }
+        }
+
         function selectTimeSlot(time, element) {
             document.querySelectorAll('.time-slot').forEach(slot => {
                 slot.classList.remove('selected');
@@ -4401,10 +4946,12 @@ ENHANCED_CHAT_TEMPLATE = '''
             const formattedDate = date.toLocaleDateString('en-US', options);
             const formattedTime = formatTimeSlot(appointment.time);
             
+            const pending = appointment.status === 'pending';
+            
             const confirmDiv = document.createElement('div');
             confirmDiv.className = 'success-message';
             confirmDiv.innerHTML = `
-                <strong>Appointment Confirmed!</strong><br><br>
+                <strong>${pending ? 'Appointment Request Received!' : 'Appointment Confirmed!'}</strong><br><br>
                 Date: ${formattedDate}<br>
                 Time: ${formattedTime} EST<br>
                 Name: ${appointment.customer_name}<br>
@@ -4413,7 +4960,7 @@ ENHANCED_CHAT_TEMPLATE = '''
                 Zoom Link: <a href="${appointment.zoom_url}" target="_blank" style="color: #2196F3;">Join Meeting</a><br>
                 Confirmation Code: ${appointment.confirmation_code}<br><br>
                 
-                You'll receive email and SMS confirmations shortly. Save your confirmation code for any changes.
+                ${pending ? "You'll receive email and SMS confirmations as soon as your slot is confirmed." : "You'll receive email and SMS confirmations shortly."} Save your confirmation code for any changes.
             `;
             
             chatMessages.appendChild(confirmDiv);
@@ -4422,6 +4969,7 @@ ENHANCED_CHAT_TEMPLATE = '''
             bookingStep = 'none';
             bookingData = {};
             selectedTimeSlot = null;
+            slotsByDate = {};
         }
 
         function showBookingError(message) {
@@ -4439,22 +4987,73 @@ ENHANCED_CHAT_TEMPLATE = '''
 </html>
 '''
 
+# ==================== PRECOMPRESSED UI PAGES ====================
+
+# The UI templates have no per-request variables, so each is rendered, split into an HTML shell plus
+# fingerprinted JS/CSS, and compressed once per worker
+page_cache = PageCache()
+asset_pipeline = AssetPipeline(url_prefix='/static/assets')
+ASSET_MAX_AGE = 365 * 24 * 3600
+
+def build_page_cache():
+    """Render the UI templates, extract their inline assets and store gzip/brotli variants"""
+    with app.app_context():
+        for name, template in (('voice', VOICE_HTML_TEMPLATE),
+                               ('chat', CHAT_HTML_TEMPLATE),
+                               ('chat_enhanced', ENHANCED_CHAT_TEMPLATE)):
+            page_cache.add(name, asset_pipeline.extract(name, render_template_string(template)))
+
+build_page_cache()
+
+def send_precompressed(page, content_type: str, cache_control: str, counters):
+    """Send page in the best encoding the client accepts, or 304 if its copy is current"""
+    encoding, etag, body = page.select(request.accept_encodings.quality)
+    
+    # Any encoding's tag proves the client holds the current content; weak match since proxies may add W/
+    if any(request.if_none_match.contains_weak(tag.strip('"')) for tag in page.etags):
+        counters.not_modified += 1
+        response = make_response('', 304)
+    else:
+        counters.hits += 1
+        response = make_response(body)
+        response.headers['Content-Type'] = content_type
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+    
+    response.headers['ETag'] = etag
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = cache_control
+    return response
+
+def serve_precompressed_page(name: str):
+    """HTML shells revalidate on every visit so new asset fingerprints are picked up immediately"""
+    return send_precompressed(page_cache.get(name), 'text/html; charset=utf-8', 'no-cache', page_cache)
+
+@app.route('/static/assets/<filename>')
+def serve_static_asset(filename):
+    """Fingerprinted JS/CSS extracted from the UI templates; the name changes whenever the content does"""
+    asset = asset_pipeline.get(filename)
+    if asset is None:
+        return "Asset not found", 404
+    return send_precompressed(asset, asset.content_type, f'public, max-age={ASSET_MAX_AGE}, immutable',
+                              asset_pipeline)
+
 # ==================== ROUTES (POSTGRESQL VIA CRM API) ====================
 
 @app.route('/')
 def serve_index():
     """Voice interface"""
-    return render_template_string(VOICE_HTML_TEMPLATE)
+    return serve_precompressed_page('voice')
 
 @app.route('/chat')
 def serve_chat():
     """Text chat interface"""
-    return render_template_string(CHAT_HTML_TEMPLATE)
+    return serve_precompressed_page('chat')
 
 @app.route('/chat-enhanced')
 def serve_enhanced_chat():
     """Enhanced chat interface with appointment booking"""
-    return render_template_string(ENHANCED_CHAT_TEMPLATE)
+    return serve_precompressed_page('chat_enhanced')
 
 @app.route('/chat', methods=['POST'])
 def handle_chat():
@@ -4468,11 +5067,11 @@ def handle_chat():
         
         session['last_question'] = user_message
         
-        logger.info(f"Chat message received: {user_message}")
+        hot_path_logger.info("Chat message received: %s", user_message)
         
         response, is_faq_match, needs_phone_collection = get_faq_response_with_sms(user_message)
         
-        logger.info(f"FAQ match: {is_faq_match}, Phone collection needed: {needs_phone_collection}")
+        hot_path_logger.info("FAQ match: %s, Phone collection needed: %s", is_faq_match, needs_phone_collection)
         
         return jsonify({
             'response': response,
@@ -4499,13 +5098,13 @@ def handle_enhanced_chat():
         if not user_message:
             return jsonify({'response': 'Please enter a question.', 'action': 'none'})
         
-        logger.info(f"Enhanced chat message: {user_message}")
-        logger.info(f"Current booking step: {booking_step}")
+        hot_path_logger.info("Enhanced chat message: %s", user_message)
+        hot_path_logger.info("Current booking step: %s", booking_step)
         
         user_message_lower = user_message.lower().strip()
         
         if booking_step == 'awaiting_confirmation':
-            logger.info("Processing follow-up response")
+            hot_path_logger.info("Processing follow-up response")
             if user_message_lower in ['yes', 'yeah', 'yep', 'sure', 'ok', 'okay', 'y']:
                 logger.info("User confirmed booking")
                 return jsonify({
@@ -4525,8 +5124,8 @@ def handle_enhanced_chat():
         
         response, is_faq_match, action_needed = get_enhanced_faq_response(user_message)
         
-        logger.info(f"Response: {response[:50]}...")
-        logger.info(f"Action needed: {action_needed}")
+        hot_path_logger.info("Response: %.50s...", response)
+        hot_path_logger.info("Action needed: %s", action_needed)
         
         response_data = {
             'response': response,
@@ -4536,7 +5135,7 @@ def handle_enhanced_chat():
         }
         
         if action_needed == "start_booking":
-            logger.info("Setting action to start_booking")
+            hot_path_logger.info("Setting action to start_booking")
             response_data['action'] = 'start_booking'
             response_data['booking_step'] = 'form_ready'
         elif action_needed == "suggest_booking":
@@ -4545,7 +5144,8 @@ def handle_enhanced_chat():
         elif action_needed == "offer_booking":
             response_data['booking_step'] = 'awaiting_confirmation'
         
-        logger.info(f"Final response data: {response_data}")
+        # Full payload only at DEBUG; %-args skip building the repr when it is filtered
+        hot_path_logger.debug("Final response data: %s", response_data)
         return jsonify(response_data)
         
     except Exception as e:
@@ -4565,7 +5165,7 @@ def get_available_slots():
         if not date:
             return jsonify({'error': 'Date is required'}), 400
         
-        appointment_manager = AppointmentManager()
+        appointment_manager = services.appointments
         slots = appointment_manager.get_available_slots(date)
         
         return jsonify({
@@ -4578,13 +5178,39 @@ def get_available_slots():
         logger.error(f"Error getting available slots from PostgreSQL: {e}")
         return jsonify({'error': 'Failed to get available slots'}), 500
 
+@app.route('/get-available-slots-range', methods=['POST'])
+def get_available_slots_range():
+    """Get available appointment slots for several days in one request - PostgreSQL backend"""
+    try:
+        data = request.get_json(silent=True) or {}
+        start_date = data.get('start_date') or datetime.now().strftime('%Y-%m-%d')
+        
+        try:
+            days = int(data.get('days', SLOT_PREFETCH_DAYS))
+            datetime.strptime(start_date, '%Y-%m-%d')
+        except (TypeError, ValueError):
+            return jsonify({'error': 'start_date must be YYYY-MM-DD and days a number'}), 400
+        
+        appointment_manager = services.appointments
+        slots_by_date = appointment_manager.get_available_slots_range(start_date, days)
+        
+        return jsonify({
+            'success': True,
+            'start_date': start_date,
+            'days': slots_by_date
+        })
+        
+    except Exception as e:
+        logger.error(f"Error getting available slot range from PostgreSQL: {e}")
+        return jsonify({'error': 'Failed to get available slots'}), 500
+
 @app.route('/book-appointment', methods=['POST'])
 def book_appointment():
     """Book a new appointment - PostgreSQL backend"""
     try:
         data = request.get_json()
         
-        appointment_manager = AppointmentManager()
+        appointment_manager = services.appointments
         success, message, appointment = appointment_manager.book_appointment(data)
         
         if success:
@@ -4610,7 +5236,7 @@ def book_appointment():
 def get_appointment(confirmation_code):
     """Get appointment details by confirmation code - PostgreSQL backend"""
     try:
-        appointment_manager = AppointmentManager()
+        appointment_manager = services.appointments
         appointment = appointment_manager.get_appointment_by_code(confirmation_code)
         
         if appointment:
@@ -4631,6 +5257,31 @@ def get_appointment(confirmation_code):
             'message': 'Failed to retrieve appointment'
         }), 500
 
+@app.route('/appointment/<confirmation_code>/confirmations')
+def get_appointment_confirmations(confirmation_code):
+    """Email/SMS confirmation delivery status for a booking"""
+    try:
+        confirmations = notification_queue.status(confirmation_code)
+        
+        if confirmations:
+            return jsonify({
+                'success': True,
+                'confirmation_code': confirmation_code,
+                'confirmations': confirmations
+            })
+        else:
+            return jsonify({
+                'success': False,
+                'message': 'No confirmations queued for this appointment'
+            }), 404
+            
+    except Exception as e:
+        logger.error(f"Error getting confirmation status: {e}")
+        return jsonify({
+            'success': False,
+            'message': 'Failed to retrieve confirmation status'
+        }), 500
+
 @app.route('/submit_phone', methods=['POST'])
 def submit_phone():
     """Handle phone number submission and send SMS notification - PostgreSQL backend"""
@@ -4654,10 +5305,13 @@ def submit_phone():
         
         logger.info(f"Phone submitted: {validated_phone}, Question: {last_question}")
         
-        sms_success, sms_result = send_sms_notification(validated_phone, last_question)
+        sms_success, sms_sid = send_sms_notification(validated_phone, last_question)
         
-        # Save to PostgreSQL via CRM API
-        db_saved = save_customer_inquiry(validated_phone, last_question, sms_success, sms_result)
+        # Save to PostgreSQL via CRM API; with an SMS queued, after it is sent so the real SID is recorded
+        if sms_sid is not None:
+            save_customer_inquiry_after_sms(validated_phone, last_question, sms_sid)
+        else:
+            save_customer_inquiry(validated_phone, last_question, False)
         
         if sms_success:
             success_message = f'Perfect! We\'ve received your phone number ({validated_phone}) and notified our customer service team about your question: "{last_question}". They\'ll reach out to you shortly to provide personalized assistance.'
@@ -4725,7 +5379,7 @@ def test_appointment_system():
         
         # Test HubSpot connection
         if hubspot_api_token:
-            hubspot_service = HubSpotService()
+            hubspot_service = services.hubspot
             hubspot_test = hubspot_service.test_connection()
             results["tests"]["hubspot"] = hubspot_test
         else:
@@ -4734,11 +5388,7 @@ def test_appointment_system():
         # Test email configuration
         if email_user and email_password:
             try:
-                import smtplib
-                server = smtplib.SMTP(smtp_server, smtp_port)
-                server.starttls()
-                server.login(email_user, email_password)
-                server.quit()
+                smtp_pool.check()
                 results["tests"]["email"] = {"success": True, "message": "Email configuration valid"}
             except Exception as e:
                 results["tests"]["email"] = {"success": False, "error": str(e)}
@@ -4748,9 +5398,7 @@ def test_appointment_system():
         # Test Twilio configuration
         if twilio_account_sid and twilio_auth_token:
             try:
-                from twilio.rest import Client
-                client = Client(twilio_account_sid, twilio_auth_token)
-                account = client.api.accounts(twilio_account_sid).fetch()
+                account = get_twilio_client().api.accounts(twilio_account_sid).fetch()
                 results["tests"]["twilio"] = {
                     "success": True, 
                     "message": "Twilio configuration valid",
@@ -4858,6 +5506,19 @@ def test_appointment_system():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+def generate_voice_audio(text: str, stream: Optional[bool] = None) -> Tuple[Optional[str], str]:
+    """Synthesize Rachel's voice for the web voice UI. Returns (audio_url, engine_used)"""
+    if not tts_client.configured:
+        return None, "browser_fallback"
+    
+    # The browser fetches the MP3 from /audio as a separate binary request
+    audio_url = services.phone.render_rachel_clip(text, stream=stream)
+    
+    if audio_url:
+        return audio_url, "elevenlabs_rachel"
+    
+    return None, "browser_fallback"
+
 @app.route('/process-text-enhanced', methods=['POST'])
 def process_text_enhanced():
     """Enhanced text processing with premium audio and subscription detection"""
@@ -4873,6 +5534,9 @@ def process_text_enhanced():
         user_text = data['text'].strip()
         user_language = data.get('language', 'en-US')
         is_mobile = data.get('mobile', False)
+        # Absent means the server default; "false" (a non-empty string) must not switch streaming on
+        stream_flag = data.get('stream')
+        stream_audio = None if stream_flag is None else str(stream_flag).lower() == 'true'
         
         # Backend echo detection
         echo_phrases = [
@@ -4900,55 +5564,16 @@ def process_text_enhanced():
         
         logger.info(f"Processing: {user_text}")
         
-        # Check for subscription intent FIRST
-        subscription_keywords = [
-            'subscribe', 'subscription', 'sign up', 'signup', 'get started',
-            'join', 'register', 'start service', 'want to subscribe',
-            'i want to subscribe', 'interested in subscribing', 'how to subscribe',
-            'ready to subscribe', 'start my subscription', 'become a member'
-        ]
+        # Subscription intent outranks booking
+        intent = VOICE_ROUTER.intent(user_lower)
         
-        subscription_detected = any(keyword in user_lower for keyword in subscription_keywords)
-        
-        if subscription_detected:
+        if intent == 'subscription':
             logger.info("Subscription intent detected in voice!")
             subscription_response = "Wonderful! I'm excited to help you get started with RinglyPro. I'm opening our subscription options for you right now. You'll see our plans and can choose the one that best fits your business needs."
             
-            audio_data = None
-            engine_used = "browser_fallback"
-            
-            if elevenlabs_api_key:
-                try:
-                    voice_id = "21m00Tcm4TlvDq8ikWAM"
-                    url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-                    
-                    headers = {
-                        "Accept": "audio/mpeg",
-                        "Content-Type": "application/json",
-                        "xi-api-key": elevenlabs_api_key
-                    }
-                    
-                    tts_data = {
-                        "text": subscription_response,
-                        "model_id": "eleven_monolingual_v1",
-                        "voice_settings": {
-                            "stability": 0.5,
-                            "similarity_boost": 0.75
-                        }
-                    }
-                    
-                    timeout = 10
-                    tts_response = requests.post(url, json=tts_data, headers=headers, timeout=timeout)
-                    
-                    if tts_response.status_code == 200 and len(tts_response.content) > 1000:
-                        audio_data = base64.b64encode(tts_response.content).decode('utf-8')
-                        engine_used = "elevenlabs_rachel"
-                        logger.info("Rachel's voice audio generated for subscription")
-                    else:
-                        logger.warning(f"ElevenLabs failed: {tts_response.status_code}")
-                    
-                except Exception as tts_error:
-                    logger.error(f"ElevenLabs Rachel error: {tts_error}")
+            audio_url, engine_used = generate_voice_audio(subscription_response, stream=stream_audio)
+            if audio_url:
+                logger.info("Rachel's voice audio generated for subscription")
             
             response_payload = {
                 "response": subscription_response,
@@ -4959,58 +5584,21 @@ def process_text_enhanced():
                 "show_text": True
             }
             
-            if audio_data:
-                response_payload["audio"] = audio_data
+            if audio_url:
+                response_payload["audio_url"] = audio_url
                 logger.info("Subscription response with Rachel's voice")
             else:
                 logger.info("Subscription response with browser TTS fallback")
             
             return jsonify(response_payload)
-            # Check for appointment booking intent
-        booking_keywords = [
-            'book', 'schedule', 'appointment', 'meeting', 'consultation',
-            'available', 'calendar', 'time', 'when can', 'set up',
-            'book an', 'make an appointment', 'schedule a meeting'
-        ]
-        
-        booking_detected = any(keyword in user_lower for keyword in booking_keywords)
-        
-        if booking_detected:
+        # Check for appointment booking intent
+        if intent == 'booking':
             logger.info("Booking intent detected in voice!")
             booking_response = "Perfect! I'd be happy to help you schedule a consultation. Let me open the booking form for you right now where you can select your preferred date and time."
             
-            audio_data = None
-            engine_used = "browser_fallback"
-            
-            if elevenlabs_api_key:
-                try:
-                    voice_id = "21m00Tcm4TlvDq8ikWAM"
-                    url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-                    
-                    headers = {
-                        "Accept": "audio/mpeg",
-                        "Content-Type": "application/json",
-                        "xi-api-key": elevenlabs_api_key
-                    }
-                    
-                    tts_data = {
-                        "text": booking_response,
-                        "model_id": "eleven_monolingual_v1",
-                        "voice_settings": {
-                            "stability": 0.5,
-                            "similarity_boost": 0.75
-                        }
-                    }
-                    
-                    tts_response = requests.post(url, json=tts_data, headers=headers, timeout=10)
-                    
-                    if tts_response.status_code == 200 and len(tts_response.content) > 1000:
-                        audio_data = base64.b64encode(tts_response.content).decode('utf-8')
-                        engine_used = "elevenlabs_rachel"
-                        logger.info("Rachel's voice audio generated for booking")
-                    
-                except Exception as tts_error:
-                    logger.error(f"ElevenLabs booking error: {tts_error}")
+            audio_url, engine_used = generate_voice_audio(booking_response, stream=stream_audio)
+            if audio_url:
+                logger.info("Rachel's voice audio generated for booking")
             
             response_payload = {
                 "response": booking_response,
@@ -5021,8 +5609,8 @@ def process_text_enhanced():
                 "show_text": True
             }
             
-            if audio_data:
-                response_payload["audio"] = audio_data
+            if audio_url:
+                response_payload["audio_url"] = audio_url
             
             return jsonify(response_payload)
         
@@ -5037,44 +5625,7 @@ def process_text_enhanced():
             )
         
         # Generate audio response
-        audio_data = None
-        engine_used = "browser_fallback"
-        
-        if elevenlabs_api_key:
-            try:
-                voice_id = "21m00Tcm4TlvDq8ikWAM"
-                url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-                
-                headers = {
-                    "Accept": "audio/mpeg",
-                    "Content-Type": "application/json",
-                    "xi-api-key": elevenlabs_api_key
-                }
-                
-                speech_text = response.replace("RinglyPro", "Ringly Pro")
-                speech_text = speech_text.replace("AI", "A.I.")
-                speech_text = speech_text.replace("$", " dollars")
-                
-                tts_data = {
-                    "text": speech_text,
-                    "model_id": "eleven_monolingual_v1",
-                    "voice_settings": {
-                        "stability": 0.5,
-                        "similarity_boost": 0.75
-                    }
-                }
-                
-                tts_response = requests.post(url, json=tts_data, headers=headers, timeout=10)
-                
-                if tts_response.status_code == 200 and len(tts_response.content) > 1000:
-                    audio_data = base64.b64encode(tts_response.content).decode('utf-8')
-                    engine_used = "elevenlabs_rachel"
-                    logger.info("Rachel's voice audio generated successfully")
-                else:
-                    logger.warning(f"ElevenLabs failed: {tts_response.status_code}")
-                
-            except Exception as tts_error:
-                logger.error(f"ElevenLabs error: {tts_error}")
+        audio_url, engine_used = generate_voice_audio(response, stream=stream_audio)
         
         response_payload = {
             "response": response,
@@ -5085,8 +5636,8 @@ def process_text_enhanced():
             "show_text": is_mobile
         }
         
-        if audio_data:
-            response_payload["audio"] = audio_data
+        if audio_url:
+            response_payload["audio_url"] = audio_url
         
         return jsonify(response_payload)
         
@@ -5127,7 +5678,7 @@ def phone_webhook():
         send_call_data_to_crm(call_data)
         
         # Create phone handler and generate greeting
-        phone_handler = PhoneCallHandler()
+        phone_handler = services.phone
         response = phone_handler.create_greeting_response()
         
         return str(response), 200, {'Content-Type': 'text/xml'}
@@ -5157,7 +5708,7 @@ def process_speech():
         }
         send_call_data_to_crm(call_data)
         
-        phone_handler = PhoneCallHandler()
+        phone_handler = services.phone
         response = phone_handler.process_speech_input(speech_result)
         
         return str(response), 200, {'Content-Type': 'text/xml'}
@@ -5183,7 +5734,7 @@ def collect_name():
         if speech_result and len(speech_result) >= 2:
             session[f'call_{call_sid}_name'] = speech_result
             
-            phone_handler = PhoneCallHandler()
+            phone_handler = services.phone
             response = phone_handler.collect_booking_info('name', speech_result)
             
             return str(response), 200, {'Content-Type': 'text/xml'}
@@ -5232,7 +5783,7 @@ def collect_phone():
                 
                 customer_name = session.get(f'call_{call_sid}_name', 'Customer')
                 
-                phone_handler = PhoneCallHandler()
+                phone_handler = services.phone
                 response = phone_handler.collect_booking_info('phone', formatted_phone)
                 
                 return str(response), 200, {'Content-Type': 'text/xml'}
@@ -5270,11 +5821,13 @@ def pricing_followup():
     try:
         speech_result = request.form.get('SpeechResult', '').strip().lower()
         
-        phone_handler = PhoneCallHandler()
+        phone_handler = services.phone
+        
+        intent = PRICING_FOLLOWUP_ROUTER.intent(speech_result)
         
-        if any(word in speech_result for word in ['yes', 'book', 'demo', 'consultation', 'schedule']):
+        if intent == 'demo_booking':
             response = phone_handler.handle_demo_booking()
-        elif any(word in speech_result for word in ['repeat', 'again', 'pricing', 'prices']):
+        elif intent == 'pricing':
             response = phone_handler.handle_pricing_inquiry()
         else:
             response = VoiceResponse()
@@ -5327,38 +5880,132 @@ def call_complete():
 
 # ==================== AUDIO SERVING ROUTES ====================
 
+@app.route('/audio/stream/<filename>')
+def stream_audio(filename):
+    """Stream Rachel's voice from ElevenLabs to Twilio while it is being synthesized"""
+    try:
+        if not AUDIO_STREAM_SECRET:
+            logger.warning(f"Rejected audio stream request (no AUDIO_STREAM_SECRET configured): {filename}")
+            return "Audio streaming is not configured", 403
+        
+        speech_text = request.args.get('text', '')
+        signature = request.args.get('sig', '')
+        cache_key = filename[len('rachel_'):-len('.mp3')]
+        
+        phone_handler = services.phone
+        expected_key = TTSAudioCache.make_key(
+            phone_handler.rachel_voice_id, phone_handler.model_id, phone_handler.voice_settings, speech_text
+        )
+        
+        if not speech_text or cache_key != expected_key or not hmac.compare_digest(
+                signature, phone_handler.sign_stream_key(cache_key)):
+            logger.warning(f"Rejected audio stream request: {filename}")
+            return "Invalid audio stream", 403
+        
+        # A retry after the first stream completed is served from the cache
+        cached_audio = audio_store.get(cache_key)
+        if cached_audio is not None:
+            response = make_response(cached_audio)
+            response.headers['Content-Type'] = 'audio/mpeg'
+            return response
+        
+        chunks = phone_handler.stream_rachel_audio(speech_text, cache_key)
+        if chunks is None:
+            return "Audio synthesis failed", 502
+        
+        response = make_response(chunks)
+        response.headers['Content-Type'] = 'audio/mpeg'
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+        
+    except Exception as e:
+        logger.error(f"Error streaming audio {filename}: {e}")
+        return "Error streaming audio", 500
+
 @app.route('/audio/<filename>')
 def serve_audio(filename):
     """Serve audio files for Rachel's voice"""
     try:
-        audio_path = f"/tmp/{filename}"
-        
-        if os.path.exists(audio_path):
-            def generate():
-                with open(audio_path, 'rb') as f:
-                    data = f.read(1024)
-                    while data:
-                        yield data
-                        data = f.read(1024)
-                
-                # Clean up file after serving
-                try:
-                    os.remove(audio_path)
-                except:
-                    pass
-            
-            response = make_response(generate())
-            response.headers['Content-Type'] = 'audio/mpeg'
-            response.headers['Cache-Control'] = 'no-cache'
-            return response
-        else:
+        # Clips stay available until their TTL lapses, so Twilio retries and HEAD probes succeed
+        cache_key = filename[len('rachel_'):-len('.mp3')] if filename.startswith('rachel_') and filename.endswith('.mp3') else ''
+        audio = audio_store.get(cache_key) if cache_key else None
+        
+        if audio is None:
             logger.warning(f"Audio file not found: {filename}")
             return "Audio file not found", 404
+        
+        response = make_response(audio)
+        response.headers['Content-Type'] = 'audio/mpeg'
+        response.headers['Cache-Control'] = f'public, max-age={audio_store.ttl_seconds}'
+        response.headers['ETag'] = f'"{cache_key}"'
+        return response
             
     except Exception as e:
         logger.error(f"Error serving audio {filename}: {e}")
         return "Error serving audio", 500
 
+# ==================== METRICS ====================
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    """Per-route latency and status counts; the rule (not the raw path) keeps label cardinality bounded"""
+    started = getattr(g, 'request_started', None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        metrics.observe('ringlypro_http_request_duration_seconds', time.perf_counter() - started,
+                        route=route, method=request.method)
+        metrics.inc('ringlypro_http_requests_total', route=route, method=request.method,
+                    status=response.status_code)
+    return response
+
+METRICS_MAX_BREAKER_LABELS = 50
+
+def collect_component_metrics():
+    """Scrape-time gauges: cache hit ratios, queue depths and CRM breaker state from the components' stats()"""
+    site = site_index.stats()
+    caches = {
+        'tts_audio': tts_audio_cache.stats()['hit_ratio'],
+        'slots': slot_cache.stats()['hit_ratio'],
+        'site_index': round(site['hits'] / site['lookups'], 4) if site['lookups'] else 0.0
+    }
+    
+    # The SQLite-backed stats() return {"error": ...} when the database is unreadable; those depths are skipped
+    notifications = notification_queue.stats()
+    queues = {
+        'call_events': call_event_queue.stats()['depth'],
+        'crm_outbox': crm_outbox.stats().get('pending'),
+        'notifications': notifications['queued'] + notifications['retrying'] if 'error' not in notifications else None,
+        'sms': sms_dispatcher.stats()['depth'],
+        'logging': log_pipeline.stats()['depth']
+    }
+    
+    samples = [('ringlypro_cache_hit_ratio', 'Cache hits per lookup since worker start', {'cache': name}, ratio)
+               for name, ratio in caches.items()]
+    samples += [('ringlypro_queue_depth', 'Items waiting in a background queue', {'queue': name}, depth)
+                for name, depth in queues.items()]
+    # Labels are CRM route templates (endpoint_key), capped so a surprise endpoint can't blow up cardinality
+    breakers = crm_client.stats()
+    samples += [('ringlypro_crm_breaker_open', 'CRM circuit breaker open (1) or not (0)', {'endpoint': endpoint},
+                 int(entry['breaker']['state'] == CircuitBreaker.OPEN))
+                for endpoint, entry in sorted(breakers.items())[:METRICS_MAX_BREAKER_LABELS]]
+    samples.append(('ringlypro_crm_breakers_open', 'CRM circuit breakers currently open', {},
+                    sum(entry['breaker']['state'] == CircuitBreaker.OPEN for entry in breakers.values())))
+    return samples
+
+metrics.register_collector(collect_component_metrics)
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """Prometheus scrape endpoint for this worker"""
+    response = make_response(metrics.render())
+    response.headers['Content-Type'] = 'text/plain; version=0.0.4; charset=utf-8'
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
 # ==================== HEALTH CHECK & ADMIN ROUTES ====================
 
 @app.route('/health')
@@ -5379,7 +6026,22 @@ def health_check():
                 "twilio_api": bool(twilio_account_sid and twilio_auth_token),
                 "email_smtp": bool(email_user and email_password),
                 "hubspot_api": bool(hubspot_api_token)
-            }
+            },
+            "audio_store": audio_store.stats(),
+            "ivr_prompts": dict(prompt_warmup_status),
+            "site_index": site_index.stats(),
+            "crm_api": crm_client.stats(),
+            "call_events": call_event_queue.stats(),
+            "crm_outbox": crm_outbox.stats(),
+            "slot_cache": slot_cache.stats(),
+            "notifications": notification_queue.stats(),
+            "smtp_pool": smtp_pool.stats(),
+            "sms_dispatcher": sms_dispatcher.stats(),
+            "services": services.stats(),
+            "pages": page_cache.stats(),
+            "assets": asset_pipeline.stats(),
+            "boot": dict(boot_timings),
+            "logging": log_pipeline.stats()
         }
         
         all_healthy = all(status["services"].values())
@@ -5552,24 +6214,89 @@ def handle_exception(e):
 
 # ==================== APPLICATION STARTUP ====================
 
+def prerender_ivr_prompts():
+    """Synthesize every fixed IVR prompt once so call handlers never wait on ElevenLabs"""
+    if not elevenlabs_api_key:
+        prompt_warmup_status["state"] = "disabled"
+        prompt_warmup_ready.set()
+        logger.info("🎙️ IVR prompt warm-up skipped - ElevenLabs not configured")
+        return
+    
+    prompt_warmup_status["state"] = "running"
+    started = time.time()
+    phone_handler = services.phone
+    
+    for prompt_name, prompt_text in IVR_PROMPTS.items():
+        # Pre-rendered prompts are reused for every call, so pin them against TTL expiry
+        audio_url = phone_handler.generate_rachel_audio(prompt_text, stream=False, pinned=True)
+        if audio_url:
+            prerendered_prompt_urls[prompt_name] = audio_url
+            prompt_warmup_status["rendered"] += 1
+        else:
+            logger.warning(f"⚠️ Failed to pre-render IVR prompt: {prompt_name}")
+    
+    prompt_warmup_status["duration_seconds"] = round(time.time() - started, 2)
+    prompt_warmup_status["state"] = (
+        "ready" if prompt_warmup_status["rendered"] == prompt_warmup_status["total"] else "partial"
+    )
+    prompt_warmup_ready.set()
+    logger.info(
+        f"✅ IVR prompts pre-rendered: {prompt_warmup_status['rendered']}/{prompt_warmup_status['total']} "
+        f"in {prompt_warmup_status['duration_seconds']}s"
+    )
+
+def start_prompt_warmup():
+    """Run the IVR prompt warm-up in a background thread"""
+    warmup_thread = threading.Thread(target=prerender_ivr_prompts, name="ivr-prompt-warmup", daemon=True)
+    warmup_thread.start()
+    return warmup_thread
+
+def warm_deferred_imports():
+    """Import the SDKs kept out of module import once the worker is up, so the first SMS or
+    phone validation doesn't pay for them"""
+    def warm():
+        started = time.perf_counter()
+        try:
+            validate_phone_number("+18886103810")
+            if twilio_account_sid and twilio_auth_token:
+                get_twilio_client()
+            boot_timings['deferred_imports_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        except Exception as e:
+            logger.warning(f"Deferred import warm-up failed: {e}")
+    
+    warm_thread = threading.Thread(target=warm, name="deferred-imports", daemon=True)
+    warm_thread.start()
+    return warm_thread
+
 def is_render_environment():
     """Check if running on Render"""
     return os.getenv('RENDER') == 'true'
 
+def check_crm_connection():
+    """Log whether the CRM API answers; runs on its own thread so boot never waits on the network"""
+    logger.info("🗄️ Testing PostgreSQL connection via CRM API...")
+    if init_crm_connection():
+        logger.info("✅ PostgreSQL connection successful via CRM API")
+    else:
+        logger.warning("⚠️ PostgreSQL connection failed - app will run with limited functionality")
+
+# Background threads don't survive a fork, so services are started once per worker process
+_initialized_pid = None
+_initialize_lock = threading.Lock()
+
 def initialize_application():
-    """Initialize the application and all services"""
+    """Start this worker's background services; runs once per process, later calls are no-ops"""
+    global _initialized_pid
+    with _initialize_lock:
+        if _initialized_pid == os.getpid():
+            return True
+        _initialized_pid = os.getpid()
+    
     try:
         logger.info("🚀 Starting RinglyPro Voice Assistant with PostgreSQL Backend")
         logger.info("=" * 80)
         
-        # Test PostgreSQL connection via CRM API
-        logger.info("🗄️ Testing PostgreSQL connection via CRM API...")
-        crm_connected = init_crm_connection()
-        
-        if crm_connected:
-            logger.info("✅ PostgreSQL connection successful via CRM API")
-        else:
-            logger.warning("⚠️ PostgreSQL connection failed - app will run with limited functionality")
+        threading.Thread(target=check_crm_connection, name="crm-probe", daemon=True).start()
         
         # Test integrations
         logger.info("🔧 Testing integrations...")
@@ -5584,6 +6311,25 @@ def initialize_application():
         else:
             logger.warning("⚠️ ElevenLabs API not configured (fallback to browser TTS)")
         
+        # Expire idle audio clips and cap disk usage in the background
+        audio_store.start_janitor()
+        
+        # Replay CRM writes queued while the CRM was unreachable
+        crm_outbox.start()
+        
+        # Resume confirmations left pending by a previous run
+        notification_queue.start()
+        
+        # Crawl RinglyPro.com off the request path; FAQ misses search the local copy
+        site_index.start_refresher()
+        
+        # Pre-render fixed IVR prompts without blocking startup
+        logger.info("🎙️ Pre-rendering IVR prompts in background...")
+        start_prompt_warmup()
+        
+        # twilio.rest and phonenumbers are deferred at import; load them off the boot path
+        warm_deferred_imports()
+        
         if twilio_account_sid and twilio_auth_token:
             logger.info("✅ Twilio API configured")
         else:
@@ -5600,6 +6346,9 @@ def initialize_application():
         logger.info("🔗 Health Check: /health")
         logger.info("📋 Admin Panel: /admin/appointments")
         logger.info("🧪 Test System: /test-appointment-system")
+        boot_timings['ready_ms'] = round((time.perf_counter() - BOOT_STARTED) * 1000, 1)
+        logger.info(f"⏱️ Worker boot: {boot_timings['ready_ms']} ms "
+                    f"(module import {boot_timings['import_ms']} ms, pid {os.getpid()})")
         logger.info("=" * 80)
         
         return True
@@ -5610,6 +6359,15 @@ def initialize_application():
         logger.error(traceback.format_exc())
         return False
 
+# Everything above ran at import; initialize_application adds its own time as ready_ms
+boot_timings = {'import_ms': round((time.perf_counter() - BOOT_STARTED) * 1000, 1)}
+
+@app.before_request
+def ensure_background_services():
+    """Fallback for servers without a worker-init hook (gunicorn.conf.py starts them at worker boot)"""
+    if _initialized_pid != os.getpid():
+        initialize_application()
+
 # ==================== MAIN APPLICATION STARTUP ====================
 
 if __name__ == "__main__":
@@ -5623,10 +6381,7 @@ if __name__ == "__main__":
     print(f"   • HubSpot CRM: {'✅ Ready' if hubspot_api_token else '⚠️ Disabled'}")
     
     print("\n🗄️ DATABASE STATUS:")
-    # Test PostgreSQL connection via CRM API
-    crm_connected = init_crm_connection()
-    print(f"   • PostgreSQL (CRM API): {'✅ Connected' if crm_connected else '❌ Connection Failed'}")
-    print(f"   • CRM API Endpoint: {CRM_BASE_URL}")
+    print(f"   • CRM API Endpoint: {CRM_BASE_URL} (connectivity is logged once the worker is up)")
     
     print("\n🌐 ACCESS URLS:")
     print("   • Voice Interface: http://localhost:5000")
@@ -5637,6 +6392,8 @@ if __name__ == "__main__":
     print("   • Health Check: http://localhost:5000/health")
     print("\n" + "="*70)
     
+    initialize_application()
+    
     # Start the application
     port = int(os.environ.get("PORT", 5000))
     app.run(debug=False, host='0.0.0.0', port=port)
@@ -0,0 +1,79 @@
+"""
+Asset pipeline for RinglyPro Voice Assistant
+Splits the inline <script>/<style> blocks of the UI templates into content-hashed assets that browsers
+cache for a year, so repeat visits only fetch the small HTML shell
+"""
+
+import hashlib
+import logging
+import re
+from typing import Optional, Dict, Any
+
+from page_cache import PrecompressedPage
+
+logger = logging.getLogger(__name__)
+
+# Inline blocks only: scripts that already load from a src, or carry data (JSON etc.), stay in the page
+_INLINE_BLOCK = re.compile(r"<(script|style)(\s[^>]*)?>(.*?)</\1\s*>", re.S | re.I)
+_SRC_ATTR = re.compile(r"\bsrc\s*=", re.I)
+_TYPE_ATTR = re.compile(r"\btype\s*=\s*[\"']?([^\"'\s>]*)", re.I)
+_CODE_TYPES = frozenset({"text/javascript", "text/css", "module"})
+
+CONTENT_TYPES = {
+    "js": "application/javascript; charset=utf-8",
+    "css": "text/css; charset=utf-8"
+}
+
+
+class StaticAsset(PrecompressedPage):
+    """A fingerprinted JS/CSS file in every supported encoding"""
+
+    def __init__(self, filename: str, text: str, content_type: str):
+        super().__init__(text)
+        self.filename = filename
+        self.content_type = content_type
+
+
+class AssetPipeline:
+    """Rewrites pages to reference extracted assets and keeps those assets for serving under url_prefix"""
+
+    def __init__(self, url_prefix: str = "/static/assets"):
+        self.url_prefix = url_prefix.rstrip("/")
+        self._assets = {}
+        self.hits = 0
+        self.not_modified = 0
+
+    def extract(self, page_name: str, html: str) -> str:
+        """Return the page with each inline block replaced by a reference to its hashed asset"""
+        def replace(match):
+            tag, attrs, content = match.group(1).lower(), match.group(2) or "", match.group(3)
+            declared_type = _TYPE_ATTR.search(attrs)
+            if (_SRC_ATTR.search(attrs) or not content.strip()
+                    or (declared_type and declared_type.group(1).lower() not in _CODE_TYPES)):
+                return match.group(0)
+
+            extension = "js" if tag == "script" else "css"
+            digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+            filename = f"{page_name}.{digest}.{extension}"
+            if filename not in self._assets:
+                self._assets[filename] = StaticAsset(filename, content, CONTENT_TYPES[extension])
+
+            url = f"{self.url_prefix}/{filename}"
+            if tag == "script":
+                return f'<script src="{url}"{attrs}></script>'
+            return f'<link rel="stylesheet" href="{url}"{attrs}>'
+
+        shell = _INLINE_BLOCK.sub(replace, html)
+        logger.info(f"Extracted assets for '{page_name}': HTML {len(html) // 1024} KB -> {len(shell) // 1024} KB")
+        return shell
+
+    def get(self, filename: str) -> Optional[StaticAsset]:
+        return self._assets.get(filename)
+
+    def stats(self) -> Dict[str, Any]:
+        """Asset sizes and request counters for health reporting"""
+        return {
+            "assets": {filename: len(asset.variants["identity"][1]) for filename, asset in self._assets.items()},
+            "hits": self.hits,
+            "not_modified": self.not_modified
+        }
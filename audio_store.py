@@ -0,0 +1,271 @@
+"""
+TTL'd audio store for RinglyPro Voice Assistant
+Hot clips are served from memory, every clip is mirrored to disk for other workers,
+and a background janitor expires old files and enforces a total size cap; pinned clips
+live in a subdirectory the janitor never sweeps, so every worker sees the pin
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from typing import Optional, Dict, Any
+
+from tts_cache import TTSAudioCache
+
+logger = logging.getLogger(__name__)
+
+_KEY_RE = re.compile(r"^[0-9a-f]{16,64}$")
+
+
+class AudioStore:
+    """Two-tier (memory + disk) MP3 store with access-based TTL"""
+
+    def __init__(self, directory: str, memory: TTSAudioCache, ttl_seconds: int = 3600,
+                 max_disk_bytes: int = 256 * 1024 * 1024, janitor_interval: int = 60):
+        self.directory = directory
+        self.memory = memory
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_bytes = max_disk_bytes
+        self.janitor_interval = janitor_interval
+
+        self._pinned = set()
+        self._last_access = {}
+        self._lock = threading.Lock()
+        self._janitor = None
+        self.expired = 0
+        self.trimmed = 0
+
+        self.pinned_directory = os.path.join(directory, "pinned")
+        os.makedirs(self.pinned_directory, exist_ok=True)
+
+    @staticmethod
+    def is_valid_key(key: str) -> bool:
+        return bool(_KEY_RE.match(key or ""))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.mp3")
+
+    def _pinned_path(self, key: str) -> str:
+        return os.path.join(self.pinned_directory, f"{key}.mp3")
+
+    def _write(self, path: str, audio: bytes) -> bool:
+        # Write to a temp name first so a concurrent reader never sees a partial file; temp files stay in
+        # the swept directory so the janitor cleans up after a crashed writer
+        temp_path = os.path.join(self.directory, f"{os.path.basename(path)}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(audio)
+            os.replace(temp_path, path)
+            return True
+        except OSError as e:
+            logger.warning(f"Audio store disk write failed for {path}: {e}")
+            return False
+
+    def _touch(self, key: str, now: float):
+        """Record an access, refreshing the file's mtime at most every half TTL"""
+        with self._lock:
+            previous = self._last_access.get(key, 0)
+            self._last_access[key] = now
+        if now - previous > self.ttl_seconds / 2:
+            try:
+                os.utime(self._path(key), (now, now))
+            except OSError:
+                pass
+
+    def _is_expired(self, key: str, now: float) -> bool:
+        with self._lock:
+            if key in self._pinned:
+                return False
+            last_access = self._last_access.get(key)
+        return last_access is not None and now - last_access > self.ttl_seconds
+
+    def put(self, key: str, audio: bytes, pinned: bool = False):
+        """Store a clip in memory and on disk; pinned clips never expire"""
+        now = time.time()
+        self.memory.put(key, audio)
+        with self._lock:
+            self._last_access[key] = now
+            if pinned:
+                self._pinned.add(key)
+
+        self._write(self._pinned_path(key) if pinned else self._path(key), audio)
+
+    def pin(self, key: str):
+        """Keep an already stored clip forever by moving its file out of the swept directory"""
+        with self._lock:
+            self._pinned.add(key)
+        if os.path.exists(self._pinned_path(key)):
+            return
+        try:
+            os.replace(self._path(key), self._pinned_path(key))
+        except OSError:
+            # Only this worker's memory has it (or another worker is pinning it right now)
+            audio = self.memory.get(key)
+            if audio is not None and not os.path.exists(self._pinned_path(key)):
+                self._write(self._pinned_path(key), audio)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return a clip from memory, falling back to disk; repeated reads are fine"""
+        if not self.is_valid_key(key):
+            return None
+
+        now = time.time()
+        audio = None
+        if self._is_expired(key, now):
+            self.memory.discard(key)
+        else:
+            audio = self.memory.get(key)
+
+        if audio is None:
+            audio = self._read_disk(key, now)
+            if audio is None:
+                return None
+            self.memory.put(key, audio)
+
+        self._touch(key, now)
+        return audio
+
+    def exists(self, key: str) -> bool:
+        """Whether get() would find the clip, checked without reading it; counts as an access"""
+        if not self.is_valid_key(key):
+            return False
+
+        now = time.time()
+        found = not self._is_expired(key, now) and self.memory.peek(key) is not None
+        if not found:
+            if os.path.exists(self._pinned_path(key)):
+                with self._lock:
+                    self._pinned.add(key)
+                found = True
+            else:
+                try:
+                    found = now - os.stat(self._path(key)).st_mtime <= self.ttl_seconds
+                except OSError:
+                    found = False
+
+        if found:
+            self._touch(key, now)
+        return found
+
+    def _read_disk(self, key: str, now: float) -> Optional[bytes]:
+        # Another worker may have written, refreshed or pinned the file since our last access
+        try:
+            with open(self._pinned_path(key), "rb") as f:
+                audio = f.read()
+            with self._lock:
+                self._pinned.add(key)
+            return audio
+        except OSError:
+            pass
+        path = self._path(key)
+        try:
+            if now - os.stat(path).st_mtime > self.ttl_seconds:
+                return None
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def discard(self, key: str):
+        """Remove a clip from both tiers"""
+        self.memory.discard(key)
+        with self._lock:
+            self._last_access.pop(key, None)
+            self._pinned.discard(key)
+        self._remove_file(self._path(key))
+        self._remove_file(self._pinned_path(key))
+
+    def sweep(self):
+        """Expire clips idle past the TTL, then trim the oldest files over the disk cap"""
+        now = time.time()
+
+        with self._lock:
+            idle_keys = [key for key, last_access in self._last_access.items()
+                         if key not in self._pinned and now - last_access > self.ttl_seconds]
+            for key in idle_keys:
+                del self._last_access[key]
+        for key in idle_keys:
+            self.memory.discard(key)
+
+        files = []
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError as e:
+            logger.warning(f"Audio store sweep failed: {e}")
+            return
+
+        for entry in entries:
+            if not entry.name.endswith(".mp3"):
+                # Leftover temp files from a crashed writer
+                if entry.name.endswith(".tmp") and now - entry.stat().st_mtime > self.ttl_seconds:
+                    self._remove_file(entry.path)
+                continue
+
+            key = entry.name[:-len(".mp3")]
+            stat = entry.stat()
+            if now - stat.st_mtime > self.ttl_seconds:
+                self._remove_file(entry.path)
+                self.memory.discard(key)
+                self.expired += 1
+            else:
+                files.append((stat.st_mtime, stat.st_size, key, entry.path))
+
+        total_bytes = sum(size for _, size, _, _ in files)
+        for mtime, size, key, path in sorted(files):
+            if total_bytes <= self.max_disk_bytes:
+                break
+            self._remove_file(path)
+            self.memory.discard(key)
+            total_bytes -= size
+            self.trimmed += 1
+
+    @staticmethod
+    def _remove_file(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _janitor_loop(self):
+        while True:
+            time.sleep(self.janitor_interval)
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error(f"Audio store janitor error: {e}")
+
+    def start_janitor(self):
+        """Start the background sweep thread once per process"""
+        if self._janitor and self._janitor.is_alive():
+            return self._janitor
+        self._janitor = threading.Thread(target=self._janitor_loop, name="audio-store-janitor", daemon=True)
+        self._janitor.start()
+        return self._janitor
+
+    def stats(self) -> Dict[str, Any]:
+        """Memory tier counters plus disk usage"""
+        disk_files = 0
+        disk_bytes = 0
+        pinned = 0
+        for directory in (self.directory, self.pinned_directory):
+            try:
+                for entry in os.scandir(directory):
+                    if entry.name.endswith(".mp3"):
+                        disk_files += 1
+                        disk_bytes += entry.stat().st_size
+                        pinned += directory == self.pinned_directory
+            except OSError:
+                pass
+
+        return {
+            "memory": self.memory.stats(),
+            "disk_files": disk_files,
+            "disk_bytes": disk_bytes,
+            "max_disk_bytes": self.max_disk_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "pinned": pinned,
+            "expired": self.expired,
+            "trimmed": self.trimmed
+        }
@@ -0,0 +1,1100 @@
+#!/usr/bin/env python3
+"""
+Latency benchmarks for RinglyPro Voice Assistant
+Runs against local stub upstreams - no API keys or network access needed
+"""
+
+import datetime
+import json
+import os
+import re
+import sys
+import time
+import threading
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+# app.py refuses to import without a Claude key; benchmarks never call Claude
+os.environ.setdefault("ANTHROPIC_API_KEY", "benchmark")
+os.environ.setdefault("ELEVENLABS_API_KEY", "benchmark")
+os.environ.setdefault("AUDIO_STREAM_SECRET", "benchmark")
+
+
+def start_stub_server(handler_class):
+    """Start a threaded HTTP server on a free local port and return (server, base_url)"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+    server.client_ports = set()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    return server, f"http://{host}:{port}"
+
+
+def load_app():
+    """Import the Flask app with benchmark-safe settings"""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import app as ringlypro_app
+    # Benchmarks talk to local stubs; keep the worker's background services (crawler, prompt
+    # warm-up, CRM probe) from starting on the first test-client request
+    ringlypro_app._initialized_pid = os.getpid()
+    return ringlypro_app
+
+
+# ==================== STUB UPSTREAMS ====================
+
+class ElevenLabsStubHandler(BaseHTTPRequestHandler):
+    """Mimics ElevenLabs synthesis: /stream sends chunks as they are 'rendered', the plain endpoint waits for all of them"""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    chunk_count = 10
+    chunk_delay = 0.1
+    chunk_size = 4096
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.client_ports.add(self.client_address[1])
+        chunk = b"\xff\xfb" + b"\x00" * (self.chunk_size - 2)
+
+        if urlsplit(self.path).path.endswith("/stream"):
+            self.send_response(200)
+            self.send_header("Content-Type", "audio/mpeg")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for _ in range(self.chunk_count):
+                time.sleep(self.chunk_delay)
+                self.wfile.write(f"{len(chunk):X}\r\n".encode() + chunk + b"\r\n")
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            time.sleep(self.chunk_delay * self.chunk_count)
+            body = chunk * self.chunk_count
+            self.send_response(200)
+            self.send_header("Content-Type", "audio/mpeg")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class WebsiteStubHandler(BaseHTTPRequestHandler):
+    """Mimics a slow marketing site: a home page linking to a few content pages"""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    delay = 0.3
+    pages = {
+        "/": "<h1>RinglyPro</h1><p>AI receptionist for small businesses.</p>"
+             "<a href='/features'>Features</a> <a href='/pricing'>Pricing</a>",
+        "/features": "<p>RinglyPro answers every call around the clock, books appointments into your calendar "
+                     "and sends text message confirmations to your customers automatically.</p>",
+        "/pricing": "<p>Plans start with a starter tier for solo owners and scale to professional and premium tiers "
+                    "with more minutes, CRM integrations and priority support.</p>"
+    }
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        page = self.pages.get(urlsplit(self.path).path)
+        body = f"<html><body>{page}</body></html>".encode() if page else b"not found"
+        self.send_response(200 if page else 404)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class CRMStubHandler(BaseHTTPRequestHandler):
+    """Mimics the CRM API: JSON responses after `latency`, a hung upstream while `down` is set,
+    and a /batch call-event endpoint unless `supports_batch` is off"""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    down = False
+    hang_seconds = 1.0
+    latency = 0.0
+    supports_batch = True
+    received = []
+
+    def _respond(self):
+        raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.client_ports.add(self.client_address[1])
+        if self.down:
+            time.sleep(self.hang_seconds)
+        time.sleep(self.latency)
+
+        status = 200
+        if raw:
+            payload = json.loads(raw)
+            if urlsplit(self.path).path.endswith("/batch"):
+                if self.supports_batch:
+                    self.received.extend(payload.get("events", []))
+                else:
+                    status = 404
+            else:
+                self.received.append(payload)
+
+        body = b'{"success": true}'
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up waiting, which is the point of the outage scenario
+            pass
+
+    do_GET = do_POST = do_PUT = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TwilioStubHandler(BaseHTTPRequestHandler):
+    """Mimics the Twilio Messages API: answers each create with a message SID after `latency`"""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.0
+    received = []
+
+    def do_POST(self):
+        raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.client_ports.add(self.client_address[1])
+        time.sleep(self.latency)
+        self.received.append(raw)
+
+        body = json.dumps({"sid": f"SM{len(self.received):032d}", "status": "queued"}).encode()
+        self.send_response(201)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class SMTPStubHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP server in the spirit of aiosmtpd's Sink: greets after `handshake_delay` (standing in
+    for TCP + STARTTLS setup), accepts any AUTH PLAIN, swallows messages, and hangs up after `drop_after`"""
+    handshake_delay = 0.0
+    drop_after = None
+    messages = []
+    sessions = 0
+
+    def _reply(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        SMTPStubHandler.sessions += 1
+        time.sleep(self.handshake_delay)
+        self._reply("220 stub ESMTP")
+        received = 0
+        while True:
+            line = self.rfile.readline().decode(errors="replace").strip()
+            command = line.split(" ", 1)[0].upper()
+            if not line or command == "QUIT":
+                if line:
+                    self._reply("221 bye")
+                return
+            if command == "EHLO":
+                self._reply("250-stub")
+                self._reply("250 AUTH PLAIN")
+            elif command == "AUTH":
+                self._reply("235 authenticated")
+            elif command == "DATA":
+                self._reply("354 go ahead")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                self.messages.append(time.monotonic())
+                received += 1
+                self._reply("250 queued")
+                if self.drop_after and received >= self.drop_after:
+                    return
+            else:
+                self._reply("250 ok")
+
+
+# ==================== BENCHMARKS ====================
+
+def bench_streaming_tts():
+    """Compare time-to-first-audio for buffered vs streaming Rachel synthesis"""
+    print("\n🎵 Streaming TTS pass-through (stub ElevenLabs: "
+          f"{ElevenLabsStubHandler.chunk_count} chunks x {ElevenLabsStubHandler.chunk_delay * 1000:.0f} ms)")
+
+    ringlypro_app = load_app()
+    server, base_url = start_stub_server(ElevenLabsStubHandler)
+    ringlypro_app.tts_client.base_url = base_url
+    client = ringlypro_app.app.test_client()
+    handler = ringlypro_app.PhoneCallHandler()
+    handler.elevenlabs_api_key = "benchmark"
+
+    try:
+        # Buffered: webhook waits for the whole clip, then Twilio fetches it
+        ringlypro_app.TTS_STREAMING_ENABLED = False
+        started = time.perf_counter()
+        audio_url = handler.generate_rachel_audio(f"Buffered benchmark clip {time.time()}")
+        webhook_done = time.perf_counter()
+        response = client.get(urlsplit(audio_url).path, buffered=False)
+        first_chunk = next(iter(response.response))
+        buffered_first = time.perf_counter() - started
+        response.close()
+        print(f"   • Buffered:  webhook {(webhook_done - started) * 1000:7.1f} ms | "
+              f"first audio {buffered_first * 1000:7.1f} ms")
+
+        # Streaming: webhook returns a stream URL, audio flows as ElevenLabs renders it
+        ringlypro_app.TTS_STREAMING_ENABLED = True
+        started = time.perf_counter()
+        stream_url = handler.generate_rachel_audio(f"Streaming benchmark clip {time.time()}")
+        webhook_done = time.perf_counter()
+        parts = urlsplit(stream_url)
+        response = client.get(f"{parts.path}?{parts.query}", buffered=False)
+        chunks = iter(response.response)
+        first_chunk = next(chunks)
+        streaming_first = time.perf_counter() - started
+        total_bytes = len(first_chunk) + sum(len(chunk) for chunk in chunks)
+        streaming_done = time.perf_counter() - started
+        response.close()
+        print(f"   • Streaming: webhook {(webhook_done - started) * 1000:7.1f} ms | "
+              f"first audio {streaming_first * 1000:7.1f} ms | "
+              f"complete {streaming_done * 1000:7.1f} ms ({total_bytes} bytes)")
+        return streaming_first < buffered_first
+    finally:
+        ringlypro_app.TTS_STREAMING_ENABLED = False
+        server.shutdown()
+
+
+def bench_pooled_tts_client(requests_count=50):
+    """Compare fresh-connection ElevenLabs calls against the pooled keep-alive client"""
+    print(f"\n🔌 Pooled TTS client ({requests_count} sequential synthesis calls)")
+
+    import requests
+    from tts_client import ElevenLabsClient, RACHEL_VOICE_ID
+
+    ElevenLabsStubHandler.chunk_delay, previous_delay = 0.0, ElevenLabsStubHandler.chunk_delay
+    server, base_url = start_stub_server(ElevenLabsStubHandler)
+
+    try:
+        # Old path: a bare requests.post per utterance
+        started = time.perf_counter()
+        for i in range(requests_count):
+            requests.post(
+                f"{base_url}/v1/text-to-speech/{RACHEL_VOICE_ID}",
+                json={"text": f"utterance {i}"},
+                headers={"xi-api-key": "benchmark"},
+                timeout=10
+            )
+        fresh_elapsed = time.perf_counter() - started
+        fresh_connections = len(server.client_ports)
+
+        server.client_ports.clear()
+        client = ElevenLabsClient("benchmark", base_url=base_url)
+        started = time.perf_counter()
+        for i in range(requests_count):
+            client.synthesize(f"utterance {i}")
+        pooled_elapsed = time.perf_counter() - started
+        pooled_connections = len(server.client_ports)
+
+        print(f"   • requests.post: {fresh_elapsed * 1000 / requests_count:6.2f} ms/call, "
+              f"{fresh_connections} connections")
+        print(f"   • Pooled client: {pooled_elapsed * 1000 / requests_count:6.2f} ms/call, "
+              f"{pooled_connections} connections")
+        return pooled_connections < fresh_connections
+    finally:
+        ElevenLabsStubHandler.chunk_delay = previous_delay
+        server.shutdown()
+
+
+def bench_parallel_utterances():
+    """Compare sequential vs pooled synthesis of a two-utterance phone response"""
+    print("\n🔀 Parallel utterance synthesis (2 uncached utterances)")
+
+    ringlypro_app = load_app()
+    server, base_url = start_stub_server(ElevenLabsStubHandler)
+    ringlypro_app.tts_client.base_url = base_url
+    handler = ringlypro_app.PhoneCallHandler()
+    handler.elevenlabs_api_key = "benchmark"
+
+    try:
+        texts = [f"Sequential answer {time.time()}", f"Sequential follow-up {time.time()}"]
+        started = time.perf_counter()
+        for text in texts:
+            handler.generate_rachel_audio(text)
+        sequential = time.perf_counter() - started
+
+        texts = [f"Parallel answer {time.time()}", f"Parallel follow-up {time.time()}"]
+        started = time.perf_counter()
+        urls = handler.generate_rachel_audio_many(texts)
+        parallel = time.perf_counter() - started
+
+        print(f"   • Sequential: {sequential * 1000:7.1f} ms")
+        print(f"   • Parallel:   {parallel * 1000:7.1f} ms ({sum(1 for url in urls if url)}/{len(urls)} clips)")
+        return parallel < sequential
+    finally:
+        server.shutdown()
+
+
+def bench_faq_retrieval(queries_per_size=200):
+    """Compare difflib fuzzy matching with the FAQ index at today's size and at 10k entries"""
+    print("\n📚 FAQ retrieval (difflib.get_close_matches vs FAQIndex)")
+
+    import random
+    from difflib import get_close_matches
+    from faq_index import FAQIndex
+
+    ringlypro_app = load_app()
+    rng = random.Random(42)
+    questions = list(ringlypro_app.FAQ_BRAIN)
+
+    faster = True
+    for size in (len(questions), 10000):
+        # Synthetic entries look like client FAQs: an existing question about one of the client's own services
+        faq = dict(ringlypro_app.FAQ_BRAIN)
+        while len(faq) < size:
+            words = rng.choice(questions).rstrip("?").split()
+            words.insert(rng.randrange(len(words) + 1), f"service{rng.randrange(size // 3)}")
+            faq[" ".join(words) + "?"] = "synthetic answer"
+        queries = [rng.choice(questions) for _ in range(queries_per_size // 2)]
+        queries += [rng.choice(list(faq)).lower() for _ in range(queries_per_size // 2)]
+
+        started = time.perf_counter()
+        index = FAQIndex(faq)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        # difflib is far too slow at 10k to run every query; a sample is enough for the per-query cost
+        difflib_queries = queries if size < 1000 else queries[:10]
+        started = time.perf_counter()
+        for query in difflib_queries:
+            get_close_matches(query, faq.keys(), n=1, cutoff=0.6)
+        difflib_ms = (time.perf_counter() - started) * 1000 / len(difflib_queries)
+
+        started = time.perf_counter()
+        for query in queries:
+            index.best_match(query)
+        index_ms = (time.perf_counter() - started) * 1000 / len(queries)
+
+        print(f"   • {size:>6} entries: difflib {difflib_ms:8.3f} ms/query | "
+              f"index {index_ms:6.3f} ms/query (built in {build_ms:.0f} ms)")
+        faster = faster and index_ms < difflib_ms
+
+    return faster
+
+
+def bench_faq_miss(requests_count=10):
+    """Compare a live website scrape per FAQ miss with a lookup in the crawled site index"""
+    print(f"\n🌐 FAQ miss fallback (stub website: {WebsiteStubHandler.delay * 1000:.0f} ms per page)")
+
+    import tempfile
+    import requests
+    from bs4 import BeautifulSoup
+    from site_index import SiteKnowledgeIndex
+
+    server, base_url = start_stub_server(WebsiteStubHandler)
+    query = "do you send text message confirmations"
+
+    try:
+        # Old path: fetch and parse the home page inside the request
+        started = time.perf_counter()
+        for _ in range(requests_count):
+            response = requests.get(f"{base_url}/", timeout=5)
+            BeautifulSoup(response.content, "html.parser").get_text()
+        scrape_ms = (time.perf_counter() - started) * 1000 / requests_count
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            index = SiteKnowledgeIndex(f"{base_url}/", os.path.join(cache_dir, "site_index.json"))
+            started = time.perf_counter()
+            index.refresh()
+            crawl_ms = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            for _ in range(requests_count):
+                match = index.lookup(query)
+            lookup_ms = (time.perf_counter() - started) * 1000 / requests_count
+
+        print(f"   • Live scrape:  {scrape_ms:8.2f} ms/miss (no answer extracted)")
+        print(f"   • Index lookup: {lookup_ms:8.3f} ms/miss | background crawl {crawl_ms:.0f} ms "
+              f"({index.stats()['passages']} passages) | match: {match['url'] if match else None}")
+        return lookup_ms < scrape_ms and match is not None
+    finally:
+        server.shutdown()
+
+
+def bench_intent_router(repeats=200):
+    """Compare the compiled intent routers with the any(keyword in text) chains they replaced"""
+    print("\n🧭 Intent routing (keyword chains vs compiled router)")
+
+    ringlypro_app = load_app()
+    routers = [ringlypro_app.PHONE_MENU_ROUTER, ringlypro_app.PRICING_FOLLOWUP_ROUTER,
+               ringlypro_app.CHAT_ROUTER, ringlypro_app.VOICE_ROUTER]
+    utterances = [question for question in ringlypro_app.FAQ_BRAIN] + [
+        "i'd like to book an appointment for tomorrow", "can i talk to a representative please",
+        "yes please", "what does the starter plan cost", "i want to subscribe today",
+        "hi there i run a small dental office and want to know more about what you do"
+    ]
+
+    def chain(router, text):
+        for intent, _, keywords in router.rules:
+            if any(keyword in text for keyword in keywords):
+                return intent
+        return None
+
+    mismatches = [(text, chain(router, text), router.intent(text))
+                  for router in routers for text in utterances
+                  if chain(router, text) != router.intent(text)]
+
+    started = time.perf_counter()
+    for _ in range(repeats):
+        for router in routers:
+            for text in utterances:
+                chain(router, text)
+    chain_us = (time.perf_counter() - started) * 1e6 / (repeats * len(routers) * len(utterances))
+
+    timings = {}
+    for label, classify in (("intent", lambda router, text: router.intent(text)),
+                            ("classify", lambda router, text: router.classify(text))):
+        started = time.perf_counter()
+        for _ in range(repeats):
+            for router in routers:
+                for text in utterances:
+                    classify(router, text)
+        timings[label] = (time.perf_counter() - started) * 1e6 / (repeats * len(routers) * len(utterances))
+    router_us = timings["intent"]
+
+    print(f"   • Keyword chains:  {chain_us:6.2f} µs/utterance")
+    print(f"   • Compiled router: {router_us:6.2f} µs/utterance ({timings['classify']:.2f} µs with matched spans)")
+    print(f"   • Intent agreement: {len(routers) * len(utterances) - len(mismatches)}/{len(routers) * len(utterances)}")
+    for text, expected, actual in mismatches[:5]:
+        print(f"     ↳ {text!r}: chain={expected} router={actual}")
+    return router_us < chain_us and not mismatches
+
+
+def bench_crm_outage(calls=20, timeout=0.2):
+    """Compare webhook time spent on a hung CRM with bare requests vs the breaker-guarded client"""
+    print(f"\n🧯 CRM outage ({calls} webhook calls, {timeout * 1000:.0f} ms read timeout, CRM hung)")
+
+    import requests
+
+    ringlypro_app = load_app()
+    server, base_url = start_stub_server(CRMStubHandler)
+    CRMStubHandler.down = True
+
+    try:
+        # Old path: a bare request per call, each one waits out the full timeout
+        started = time.perf_counter()
+        for _ in range(calls):
+            try:
+                requests.post(f"{base_url}/api/calls/webhook", json={}, timeout=timeout)
+            except requests.exceptions.RequestException:
+                pass
+        bare_ms = (time.perf_counter() - started) * 1000
+
+        client = ringlypro_app.CRMAPIClient()
+        client.base_url = f"{base_url}/api"
+        client.timeout = (timeout, timeout)
+        started = time.perf_counter()
+        for _ in range(calls):
+            client._make_request('POST', '/calls/webhook', data={})
+        guarded_ms = (time.perf_counter() - started) * 1000
+        breaker = client.stats()["POST /calls/webhook"]["breaker"]
+
+        # Recovery: once the CRM answers again, the half-open probe closes the breaker
+        CRMStubHandler.down = False
+        client.breakers["POST /calls/webhook"].opened_at -= client.reset_timeout
+        recovered = client._make_request('POST', '/calls/webhook', data={}) is not None
+
+        print(f"   • Bare requests:   {bare_ms:7.0f} ms blocked")
+        print(f"   • Guarded client:  {guarded_ms:7.0f} ms blocked (breaker {breaker['state']} after "
+              f"{client.failure_threshold} failures, {breaker['rejected']} calls failed fast)")
+        print(f"   • Recovered after reset timeout: {recovered}")
+        return guarded_ms < bare_ms and recovered
+    finally:
+        CRMStubHandler.down = False
+        server.shutdown()
+
+
+def bench_call_event_queue(events=10, crm_delay=0.3):
+    """Compare webhook-side time for inline CRM call-event POSTs vs the background queue"""
+    print(f"\n📨 Call-event pipeline ({events} events, stub CRM webhook {crm_delay * 1000:.0f} ms)")
+
+    ringlypro_app = load_app()
+    server, base_url = start_stub_server(CRMStubHandler)
+    CRMStubHandler.down, CRMStubHandler.hang_seconds = True, crm_delay
+    previous_urls = ringlypro_app.CRM_WEBHOOK_URL, ringlypro_app.CRM_WEBHOOK_BATCH_URL
+    ringlypro_app.CRM_WEBHOOK_URL = f"{base_url}/api/calls/webhook/voice"
+    ringlypro_app.CRM_WEBHOOK_BATCH_URL = f"{base_url}/api/calls/webhook/voice/batch"
+    call_data = {'CallSid': 'CAbenchmark', 'From': '+15555550100', 'CallStatus': 'in-progress'}
+
+    try:
+        # Old path: the webhook thread waits for each POST
+        started = time.perf_counter()
+        for _ in range(events):
+            ringlypro_app.post_call_event(dict(call_data))
+        inline_ms = (time.perf_counter() - started) * 1000 / events
+
+        started = time.perf_counter()
+        for _ in range(events):
+            ringlypro_app.send_call_data_to_crm(call_data)
+        queued_ms = (time.perf_counter() - started) * 1000 / events
+        ringlypro_app.call_event_queue.flush(timeout=events * crm_delay * 2)
+        stats = ringlypro_app.call_event_queue.stats()
+
+        print(f"   • Inline POST: {inline_ms:8.2f} ms per webhook")
+        print(f"   • Queued:      {queued_ms:8.2f} ms per webhook "
+              f"(delivered {stats['sent']} in {stats['batches']} batches, dropped {stats['dropped']}, max queue wait {stats['max_wait_ms']:.0f} ms)")
+        return queued_ms < inline_ms
+    finally:
+        ringlypro_app.CRM_WEBHOOK_URL, ringlypro_app.CRM_WEBHOOK_BATCH_URL = previous_urls
+        CRMStubHandler.down, CRMStubHandler.hang_seconds = False, 1.0
+        server.shutdown()
+
+
+def bench_call_event_batching(calls=40, turns=5, crm_latency=0.02):
+    """Compare call-event throughput with single sends vs batched sends, checking per-call ordering"""
+    print(f"\n📦 Call-event batching ({calls} calls x {turns} events, stub CRM {crm_latency * 1000:.0f} ms/request)")
+
+    from call_events import CallEventQueue
+
+    ringlypro_app = load_app()
+    server, base_url = start_stub_server(CRMStubHandler)
+    CRMStubHandler.latency = crm_latency
+    previous_urls = ringlypro_app.CRM_WEBHOOK_URL, ringlypro_app.CRM_WEBHOOK_BATCH_URL
+    ringlypro_app.CRM_WEBHOOK_URL = f"{base_url}/api/calls/webhook/voice"
+    ringlypro_app.CRM_WEBHOOK_BATCH_URL = f"{base_url}/api/calls/webhook/voice/batch"
+
+    # Interleave turns of concurrent calls the way live traffic arrives
+    events = [{'CallSid': f"CA{call:04d}", 'SpeechResult': f"turn {turn}"}
+              for turn in range(turns) for call in range(calls)]
+
+    def run(batch_sender):
+        CRMStubHandler.received = []
+        event_queue = CallEventQueue(ringlypro_app.post_call_event, maxsize=len(events),
+                                     batch_sender=batch_sender, batch_window=0.05)
+        started = time.perf_counter()
+        for event in events:
+            event_queue.submit(dict(event))
+        event_queue.flush(timeout=60)
+        elapsed = time.perf_counter() - started
+
+        turns_seen = {}
+        for event in CRMStubHandler.received:
+            turns_seen.setdefault(event['CallSid'], []).append(event['SpeechResult'])
+        ordered = all(seen == sorted(seen) for seen in turns_seen.values()) and len(CRMStubHandler.received) == len(events)
+        return elapsed, event_queue.stats(), ordered
+
+    try:
+        single_elapsed, _, single_ordered = run(None)
+        batched_elapsed, batched_stats, batched_ordered = run(ringlypro_app.post_call_events_batch)
+        CRMStubHandler.supports_batch = False
+        fallback_elapsed, fallback_stats, fallback_ordered = run(ringlypro_app.post_call_events_batch)
+
+        print(f"   • Single sends: {len(events) / single_elapsed:8.0f} events/s (ordered: {single_ordered})")
+        print(f"   • Batched:      {len(events) / batched_elapsed:8.0f} events/s in {batched_stats['batches']} requests, "
+              f"avg {batched_stats['avg_batch_size']} events (ordered: {batched_ordered})")
+        print(f"   • No batch support: {len(events) / fallback_elapsed:4.0f} events/s, "
+              f"batching={fallback_stats['batching']} (ordered: {fallback_ordered})")
+        return batched_elapsed < single_elapsed and batched_ordered and fallback_ordered
+    finally:
+        ringlypro_app.CRM_WEBHOOK_URL, ringlypro_app.CRM_WEBHOOK_BATCH_URL = previous_urls
+        CRMStubHandler.latency, CRMStubHandler.supports_batch = 0.0, True
+        server.shutdown()
+
+
+def bench_slot_cache(picker_loads=30, concurrent=10, crm_latency=0.05):
+    """Compare uncached vs cached slot lookups for date-picker browsing and a burst of concurrent misses"""
+    print(f"\n📅 Available-slot cache (stub CRM {crm_latency * 1000:.0f} ms/request)")
+
+    from concurrent.futures import ThreadPoolExecutor
+    from slot_cache import SlotCache
+
+    ringlypro_app = load_app()
+    server, base_url = start_stub_server(CRMStubHandler)
+    CRMStubHandler.latency = crm_latency
+    previous = ringlypro_app.crm_client.base_url, ringlypro_app.slot_cache
+    ringlypro_app.crm_client.base_url = f"{base_url}/api"
+    dates = ["2030-01-07", "2030-01-08", "2030-01-09"]
+    manager = ringlypro_app.AppointmentManager()
+
+    def browse(lookup):
+        CRMStubHandler.received = []
+        started = time.perf_counter()
+        for i in range(picker_loads):
+            lookup(dates[i % len(dates)])
+        browse_ms = (time.perf_counter() - started) * 1000 / picker_loads
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrent) as pool:
+            list(pool.map(lookup, ["2030-01-10"] * concurrent))
+        burst_ms = (time.perf_counter() - started) * 1000
+        return browse_ms, burst_ms, len(CRMStubHandler.received)
+
+    try:
+        uncached = browse(lambda date: manager._fetch_available_slots(date))
+        ringlypro_app.slot_cache = SlotCache(ttl_seconds=30)
+        cached = browse(manager.get_available_slots)
+
+        print(f"   • Uncached: {uncached[0]:6.2f} ms/picker load | burst of {concurrent} {uncached[1]:6.1f} ms | "
+              f"{uncached[2]} CRM calls")
+        print(f"   • Cached:   {cached[0]:6.2f} ms/picker load | burst of {concurrent} {cached[1]:6.1f} ms | "
+              f"{cached[2]} CRM calls ({ringlypro_app.slot_cache.stats()['coalesced']} coalesced)")
+        return cached[0] < uncached[0] and cached[2] < uncached[2]
+    finally:
+        ringlypro_app.crm_client.base_url, ringlypro_app.slot_cache = previous
+        CRMStubHandler.latency = 0.0
+        server.shutdown()
+
+
+def bench_slot_range(days=14, crm_latency=0.05):
+    """Compare fetching two weeks of availability day by day vs one concurrent range request"""
+    print(f"\n🗓️  Multi-day availability ({days} days, stub CRM {crm_latency * 1000:.0f} ms/request)")
+
+    from slot_cache import SlotCache
+
+    ringlypro_app = load_app()
+    server, base_url = start_stub_server(CRMStubHandler)
+    CRMStubHandler.latency = crm_latency
+    previous = ringlypro_app.crm_client.base_url, ringlypro_app.slot_cache
+    ringlypro_app.crm_client.base_url = f"{base_url}/api"
+    client = ringlypro_app.app.test_client()
+    start = datetime.date(2030, 2, 4)
+    dates = [(start + datetime.timedelta(days=offset)).isoformat() for offset in range(days)]
+
+    try:
+        ringlypro_app.slot_cache = SlotCache(ttl_seconds=30)
+        started = time.perf_counter()
+        for date in dates:
+            client.post("/get-available-slots", json={"date": date})
+        serial_ms = (time.perf_counter() - started) * 1000
+
+        ringlypro_app.slot_cache = SlotCache(ttl_seconds=30)
+        started = time.perf_counter()
+        response = client.post("/get-available-slots-range", json={"start_date": dates[0], "days": days})
+        range_ms = (time.perf_counter() - started) * 1000
+        returned = len(response.get_json().get("days", {}))
+
+        print(f"   • Day by day: {serial_ms:7.1f} ms for {days} requests")
+        print(f"   • Range:      {range_ms:7.1f} ms for 1 request ({returned} days)")
+        return range_ms < serial_ms and returned == days
+    finally:
+        ringlypro_app.crm_client.base_url, ringlypro_app.slot_cache = previous
+        CRMStubHandler.latency = 0.0
+        server.shutdown()
+
+
+def bench_booking_confirmations(bookings=5, send_delay=0.3):
+    """Compare /book-appointment response time with inline confirmations vs the notification workers"""
+    print(f"\n✉️  Booking confirmations ({bookings} bookings, stub email + SMS {send_delay * 1000:.0f} ms each)")
+
+    import tempfile
+    from notifications import NotificationQueue
+
+    ringlypro_app = load_app()
+    server, base_url = start_stub_server(CRMStubHandler)
+    sent = []
+
+    def slow_send(appointment):
+        time.sleep(send_delay)
+        sent.append(appointment["confirmation_code"])
+        return True
+
+    class InlineSender:
+        """Old path: every channel is sent inside the request"""
+        def enqueue(self, confirmation_code, payload, channels):
+            return [channel for channel in channels if slow_send(payload)]
+
+    settings = ("email_user", "email_password", "twilio_account_sid", "twilio_auth_token", "twilio_phone")
+    previous = ({name: getattr(ringlypro_app, name) for name in settings},
+                ringlypro_app.crm_client.base_url, ringlypro_app.notification_queue)
+    for name in settings:
+        setattr(ringlypro_app, name, "benchmark")
+    ringlypro_app.crm_client.base_url = f"{base_url}/api"
+    client = ringlypro_app.app.test_client()
+    booking = {"name": "Bench Mark", "email": "bench@example.com", "phone": "5555550100",
+               "date": "2030-03-05", "time": "10:00"}
+
+    def book_all():
+        started = time.perf_counter()
+        codes = [client.post("/book-appointment", json=booking).get_json()["appointment"]["confirmation_code"]
+                 for _ in range(bookings)]
+        return (time.perf_counter() - started) * 1000 / bookings, codes
+
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            ringlypro_app.notification_queue = InlineSender()
+            inline_ms, _ = book_all()
+
+            sent.clear()
+            queue = NotificationQueue(f"{tmp}/notifications.db", {"email": slow_send, "sms": slow_send}, workers=2)
+            ringlypro_app.notification_queue = queue
+            queued_ms, codes = book_all()
+            deadline = time.monotonic() + 10
+            while len(sent) < 2 * bookings and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.05)
+            statuses = {channel["status"] for code in codes for channel in queue.status(code).values()}
+
+            print(f"   • Inline:  {inline_ms:7.1f} ms/booking")
+            print(f"   • Queued:  {queued_ms:7.1f} ms/booking ({len(sent)}/{2 * bookings} sent in background, "
+                  f"status {', '.join(sorted(statuses))})")
+            return queued_ms < inline_ms and statuses == {"sent"}
+        finally:
+            for name, value in previous[0].items():
+                setattr(ringlypro_app, name, value)
+            ringlypro_app.crm_client.base_url, ringlypro_app.notification_queue = previous[1:]
+            server.shutdown()
+
+
+def bench_smtp_pool(emails=40, handshake_delay=0.05):
+    """Compare confirmation-email throughput with a fresh SMTP login per email vs the warm pool"""
+    print(f"\n📧 SMTP connection pool ({emails} emails, stub handshake {handshake_delay * 1000:.0f} ms)")
+
+    import smtplib
+    from email.mime.text import MIMEText
+    from smtp_pool import SMTPConnectionPool
+
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), SMTPStubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    SMTPStubHandler.handshake_delay = handshake_delay
+
+    def message(i):
+        msg = MIMEText(f"Confirmation {i}")
+        msg["From"], msg["To"], msg["Subject"] = "bench@example.com", "customer@example.com", "Confirmation"
+        return msg
+
+    try:
+        # Old path: connect, login, send and quit for every email
+        SMTPStubHandler.messages, SMTPStubHandler.sessions = [], 0
+        started = time.perf_counter()
+        for i in range(emails):
+            smtp = smtplib.SMTP(host, port, timeout=5)
+            smtp.login("bench", "secret")
+            smtp.send_message(message(i))
+            smtp.quit()
+        fresh_s = time.perf_counter() - started
+        fresh_sessions = SMTPStubHandler.sessions
+
+        # The stub hangs up every 15 messages so the pool has to notice and reconnect
+        SMTPStubHandler.messages, SMTPStubHandler.sessions = [], 0
+        SMTPStubHandler.drop_after = 15
+        pool = SMTPConnectionPool(host, port, "bench", "secret", size=2, starttls=False, idle_check_after=0)
+        started = time.perf_counter()
+        for i in range(emails):
+            pool.send_message(message(i))
+        pooled_s = time.perf_counter() - started
+        delivered = len(SMTPStubHandler.messages)
+        stats = pool.stats()
+        pool.close()
+
+        print(f"   • Fresh connection: {emails / fresh_s:7.1f} emails/s ({fresh_sessions} SMTP sessions)")
+        print(f"   • Pooled:           {emails / pooled_s:7.1f} emails/s ({stats['connects']} SMTP sessions, "
+              f"{stats['retired']} retired after the server hung up, {delivered}/{emails} delivered)")
+        return pooled_s < fresh_s and delivered == emails
+    finally:
+        SMTPStubHandler.handshake_delay, SMTPStubHandler.drop_after = 0.0, None
+        server.shutdown()
+        server.server_close()
+
+
+def bench_sms_dispatch(messages=10, twilio_latency=0.15):
+    """Compare request-thread time for per-call Twilio clients vs the shared client behind the SMS dispatcher"""
+    print(f"\n💬 Outbound SMS ({messages} messages, stub Twilio {twilio_latency * 1000:.0f} ms/request)")
+
+    from twilio.rest import Client
+
+    ringlypro_app = load_app()
+    server, base_url = start_stub_server(TwilioStubHandler)
+    TwilioStubHandler.latency, TwilioStubHandler.received = twilio_latency, []
+    settings = ("twilio_account_sid", "twilio_auth_token", "twilio_phone")
+    previous = {name: getattr(ringlypro_app, name) for name in settings}, ringlypro_app._twilio_client
+    ringlypro_app.twilio_account_sid, ringlypro_app.twilio_auth_token = "ACbenchmark", "benchmark"
+    ringlypro_app.twilio_phone = "+15555550199"
+    ringlypro_app._twilio_client = None
+    ringlypro_app.get_twilio_client().api.base_url = base_url
+    recipients = [f"+1555555{1000 + i}" for i in range(messages)]
+
+    try:
+        # Old path: a new client (and TCP connection) per message, sent in the request thread
+        started = time.perf_counter()
+        for to in recipients:
+            client = Client("ACbenchmark", "benchmark")
+            client.api.base_url = base_url
+            client.messages.create(body="Thank you for calling RinglyPro!", from_="+15555550199", to=to)
+        inline_ms = (time.perf_counter() - started) * 1000
+        inline_connections = len(server.client_ports)
+
+        server.client_ports.clear()
+        TwilioStubHandler.received = []
+        started = time.perf_counter()
+        futures = [ringlypro_app.sms_dispatcher.submit(to, "Thank you for calling RinglyPro!", "+15555550199")
+                   for to in recipients]
+        # The caller hangs up and dials back; the same SMS must not go out twice
+        futures += [ringlypro_app.sms_dispatcher.submit(recipients[0], "Thank you for calling RinglyPro!",
+                                                        "+15555550199")]
+        request_ms = (time.perf_counter() - started) * 1000
+        sids = {future.result(timeout=30) for future in futures}
+        drained_ms = (time.perf_counter() - started) * 1000
+        stats = ringlypro_app.sms_dispatcher.stats()
+
+        print(f"   • Inline:     {inline_ms:7.1f} ms in request threads ({inline_connections} connections)")
+        print(f"   • Dispatcher: {request_ms:7.1f} ms in request threads, delivered in {drained_ms:.0f} ms "
+              f"({len(server.client_ports)} connections, {stats['throttled']} throttled, "
+              f"{stats['duplicates']} duplicate suppressed)")
+        return request_ms < inline_ms and len(sids) == messages == len(TwilioStubHandler.received)
+    finally:
+        for name, value in previous[0].items():
+            setattr(ringlypro_app, name, value)
+        ringlypro_app._twilio_client = previous[1]
+        server.shutdown()
+
+
+def bench_service_container(requests_count=2000):
+    """Compare per-request construction of AppointmentManager/PhoneCallHandler vs the worker's service container"""
+    print(f"\n🧩 Service container ({requests_count} simulated requests)")
+
+    import logging
+
+    ringlypro_app = load_app()
+    # Silence the HubSpot init line every construction logs
+    app_logger = logging.getLogger(ringlypro_app.__name__)
+    previous_level = app_logger.level
+    app_logger.setLevel(logging.CRITICAL)
+
+    try:
+        started = time.perf_counter()
+        for _ in range(requests_count):
+            ringlypro_app.AppointmentManager()
+            ringlypro_app.PhoneCallHandler()
+        per_request_us = (time.perf_counter() - started) * 1e6 / requests_count
+
+        container = ringlypro_app.ServiceContainer()
+        started = time.perf_counter()
+        for _ in range(requests_count):
+            container.appointments
+            container.phone
+        shared_us = (time.perf_counter() - started) * 1e6 / requests_count
+        built = container.stats()["built"]
+
+        print(f"   • Per request: {per_request_us:8.2f} µs/request (new HubSpot session + log line each)")
+        print(f"   • Container:   {shared_us:8.2f} µs/request (built once: {', '.join(built)})")
+        return shared_us < per_request_us
+    finally:
+        app_logger.setLevel(previous_level)
+
+
+def bench_ui_pages(loads=200):
+    """Compare per-request Jinja rendering of the voice UI vs the precompressed page cache"""
+    print(f"\n📄 UI page serving ({loads} loads of /)")
+
+    from flask import render_template_string
+
+    ringlypro_app = load_app()
+    client = ringlypro_app.app.test_client()
+
+    with ringlypro_app.app.test_request_context():
+        started = time.perf_counter()
+        for _ in range(loads):
+            html = render_template_string(ringlypro_app.VOICE_HTML_TEMPLATE)
+        render_ms = (time.perf_counter() - started) * 1000 / loads
+    raw_kb = len(html.encode("utf-8")) / 1024
+
+    started = time.perf_counter()
+    for _ in range(loads):
+        response = client.get("/", headers={"Accept-Encoding": "gzip, deflate, br"})
+    cached_ms = (time.perf_counter() - started) * 1000 / loads
+    sent_kb = len(response.data) / 1024
+
+    etag = response.headers["ETag"]
+    started = time.perf_counter()
+    for _ in range(loads):
+        revalidated = client.get("/", headers={"Accept-Encoding": "gzip, br", "If-None-Match": etag})
+    revalidate_ms = (time.perf_counter() - started) * 1000 / loads
+
+    print(f"   • Jinja per request: {render_ms:6.3f} ms/load, {raw_kb:6.1f} KB uncompressed")
+    print(f"   • Precompressed:     {cached_ms:6.3f} ms/load, {sent_kb:6.1f} KB "
+          f"({response.headers.get('Content-Encoding', 'identity')}, full request cycle)")
+    # First visit also fetches the fingerprinted JS/CSS; repeat visits reuse them from the browser cache
+    asset_urls = re.findall(r'(?:src|href)="(/static/assets/[^"]+)"', ringlypro_app.page_cache.get("voice")
+                            .variants["identity"][1].decode("utf-8"))
+    asset_kb = sum(len(client.get(url, headers={"Accept-Encoding": "gzip, br"}).data) for url in asset_urls) / 1024
+
+    print(f"   • Revalidated:       {revalidate_ms:6.3f} ms/load, {revalidated.status_code} with empty body")
+    print(f"   • First visit {sent_kb + asset_kb:5.1f} KB (shell + {len(asset_urls)} immutable assets), "
+          f"repeat visit {sent_kb:5.1f} KB")
+    return sent_kb < raw_kb and revalidated.status_code == 304
+
+
+class SlowConsole:
+    """Console sink that takes `delay` per write, like a log shipper's pipe under load"""
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    def write(self, text):
+        time.sleep(self.delay)
+
+    def flush(self):
+        pass
+
+
+def bench_logging_pipeline(requests_per_thread=50, threads=8, console_delay=0.0005):
+    """Compare chat request throughput with the old synchronous handlers vs the queued, sampled pipeline"""
+    print(f"\n🪵 Logging pipeline ({threads} threads x {requests_per_thread} /chat-enhanced requests, "
+          f"console {console_delay * 1000:.1f} ms/write)")
+
+    import logging
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+    from log_pipeline import LogPipeline, parse_sample_rates
+
+    ringlypro_app = load_app()
+    root = logging.getLogger()
+    previous_handlers, previous_level = list(root.handlers), root.level
+    client = ringlypro_app.app.test_client()
+
+    def throughput():
+        def worker(_):
+            for _ in range(requests_per_thread):
+                client.post("/chat-enhanced", json={"message": "How much does RinglyPro cost?"})
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(worker, range(threads)))
+        return threads * requests_per_thread / (time.perf_counter() - started)
+
+    def use(handlers):
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        for handler in handlers:
+            root.addHandler(handler)
+        root.setLevel(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            # Old setup: basicConfig's FileHandler + StreamHandler, written in the request thread
+            formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+            old_handlers = [logging.FileHandler(f"{tmp}/old.log"), logging.StreamHandler(SlowConsole(console_delay))]
+            for handler in old_handlers:
+                handler.setFormatter(formatter)
+            use(old_handlers)
+            old_rps = throughput()
+            for handler in old_handlers:
+                handler.close()
+
+            pipeline = LogPipeline(f"{tmp}/new.log", stream=SlowConsole(console_delay),
+                                   sample_rates=parse_sample_rates("ringlypro.hotpath=10"), queue_size=100000,
+                                   sample_scope=ringlypro_app.log_sampling_scope)
+            pipeline.install()
+            new_rps = throughput()
+            pipeline.stop()
+            stats = pipeline.stats()
+
+            print(f"   • Synchronous handlers: {old_rps:7.1f} requests/s")
+            print(f"   • Queue + sampling:     {new_rps:7.1f} requests/s ({stats['sampled_out']} hot-path lines "
+                  f"sampled out, {stats['dropped']} dropped)")
+            return new_rps > old_rps
+        finally:
+            use(previous_handlers)
+            root.setLevel(previous_level)
+
+
+def bench_metrics_recording(observations_per_thread=50000, threads=8):
+    """Compare recording a request's metrics under one shared lock vs into per-thread shards"""
+    print(f"\n📈 Metrics recording ({threads} threads x {observations_per_thread} requests)")
+
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from metrics import MetricsRegistry
+
+    class LockedRegistry(MetricsRegistry):
+        """The straightforward alternative: one registry-wide lock around every update"""
+
+        def __init__(self):
+            super().__init__()
+            self._update_lock = threading.Lock()
+
+        def inc(self, name, value=1, **labels):
+            with self._update_lock:
+                super().inc(name, value, **labels)
+
+        def observe(self, name, value, **labels):
+            with self._update_lock:
+                super().observe(name, value, **labels)
+
+    def record(registry):
+        def worker(index):
+            route = f"/route-{index % 4}"
+            for n in range(observations_per_thread):
+                registry.observe("ringlypro_http_request_duration_seconds", (n % 100) / 1000, route=route, method="GET")
+                registry.inc("ringlypro_http_requests_total", route=route, method="GET", status=200)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(worker, range(threads)))
+        elapsed = time.perf_counter() - started
+        return elapsed, registry
+
+    locked_elapsed, _ = record(LockedRegistry())
+    sharded_elapsed, sharded = record(MetricsRegistry())
+    total = threads * observations_per_thread
+
+    started = time.perf_counter()
+    exposition = sharded.render()
+    render_ms = (time.perf_counter() - started) * 1000
+
+    print(f"   • Shared lock:       {locked_elapsed / total * 1e6:5.2f} µs/request")
+    print(f"   • Per-thread shards: {sharded_elapsed / total * 1e6:5.2f} µs/request")
+    print(f"   • Scrape: {len(exposition.splitlines())} lines rendered in {render_ms:.2f} ms")
+    return sharded_elapsed < locked_elapsed
+
+
+BENCHMARKS = [
+    ("Streaming TTS", bench_streaming_tts),
+    ("Pooled TTS client", bench_pooled_tts_client),
+    ("Parallel utterances", bench_parallel_utterances),
+    ("FAQ retrieval", bench_faq_retrieval),
+    ("FAQ miss fallback", bench_faq_miss),
+    ("Intent routing", bench_intent_router),
+    ("CRM outage", bench_crm_outage),
+    ("Call-event pipeline", bench_call_event_queue),
+    ("Call-event batching", bench_call_event_batching),
+    ("Slot cache", bench_slot_cache),
+    ("Multi-day availability", bench_slot_range),
+    ("Booking confirmations", bench_booking_confirmations),
+    ("SMTP pool", bench_smtp_pool),
+    ("Outbound SMS", bench_sms_dispatch),
+    ("Service container", bench_service_container),
+    ("UI pages", bench_ui_pages),
+    ("Logging pipeline", bench_logging_pipeline),
+    ("Metrics recording", bench_metrics_recording),
+]
+
+
+def main():
+    """Run all benchmarks, or only those named on the command line"""
+    print("⏱️  RinglyPro Voice Assistant - Latency Benchmarks")
+    print("=" * 60)
+
+    selected = [arg.lower() for arg in sys.argv[1:]]
+    results = {}
+
+    for bench_name, bench_func in BENCHMARKS:
+        if selected and not any(name in bench_name.lower() for name in selected):
+            continue
+        try:
+            results[bench_name] = bench_func()
+        except Exception as e:
+            print(f"   ❌ {bench_name} benchmark failed: {e}")
+            results[bench_name] = False
+
+    print("\n" + "=" * 60)
+    for bench_name, result in results.items():
+        status = "✅ FASTER" if result else "❌ NO GAIN"
+        print(f"   {status} {bench_name}")
+
+    return all(results.values())
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,164 @@
+"""
+Asynchronous call-event pipeline for RinglyPro Voice Assistant
+Twilio webhooks enqueue CRM call events and return; a background worker delivers them,
+grouping events that arrive close together into one batched request
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# batch_sender outcome: the upstream refused this batch's contents; resend its events one by one
+BATCH_REJECTED = "rejected"
+
+
+class CallEventQueue:
+    """Bounded in-process queue drained by one worker thread so events keep their order"""
+
+    def __init__(self, sender: Callable[[Dict[str, Any]], bool], maxsize: int = 1000,
+                 batch_sender: Optional[Callable[[List[Dict[str, Any]]], Optional[Any]]] = None,
+                 batch_size: int = 20, batch_window: float = 0.25, batch_retry_seconds: float = 3600):
+        self.sender = sender
+        self.batch_sender = batch_sender
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.batch_retry_seconds = batch_retry_seconds
+        self._batch_disabled_at = None
+        self.maxsize = maxsize
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._worker = None
+        self._start_lock = threading.Lock()
+
+        self.enqueued = 0
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.batches = 0
+        self.batched_events = 0
+        self.rejected_batches = 0
+        self.high_water = 0
+        self.last_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def start(self):
+        """Start the worker once per process; called lazily so forked workers get their own thread"""
+        with self._start_lock:
+            if self._worker and self._worker.is_alive():
+                return self._worker
+            self._worker = threading.Thread(target=self._drain, name="call-event-worker", daemon=True)
+            self._worker.start()
+            return self._worker
+
+    def submit(self, event: Dict[str, Any]) -> bool:
+        """Queue an event without blocking; returns False and counts a drop when the queue is full"""
+        self.start()
+        try:
+            self._queue.put_nowait((time.monotonic(), event))
+        except queue.Full:
+            self.dropped += 1
+            logger.warning(f"Call event queue full ({self.maxsize}) - dropped event for {event.get('CallSid', 'Unknown')}")
+            return False
+
+        self.enqueued += 1
+        self.high_water = max(self.high_water, self._queue.qsize())
+        return True
+
+    @property
+    def batching(self) -> bool:
+        if not self.batch_sender:
+            return False
+        if self._batch_disabled_at is not None and time.monotonic() - self._batch_disabled_at > self.batch_retry_seconds:
+            # Probe again in case the CRM has since gained batch support
+            self._batch_disabled_at = None
+        return self._batch_disabled_at is None
+
+    def _next_batch(self) -> List[tuple]:
+        """Block for one event, then gather more until the window closes or the batch is full"""
+        batch = [self._queue.get()]
+        if not self.batching:
+            return batch
+
+        deadline = batch[0][0] + self.batch_window
+        while len(batch) < self.batch_size:
+            try:
+                remaining = deadline - time.monotonic()
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _deliver(self, events: List[Dict[str, Any]]):
+        # batch_sender returns True/False for a delivered/failed batch, BATCH_REJECTED when the
+        # upstream refused this batch (the events go out one by one, batching stays on), or None
+        # when the upstream has no batch support; batching then pauses and events go out one by one
+        if len(events) > 1 and self.batching:
+            result = self.batch_sender(events)
+            if result == BATCH_REJECTED:
+                self.rejected_batches += 1
+            elif result is not None:
+                self.batches += 1
+                self.batched_events += len(events)
+                if result:
+                    self.sent += len(events)
+                else:
+                    self.failed += len(events)
+                return
+            else:
+                self._batch_disabled_at = time.monotonic()
+                logger.warning("CRM webhook has no batch support - falling back to single call events")
+
+        # Sent one at a time, in queue order, so each CallSid's events stay in sequence
+        for event in events:
+            if self.sender(event):
+                self.sent += 1
+            else:
+                self.failed += 1
+
+    def _drain(self):
+        while True:
+            batch = self._next_batch()
+            wait_ms = (time.monotonic() - batch[0][0]) * 1000
+            self.last_wait_ms = wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+            try:
+                self._deliver([event for _, event in batch])
+            except Exception as e:
+                self.failed += len(batch)
+                logger.error(f"Call event delivery error: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def flush(self, timeout: float = 10) -> bool:
+        """Wait until every queued event has been handled, e.g. before shutdown"""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Depth, backpressure and delivery counters for health reporting"""
+        depth = self._queue.qsize()
+        return {
+            "depth": depth,
+            "capacity": self.maxsize,
+            "utilization": round(depth / self.maxsize, 3) if self.maxsize else 0.0,
+            "high_water": self.high_water,
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "batching": self.batching,
+            "batches": self.batches,
+            "avg_batch_size": round(self.batched_events / self.batches, 1) if self.batches else 0.0,
+            "rejected_batches": self.rejected_batches,
+            "last_wait_ms": round(self.last_wait_ms, 1),
+            "max_wait_ms": round(self.max_wait_ms, 1),
+            "worker_alive": bool(self._worker and self._worker.is_alive())
+        }
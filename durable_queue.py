@@ -0,0 +1,168 @@
+"""
+Durable job queue scaffolding for RinglyPro Voice Assistant
+SQLite (WAL) tables of jobs that are leased, retried with exponential backoff, dead-lettered after
+max_attempts and pruned after a retention window; shared by the CRM outbox and the notification queue
+"""
+
+import abc
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional, List
+
+logger = logging.getLogger(__name__)
+
+
+class DurableQueue(abc.ABC):
+    """Abstract base for SQLite-backed job tables; subclasses supply the schema, the pending condition and how rows finish"""
+
+    TABLE = ""
+    SCHEMA = ""
+    # SQL condition selecting rows that still need delivering
+    PENDING = ""
+
+    def __init__(self, path: str, workers: int = 1, thread_name: str = "durable-queue", max_attempts: int = 5,
+                 retry_base: float = 30, max_backoff: float = 3600, poll_interval: float = 5,
+                 lease_seconds: float = 60, retention_days: float = 7):
+        self.path = path
+        self.workers = workers
+        self.thread_name = thread_name
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.max_backoff = max_backoff
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.retention_seconds = retention_days * 86400
+
+        self._wake = threading.Event()
+        self._threads = []
+        self._start_lock = threading.Lock()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        # A short-lived connection per operation keeps this usable from any thread or process
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.row_factory = sqlite3.Row
+            yield conn
+        finally:
+            conn.close()
+
+    def _claim(self, conn, row_id: int, due_only: bool = False) -> bool:
+        """Lease a row for one attempt so two workers (or processes) never send it concurrently"""
+        now = time.time()
+        due = " AND next_attempt_at <= ?" if due_only else ""
+        cursor = conn.execute(
+            f"UPDATE {self.TABLE} SET claimed_until = ? WHERE id = ? AND {self.PENDING} AND claimed_until < ?{due}",
+            (now + self.lease_seconds, row_id, now) + ((now,) if due_only else ())
+        )
+        return cursor.rowcount == 1
+
+    def _claim_due(self, limit: int, scan: Optional[int] = None) -> List[sqlite3.Row]:
+        """Lease up to `limit` of the oldest due rows, looking at `scan` candidates to skip ones leased elsewhere"""
+        now = time.time()
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM {self.TABLE} WHERE {self.PENDING} AND next_attempt_at <= ? AND claimed_until < ? "
+                f"ORDER BY id LIMIT ?", (now, now, scan or limit)
+            ).fetchall()
+            claimed = []
+            for row in rows:
+                if len(claimed) == limit:
+                    break
+                # Another worker may have attempted the row since the SELECT; lease it only if still due,
+                # and re-read it so attempts is current
+                if self._claim(conn, row["id"], due_only=True):
+                    claimed.append(conn.execute(f"SELECT * FROM {self.TABLE} WHERE id = ?", (row["id"],)).fetchone())
+            return claimed
+
+    def _release(self, rows: List[sqlite3.Row]):
+        """Give leased rows back without counting an attempt"""
+        with self._connect() as conn:
+            conn.executemany(f"UPDATE {self.TABLE} SET claimed_until = 0 WHERE id = ?", [(row["id"],) for row in rows])
+
+    def _backoff(self, attempts: int) -> float:
+        return min(self.max_backoff, self.retry_base * (2 ** min(attempts - 1, 16)))
+
+    def _finish(self, row: sqlite3.Row, error: Optional[str] = None, permanent: bool = False):
+        """Record one attempt: done when error is None, else retried with backoff or dead-lettered"""
+        now = time.time()
+        attempts = row["attempts"] + 1
+        with self._connect() as conn:
+            if error is None:
+                self._mark_done(conn, row, attempts, now)
+            elif permanent or attempts >= self.max_attempts:
+                self._mark_dead(conn, row, attempts, error, now)
+            else:
+                self._mark_retry(conn, row, attempts, now + self._backoff(attempts), error, now)
+
+    @abc.abstractmethod
+    def _mark_done(self, conn, row: sqlite3.Row, attempts: int, now: float):
+        """Record a successful attempt"""
+
+    @abc.abstractmethod
+    def _mark_retry(self, conn, row: sqlite3.Row, attempts: int, next_attempt_at: float, error: str, now: float):
+        """Record a failed attempt that will be tried again at next_attempt_at"""
+
+    @abc.abstractmethod
+    def _mark_dead(self, conn, row: sqlite3.Row, attempts: int, error: str, now: float):
+        """Record that the row will not be tried again"""
+
+    @abc.abstractmethod
+    def _prune_finished(self, conn, cutoff: float):
+        """Delete finished rows older than cutoff"""
+
+    @abc.abstractmethod
+    def process_due(self) -> int:
+        """Work through due rows in the calling thread; returns how many were handled"""
+
+    def prune(self):
+        """Drop finished rows past the retention window"""
+        with self._connect() as conn:
+            self._prune_finished(conn, time.time() - self.retention_seconds)
+
+    def _work_loop(self, index: int):
+        last_prune = 0.0
+        while True:
+            try:
+                self.process_due()
+                if index == 0 and time.time() - last_prune > 3600:
+                    self.prune()
+                    last_prune = time.time()
+            except Exception as e:
+                logger.error(f"{self.thread_name} error: {e}")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def start(self):
+        """Start the worker threads once per process"""
+        with self._start_lock:
+            if self._threads and all(thread.is_alive() for thread in self._threads):
+                return self._threads
+            self._threads = [
+                threading.Thread(target=self._work_loop, args=(index,), name=f"{self.thread_name}-{index}", daemon=True)
+                for index in range(self.workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+            return self._threads
+
+    def wake(self):
+        """Make sure the workers run and have them look for due rows now"""
+        self.start()
+        self._wake.set()
+
+    @property
+    def workers_alive(self) -> int:
+        return sum(1 for thread in self._threads if thread.is_alive())
@@ -14,20 +14,12 @@ import time
 
 class EnhancedTTSEngine:
     def __init__(self):
-        # Initialize OpenAI client safely
-        self.openai_client = None
-        openai_api_key = os.getenv("OPENAI_API_KEY")
+        # The OpenAI SDK is imported on first use (see openai_client) to keep worker boot fast
+        self.openai_api_key = os.getenv("OPENAI_API_KEY")
+        self._openai_client = None
+        self._openai_initialized = False
         
-        if openai_api_key:
-            try:
-                from openai import OpenAI
-                self.openai_client = OpenAI(api_key=openai_api_key)
-                logging.info("✅ OpenAI client initialized successfully")
-            except Exception as e:
-                logging.warning(f"⚠️ OpenAI client initialization failed: {e}")
-                logging.info("🎵 Will use ElevenLabs as primary TTS engine")
-                self.openai_client = None
-        else:
+        if not self.openai_api_key:
             logging.info("ℹ️ No OpenAI API key found, using ElevenLabs only")
         
         # ElevenLabs setup
@@ -67,6 +59,22 @@ class EnhancedTTSEngine:
             }
         }
 
+    @property
+    def openai_client(self):
+        """OpenAI client, initialized safely on first use"""
+        if not self._openai_initialized:
+            self._openai_initialized = True
+            if self.openai_api_key:
+                try:
+                    from openai import OpenAI
+                    self._openai_client = OpenAI(api_key=self.openai_api_key)
+                    logging.info("✅ OpenAI client initialized successfully")
+                except Exception as e:
+                    logging.warning(f"⚠️ OpenAI client initialization failed: {e}")
+                    logging.info("🎵 Will use ElevenLabs as primary TTS engine")
+                    self._openai_client = None
+        return self._openai_client
+    
     def optimize_text_for_speech(self, text: str, context: str = "neutral") -> str:
         """Transform written text into speech-optimized format"""
         
@@ -0,0 +1,162 @@
+"""
+Indexed FAQ retrieval for RinglyPro Voice Assistant
+BM25 over an inverted token index, with an IDF-weighted overlap score as calibrated confidence
+"""
+
+import heapq
+import math
+import re
+from collections import defaultdict
+from difflib import get_close_matches
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9$]+")
+
+# Function words carry no topic and would otherwise give every question a posting in the same few lists
+STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "at", "be", "can", "do", "does", "for", "how", "i", "if", "in",
+    "is", "it", "me", "my", "of", "on", "or", "our", "that", "the", "this", "to", "we", "what",
+    "will", "with", "you", "your"
+})
+
+
+def _stem(token: str) -> str:
+    """Very light suffix stripping so 'plans'/'plan' and 'booking'/'book' share a posting list"""
+    for suffix in ("ing", "ed", "es", "s"):
+        if len(token) > len(suffix) + 2 and token.endswith(suffix):
+            return token[:-len(suffix)]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    tokens = _TOKEN_RE.findall(text.lower().replace("'", ""))
+    content = [token for token in tokens if token not in STOP_WORDS]
+    # Keep an all-function-word question searchable rather than dropping it from the index
+    return [_stem(token) for token in (content or tokens)]
+
+
+class FAQIndex:
+    """Inverted index over FAQ questions, built once and queried per message"""
+
+    def __init__(self, faq: Dict[str, str], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.keys = list(faq.keys())
+        self.doc_terms = []
+        self.doc_weights = []
+        self.max_weight = defaultdict(float)
+
+        doc_tokens = []
+        document_frequency = defaultdict(int)
+        for question in self.keys:
+            tokens = tokenize(question)
+            doc_tokens.append(tokens)
+            for token in set(tokens):
+                document_frequency[token] += 1
+
+        doc_count = len(self.keys)
+        avg_length = (sum(len(tokens) for tokens in doc_tokens) / doc_count) if doc_count else 0.0
+        self.idf = {
+            token: math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            for token, df in document_frequency.items()
+        }
+
+        # Posting lists carry the precomputed BM25 term weight so a query is only additions
+        self.postings = defaultdict(list)
+        for doc_id, tokens in enumerate(doc_tokens):
+            counts = defaultdict(int)
+            for token in tokens:
+                counts[token] += 1
+            length_norm = self.k1 * (1 - self.b + self.b * len(tokens) / avg_length)
+            term_weights = {}
+            for token, tf in counts.items():
+                weight = self.idf[token] * tf * (self.k1 + 1) / (tf + length_norm)
+                term_weights[token] = weight
+                self.postings[token].append((doc_id, weight))
+                self.max_weight[token] = max(self.max_weight[token], weight)
+
+            # Per-question term weights and IDF mass, used to score confidence for the few ranked hits
+            self.doc_terms.append(term_weights)
+            self.doc_weights.append(sum(self.idf[token] for token in counts))
+
+        # A query word the index has never seen is as informative as the rarest indexed word
+        self.unseen_idf = math.log(1 + (doc_count + 0.5) / 0.5)
+
+        # Stop words are candidates too, so 'wat' is recognized as 'what' and ignored
+        self._vocabulary_by_initial = defaultdict(list)
+        for token in list(self.postings) + sorted(STOP_WORDS - set(self.postings)):
+            self._vocabulary_by_initial[token[0]].append(token)
+        self._correct = lru_cache(maxsize=4096)(self._correct_token)
+
+    def _correct_token(self, token: str) -> Optional[str]:
+        """Map an out-of-vocabulary token (usually a typo) to the closest indexed token"""
+        candidates = self._vocabulary_by_initial.get(token[0], [])
+        matches = get_close_matches(token, candidates, n=1, cutoff=0.8)
+        return matches[0] if matches else None
+
+    def _query_tokens(self, query: str) -> Tuple[List[str], float]:
+        """Return indexed query tokens plus the IDF weight of words that matched nothing"""
+        tokens = []
+        unmatched_weight = 0.0
+        for token in set(tokenize(query)):
+            if token not in self.postings:
+                token = self._correct(token)
+            if token is None:
+                unmatched_weight += self.unseen_idf
+            elif token in self.postings:
+                tokens.append(token)
+        return tokens, unmatched_weight
+
+    def search(self, query: str, top_k: int = 1) -> List[Tuple[str, float, float, float]]:
+        """Return up to top_k (key, bm25_score, confidence, coverage) tuples, best first"""
+        query_tokens, unmatched_weight = self._query_tokens(query)
+        if not query_tokens:
+            return []
+
+        # MaxScore: walk rare tokens first; once the common tokens left could not lift an unseen
+        # question past the current top_k, they only top up the candidates already found
+        ordered = sorted(query_tokens, key=self.idf.__getitem__, reverse=True)
+        remaining = sum(self.max_weight[token] for token in ordered)
+        scores = {}
+        get_score = scores.get
+        for position, token in enumerate(ordered):
+            if len(scores) >= top_k and remaining < heapq.nlargest(top_k, scores.values())[-1]:
+                for doc_id in scores:
+                    term_weights = self.doc_terms[doc_id]
+                    scores[doc_id] += sum(term_weights.get(rest, 0.0) for rest in ordered[position:])
+                break
+            for doc_id, weight in self.postings[token]:
+                scores[doc_id] = get_score(doc_id, 0.0) + weight
+            remaining -= self.max_weight[token]
+
+        query_weight = sum(self.idf[token] for token in query_tokens) + unmatched_weight
+        ranked = heapq.nlargest(top_k, scores, key=scores.__getitem__)
+
+        # Confidence is the IDF-weighted Dice overlap: 1.0 when question and query share every informative word.
+        # Coverage only asks how much of the query the entry contains, which suits long passages
+        results = []
+        for doc_id in ranked:
+            overlap = sum(self.idf[token] for token in query_tokens if token in self.doc_terms[doc_id])
+            confidence = 2 * overlap / (query_weight + self.doc_weights[doc_id])
+            results.append((self.keys[doc_id], scores[doc_id], confidence, overlap / query_weight))
+        return results
+
+    def best_match(self, query: str, min_confidence: float = 0.6) -> Optional[Tuple[str, float]]:
+        """Return (question, confidence) for the top candidate if it clears min_confidence"""
+        results = self.search(query, top_k=3)
+        if not results:
+            return None
+
+        # BM25 ranks candidates; confidence decides, so re-pick the most confident of the top few
+        question, _, confidence, _ = max(results, key=lambda result: result[2])
+        if confidence < min_confidence:
+            return None
+        return question, confidence
+
+    def best_passage(self, query: str, min_coverage: float = 0.6) -> Optional[Tuple[str, float]]:
+        """Return (key, coverage) for the top BM25 hit if it contains enough of the query"""
+        results = self.search(query, top_k=1)
+        if not results or results[0][3] < min_coverage:
+            return None
+        return results[0][0], results[0][3]
@@ -0,0 +1,10 @@
+"""
+Gunicorn settings for RinglyPro Voice Assistant
+Starts each worker's background services (IVR prompt warm-up, audio janitor, site crawler,
+outbox and notification workers) as soon as the worker has loaded the app
+"""
+
+
+def post_worker_init(worker):
+    from app import initialize_application
+    initialize_application()
@@ -0,0 +1,80 @@
+"""
+Keyword intent router for RinglyPro Voice Assistant
+Compiles every keyword of every intent into one trie-shaped regex so an utterance is classified in a single pass
+"""
+
+import re
+from typing import Optional, Dict, Any, List, Tuple
+
+
+def _trie_pattern(keywords: List[str]) -> str:
+    """Build a regex alternation that shares common prefixes, e.g. 'book(?: an)?' for 'book' and 'book an'"""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            # Keyword ends here but longer ones continue; the greedy optional keeps the longest match
+            pattern = (pattern if pattern.startswith("(?:") else "(?:" + pattern + ")") + "?"
+        return pattern
+
+    return build(trie)
+
+
+class IntentRouter:
+    """Classify text by substring keywords, resolving several hits by rule priority (lower wins)"""
+
+    def __init__(self, rules: List[Tuple[str, int, List[str]]]):
+        self.rules = sorted(rules, key=lambda rule: rule[1])
+        self.priorities = {}
+        keyword_intents = {}
+        for intent, priority, keywords in rules:
+            self.priorities[intent] = priority
+            for keyword in keywords:
+                keyword_intents.setdefault(keyword.lower(), set()).add(intent)
+
+        # The scan reports the longest keyword at each position, so a keyword also carries the
+        # intents of every keyword it contains ('want to subscribe' implies 'subscribe')
+        self.keyword_intents = {
+            keyword: frozenset().union(*(intents for other, intents in keyword_intents.items() if other in keyword))
+            for keyword in keyword_intents
+        }
+        self.keyword_best = {
+            keyword: min((self.priorities[intent], intent) for intent in intents)
+            for keyword, intents in self.keyword_intents.items()
+        }
+        self.pattern = re.compile(_trie_pattern(sorted(self.keyword_intents)))
+
+    def classify(self, text: str) -> Optional[Dict[str, Any]]:
+        """Return the winning intent with its matched spans, plus every hit, or None"""
+        matches = []
+        for match in self.pattern.finditer(text.lower()):
+            keyword = match.group()
+            for intent in self.keyword_intents[keyword]:
+                matches.append({"intent": intent, "keyword": keyword, "span": match.span()})
+        if not matches:
+            return None
+
+        intent = min(matches, key=lambda hit: (self.priorities[hit["intent"]], hit["span"][0]))["intent"]
+        return {
+            "intent": intent,
+            "spans": [hit["span"] for hit in matches if hit["intent"] == intent],
+            "matches": matches
+        }
+
+    def intent(self, text: str) -> Optional[str]:
+        """Winning intent only, for call sites that just branch on it; skips building the span lists"""
+        best = None
+        for match in self.pattern.finditer(text.lower()):
+            candidate = self.keyword_best[match.group()]
+            if best is None or candidate < best:
+                best = candidate
+        return best[1] if best else None
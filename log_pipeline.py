@@ -0,0 +1,121 @@
+"""
+Non-blocking logging for RinglyPro Voice Assistant
+Request threads only enqueue records; one listener thread writes them to a size-rotated file and the
+console, and chatty hot-path loggers can be sampled down before anything is queued
+"""
+
+import itertools
+import logging
+import logging.handlers
+import queue
+from typing import Callable, Dict, Any, Optional, TextIO
+
+
+def parse_sample_rates(spec: str) -> Dict[str, int]:
+    """Parse 'logger.name=10,other=5' into {logger name: keep 1 in N}"""
+    rates = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, every = item.partition("=")
+        if name.strip() and every.strip().isdigit() and int(every) > 1:
+            rates[name.strip()] = int(every)
+    return rates
+
+
+class SamplingFilter(logging.Filter):
+    """Keep 1 in N records below WARNING from the configured loggers (and their children).
+
+    With a scope (a callable returning a dict for the current unit of work, e.g. the request, or None
+    outside one) the decision is made once per unit, so a kept request keeps all of its lines"""
+
+    def __init__(self, rates: Dict[str, int], scope: Optional[Callable[[], Optional[dict]]] = None):
+        super().__init__()
+        self.rates = rates
+        self.scope = scope
+        self._counters = {name: itertools.count() for name in rates}
+        self.sampled_out = 0
+
+    def _rate_for(self, name: str) -> Optional[str]:
+        while name:
+            if name in self.rates:
+                return name
+            name = name.rpartition(".")[0]
+        return None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+        configured = self._rate_for(record.name)
+        if configured is None:
+            return True
+        decisions = self.scope() if self.scope else None
+        keep = decisions.get(configured) if decisions is not None else None
+        if keep is None:
+            # itertools.count is atomic under the GIL, so no lock on the hot path
+            keep = next(self._counters[configured]) % self.rates[configured] == 0
+            if decisions is not None:
+                decisions[configured] = keep
+        if not keep:
+            self.sampled_out += 1
+        return keep
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops (and counts) records instead of raising when the queue is full"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogPipeline:
+    """Root logging through a bounded queue drained by a QueueListener"""
+
+    def __init__(self, path: str, level: int = logging.INFO, fmt: str = "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+                 max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5, sample_rates: Optional[Dict[str, int]] = None,
+                 queue_size: int = 10000, console: bool = True, stream: Optional[TextIO] = None,
+                 sample_scope: Optional[Callable[[], Optional[dict]]] = None):
+        formatter = logging.Formatter(fmt)
+        self.handlers = [logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count,
+                                                              encoding="utf-8")]
+        if console:
+            self.handlers.append(logging.StreamHandler(stream))
+        for handler in self.handlers:
+            handler.setFormatter(formatter)
+
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.queue_handler = DroppingQueueHandler(self.queue)
+        self.sampler = SamplingFilter(sample_rates or {}, scope=sample_scope)
+        self.queue_handler.addFilter(self.sampler)
+        self.listener = logging.handlers.QueueListener(self.queue, *self.handlers, respect_handler_level=True)
+        self.level = level
+
+    def install(self, root: Optional[logging.Logger] = None) -> "LogPipeline":
+        """Replace the root logger's handlers with the queue handler and start the listener thread"""
+        root = root or logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(self.queue_handler)
+        root.setLevel(self.level)
+        self.listener.start()
+        return self
+
+    def stop(self):
+        """Flush queued records and stop the listener, e.g. at interpreter exit"""
+        if self.listener._thread is not None:
+            self.listener.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and dropped/sampled counts for health reporting"""
+        return {
+            "depth": self.queue.qsize(),
+            "capacity": self.queue.maxsize,
+            "dropped": self.queue_handler.dropped,
+            "sampled_out": self.sampler.sampled_out,
+            "sample_rates": dict(self.sampler.rates)
+        }
@@ -0,0 +1,204 @@
+"""
+In-process metrics for RinglyPro Voice Assistant
+Counters and latency histograms aggregated per thread (no lock on the hot path) and merged on scrape,
+plus scrape-time gauges from component stats, rendered in the Prometheus text format
+"""
+
+import bisect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds; spans a cached page lookup up to a slow upstream timeout
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Shard:
+    """One thread's counters and histograms; only that thread writes to it"""
+
+    def __init__(self, bucket_count: int):
+        self.bucket_count = bucket_count
+        self.counters = {}
+        self.histograms = {}
+
+    def merge_into(self, counters: Dict, histograms: Dict):
+        for key, value in dict(self.counters).items():
+            counters[key] = counters.get(key, 0) + value
+        for key, (buckets, total, count) in dict(self.histograms).items():
+            merged = histograms.setdefault(key, [[0] * self.bucket_count, 0.0, 0])
+            merged[0] = [a + b for a, b in zip(merged[0], buckets)]
+            merged[1] += total
+            merged[2] += count
+
+
+class MetricsRegistry:
+    """Per-thread shards merged at scrape time; shards of finished threads fold into a retired total"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._local = threading.local()
+        self._shards = []
+        self._retired = _Shard(len(self.buckets) + 1)
+        self._lock = threading.Lock()
+        self._help = {}
+        self._collectors = []
+
+    def describe(self, name: str, metric_type: str, help_text: str):
+        self._help[name] = (metric_type, help_text)
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard(len(self.buckets) + 1)
+            with self._lock:
+                self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """Add to a counter"""
+        counters = self._shard().counters
+        key = (name, _labels(labels))
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        """Record one histogram sample"""
+        histograms = self._shard().histograms
+        key = (name, _labels(labels))
+        entry = histograms.get(key)
+        if entry is None:
+            entry = histograms[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        entry[0][bisect.bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+        entry[2] += 1
+
+    @contextmanager
+    def track(self, upstream: str):
+        """Time an upstream call; exceptions count as errors and propagate"""
+        started = time.perf_counter()
+        outcome = "ok"
+        try:
+            yield
+        except Exception:
+            outcome = "error"
+            raise
+        finally:
+            self.observe("ringlypro_upstream_request_duration_seconds", time.perf_counter() - started,
+                         upstream=upstream)
+            self.inc("ringlypro_upstream_requests_total", upstream=upstream, outcome=outcome)
+
+    def register_collector(self, collector: Callable[[], Iterable[Tuple[str, str, Dict[str, Any], float]]]):
+        """Add a scrape-time source of gauge samples: (name, help, labels, value)"""
+        self._collectors.append(collector)
+
+    def _snapshot(self) -> Tuple[Dict, Dict]:
+        counters, histograms = {}, {}
+        with self._lock:
+            live = []
+            for thread, shard in self._shards:
+                if thread.is_alive():
+                    live.append((thread, shard))
+                else:
+                    # Fold finished threads so per-request threads don't grow the shard list forever
+                    shard.merge_into(self._retired.counters, self._retired.histograms)
+            self._shards = live
+            self._retired.merge_into(counters, histograms)
+            for _, shard in live:
+                shard.merge_into(counters, histograms)
+        return counters, histograms
+
+    def render(self) -> str:
+        """Everything in the Prometheus text exposition format"""
+        counters, histograms = self._snapshot()
+        lines = []
+        described = set()
+
+        def header(name, default_type, help_text=""):
+            if name in described:
+                return
+            described.add(name)
+            metric_type, described_help = self._help.get(name, (default_type, help_text))
+            lines.append(f"# HELP {name} {described_help or name}")
+            lines.append(f"# TYPE {name} {metric_type}")
+
+        for (name, labels), value in sorted(counters.items()):
+            header(name, "counter")
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        bounds = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+        for (name, labels), (buckets, total, count) in sorted(histograms.items()):
+            header(name, "histogram")
+            cumulative = 0
+            for bound, bucket in zip(bounds, buckets):
+                cumulative += bucket
+                lines.append(f"{name}_bucket{_format_labels(labels, ('le', bound))} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(round(total, 6))}")
+            lines.append(f"{name}_count{_format_labels(labels)} {count}")
+
+        for collector in self._collectors:
+            try:
+                samples: List = sorted(collector(), key=lambda sample: sample[0])
+            except Exception as e:
+                # One broken stats() must not cost the whole scrape
+                logger.warning(f"Metrics collector {getattr(collector, '__name__', collector)} failed: {e}")
+                continue
+            for name, help_text, labels, value in samples:
+                if value is None:
+                    continue
+                header(name, "gauge", help_text)
+                lines.append(f"{name}{_format_labels(_labels(labels))} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+def instrument_session(session, upstream: str, registry: "MetricsRegistry"):
+    """Time every HTTP exchange a requests.Session sends; 5xx responses and exceptions count as errors"""
+    # send() rather than request(): clients like Twilio's prepare requests themselves and only call send()
+    original = session.send
+
+    def send(prepared, **kwargs):
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            response = original(prepared, **kwargs)
+            outcome = "error" if response.status_code >= 500 else "ok"
+            return response
+        finally:
+            registry.observe("ringlypro_upstream_request_duration_seconds", time.perf_counter() - started,
+                             upstream=upstream)
+            registry.inc("ringlypro_upstream_requests_total", upstream=upstream, outcome=outcome)
+
+    session.send = send
+    return session
+
+
+# One registry per worker process
+registry = MetricsRegistry()
+registry.describe("ringlypro_http_request_duration_seconds", "histogram", "Flask request latency by route")
+registry.describe("ringlypro_http_requests_total", "counter", "Flask requests by route, method and status")
+registry.describe("ringlypro_upstream_request_duration_seconds", "histogram", "Upstream call latency")
+registry.describe("ringlypro_upstream_requests_total", "counter", "Upstream calls by outcome (ok/error)")
@@ -0,0 +1,153 @@
+"""
+Booking notification jobs for RinglyPro Voice Assistant
+Confirmation emails and SMS are stored as SQLite (WAL) jobs and sent by worker threads with retries,
+so /book-appointment returns once the CRM write is done and delivery can be tracked by confirmation code
+"""
+
+import json
+import logging
+import sqlite3
+import time
+from typing import Callable, Optional, Dict, Any, List
+
+from durable_queue import DurableQueue
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RETRYING = "retrying"
+SENT = "sent"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notification_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    confirmation_code TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    claimed_until REAL NOT NULL DEFAULT 0,
+    last_error TEXT,
+    UNIQUE (confirmation_code, channel)
+);
+CREATE INDEX IF NOT EXISTS notification_jobs_due ON notification_jobs (status, next_attempt_at);
+"""
+
+
+class NotificationQueue(DurableQueue):
+    """Persistent per-channel jobs drained by a small pool of worker threads; safe across worker processes"""
+
+    TABLE = "notification_jobs"
+    SCHEMA = _SCHEMA
+    PENDING = f"status IN ('{QUEUED}', '{RETRYING}')"
+
+    def __init__(self, path: str, handlers: Dict[str, Callable[[Dict[str, Any]], bool]], workers: int = 2,
+                 max_attempts: int = 5, retry_base: float = 30, max_backoff: float = 3600,
+                 poll_interval: float = 5, lease_seconds: float = 120, retention_days: float = 7):
+        super().__init__(path, workers=workers, thread_name="notification-worker", max_attempts=max_attempts,
+                         retry_base=retry_base, max_backoff=max_backoff, poll_interval=poll_interval,
+                         lease_seconds=lease_seconds, retention_days=retention_days)
+        self.handlers = handlers
+
+    def enqueue(self, confirmation_code: str, payload: Dict[str, Any], channels: Optional[List[str]] = None) -> List[str]:
+        """Record one job per channel for a booking and wake the workers; re-enqueueing a code is a no-op"""
+        channels = channels or list(self.handlers)
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO notification_jobs (confirmation_code, channel, payload, status, created_at, "
+                "updated_at, next_attempt_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(confirmation_code, channel, json.dumps(payload), QUEUED, now, now, now) for channel in channels]
+            )
+
+        self.wake()
+        return channels
+
+    def status(self, confirmation_code: str) -> Dict[str, Dict[str, Any]]:
+        """Delivery state per channel for one booking; empty when nothing was queued for it"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT channel, status, attempts, last_error, created_at, updated_at FROM notification_jobs "
+                "WHERE confirmation_code = ?", (confirmation_code,)
+            ).fetchall()
+
+        return {
+            row["channel"]: {
+                "status": row["status"],
+                "attempts": row["attempts"],
+                "last_error": row["last_error"],
+                "queued_at": row["created_at"],
+                "updated_at": row["updated_at"]
+            }
+            for row in rows
+        }
+
+    def _run(self, row: sqlite3.Row):
+        """Send one claimed job; on failure schedule the next try with exponential backoff"""
+        handler = self.handlers.get(row["channel"])
+        try:
+            if handler is None:
+                raise ValueError(f"no handler for channel {row['channel']}")
+            error = None if handler(json.loads(row["payload"])) else f"{row['channel']} send failed"
+        except Exception as e:
+            error = str(e)
+        self._finish(row, error)
+
+    def _update(self, conn, row, status, attempts, next_attempt_at, error, now):
+        conn.execute(
+            "UPDATE notification_jobs SET status = ?, attempts = ?, next_attempt_at = ?, claimed_until = 0, "
+            "last_error = ?, updated_at = ? WHERE id = ?",
+            (status, attempts, next_attempt_at, error, now, row["id"])
+        )
+
+    def _mark_done(self, conn, row, attempts, now):
+        self._update(conn, row, SENT, attempts, now, None, now)
+
+    def _mark_retry(self, conn, row, attempts, next_attempt_at, error, now):
+        logger.warning(f"{row['channel']} confirmation for {row['confirmation_code']} failed "
+                       f"(attempt {attempts}), retrying: {error}")
+        self._update(conn, row, RETRYING, attempts, next_attempt_at, error, now)
+
+    def _mark_dead(self, conn, row, attempts, error, now):
+        logger.error(f"Giving up on {row['channel']} confirmation for {row['confirmation_code']} "
+                     f"after {attempts} attempts: {error}")
+        self._update(conn, row, FAILED, attempts, now, error, now)
+
+    def _prune_finished(self, conn, cutoff):
+        conn.execute("DELETE FROM notification_jobs WHERE status IN (?, ?) AND updated_at < ?", (SENT, FAILED, cutoff))
+
+    def run_pending(self) -> int:
+        """Process every due job in this thread; returns how many were attempted"""
+        attempted = 0
+        while True:
+            claimed = self._claim_due(1, scan=10)
+            if not claimed:
+                return attempted
+            self._run(claimed[0])
+            attempted += 1
+
+    def process_due(self) -> int:
+        return self.run_pending()
+
+    def stats(self) -> Dict[str, Any]:
+        """Job counts by status for health reporting"""
+        try:
+            with self._connect() as conn:
+                counts = dict(conn.execute("SELECT status, COUNT(*) FROM notification_jobs GROUP BY status").fetchall())
+                oldest = conn.execute("SELECT MIN(created_at) FROM notification_jobs WHERE status IN (?, ?)",
+                                      (QUEUED, RETRYING)).fetchone()[0]
+        except sqlite3.Error as e:
+            return {"error": str(e)}
+
+        return {
+            "queued": counts.get(QUEUED, 0),
+            "retrying": counts.get(RETRYING, 0),
+            "sent": counts.get(SENT, 0),
+            "failed": counts.get(FAILED, 0),
+            "oldest_pending_seconds": round(time.time() - oldest) if oldest else 0,
+            "workers_alive": self.workers_alive
+        }
@@ -0,0 +1,201 @@
+"""
+Durable CRM outbox for RinglyPro Voice Assistant
+Every CRM write is appended to a local SQLite (WAL) table first, then delivered by a replayer
+thread with an idempotency key, so leads survive CRM outages and worker restarts
+"""
+
+import json
+import logging
+import sqlite3
+import time
+import uuid
+from typing import Callable, Optional, Dict, Any
+
+from durable_queue import DurableQueue
+
+logger = logging.getLogger(__name__)
+
+# Rows claimed per replay pass; a full batch means more are probably due
+REPLAY_BATCH = 50
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    idempotency_key TEXT NOT NULL UNIQUE,
+    method TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    claimed_until REAL NOT NULL DEFAULT 0,
+    delivered_at REAL,
+    dead INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (delivered_at, dead, next_attempt_at);
+"""
+
+
+class RejectedWrite(Exception):
+    """The CRM answered and refused the write (4xx); sending the same payload again cannot succeed"""
+
+    def __init__(self, status_code: int, detail: str = ""):
+        super().__init__(f"HTTP {status_code}: {detail}" if detail else f"HTTP {status_code}")
+        self.status_code = status_code
+        self.detail = detail
+
+
+class CRMOutbox(DurableQueue):
+    """Append-only SQLite outbox with a background replayer; safe to share between worker processes"""
+
+    TABLE = "outbox"
+    SCHEMA = _SCHEMA
+    PENDING = "delivered_at IS NULL AND dead = 0"
+
+    def __init__(self, path: str, sender: Callable[[str, str, Dict[str, Any], str], Optional[dict]],
+                 replay_interval: float = 5, max_attempts: int = 50, max_backoff: float = 900,
+                 retention_days: float = 7, on_delivered: Optional[Callable[[str, str, Dict[str, Any], Any], None]] = None,
+                 on_dead: Optional[Callable[[str, str, Dict[str, Any], str], None]] = None):
+        super().__init__(path, workers=1, thread_name="crm-outbox-replayer", max_attempts=max_attempts,
+                         retry_base=2 * replay_interval, max_backoff=max_backoff, poll_interval=replay_interval,
+                         lease_seconds=60, retention_days=retention_days)
+        self.sender = sender
+        self.replay_interval = replay_interval
+        # Told (method, endpoint, payload, result or error) when a replayed write lands or is dead-lettered,
+        # so work held back for an unconfirmed write can go ahead or be dropped
+        self.on_delivered = on_delivered
+        self.on_dead = on_dead
+        self.delivered = 0
+        self.retried = 0
+        self.rejected = 0
+
+    def submit(self, method: str, endpoint: str, payload: Dict[str, Any],
+               idempotency_key: Optional[str] = None, attempt_inline: bool = False) -> Dict[str, Any]:
+        """Durably record a CRM write. Returns idempotency_key, delivered, the CRM result if sent inline and
+        rejected (the RejectedWrite) if the CRM refused it inline; a rejected write is dead-lettered, not replayed"""
+        key = idempotency_key or uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO outbox (idempotency_key, method, endpoint, payload, created_at, next_attempt_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, method.upper(), endpoint, json.dumps(payload), now, now)
+            )
+
+        if attempt_inline:
+            row = self._claim_by_key(key)
+            if row is not None:
+                try:
+                    result = self._attempt(row)
+                except RejectedWrite as e:
+                    return {"idempotency_key": key, "delivered": False, "result": None, "rejected": e}
+                if result is not None:
+                    return {"idempotency_key": key, "delivered": True, "result": result, "rejected": None}
+
+        self.wake()
+        return {"idempotency_key": key, "delivered": False, "result": None, "rejected": None}
+
+    def _claim_by_key(self, key: str) -> Optional[sqlite3.Row]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM outbox WHERE idempotency_key = ?", (key,)).fetchone()
+            if row is None or not self._claim(conn, row["id"]):
+                return None
+            return row
+
+    def _attempt(self, row: sqlite3.Row) -> Optional[dict]:
+        """Send one claimed row; on failure schedule the next try with exponential backoff.
+        Raises RejectedWrite after dead-lettering the row when the CRM refuses it"""
+        try:
+            result = self.sender(row["method"], row["endpoint"], json.loads(row["payload"]), row["idempotency_key"])
+            error = None if result is not None else "CRM unavailable"
+        except RejectedWrite as e:
+            self._finish(row, str(e), permanent=True)
+            self.rejected += 1
+            logger.error(f"CRM rejected {row['method']} {row['endpoint']} ({row['idempotency_key']}): {e}")
+            raise
+        except Exception as e:
+            result, error = None, str(e)
+
+        self._finish(row, error)
+        return result
+
+    def _mark_done(self, conn, row, attempts, now):
+        conn.execute("UPDATE outbox SET delivered_at = ?, attempts = ?, claimed_until = 0, last_error = NULL "
+                     "WHERE id = ?", (now, attempts, row["id"]))
+        self.delivered += 1
+
+    def _mark_retry(self, conn, row, attempts, next_attempt_at, error, now):
+        conn.execute("UPDATE outbox SET attempts = ?, next_attempt_at = ?, claimed_until = 0, last_error = ? "
+                     "WHERE id = ?", (attempts, next_attempt_at, error, row["id"]))
+        self.retried += 1
+
+    def _mark_dead(self, conn, row, attempts, error, now):
+        conn.execute("UPDATE outbox SET attempts = ?, claimed_until = 0, dead = 1, last_error = ? WHERE id = ?",
+                     (attempts, error, row["id"]))
+        if attempts >= self.max_attempts:
+            logger.error(f"CRM outbox gave up on {row['method']} {row['endpoint']} "
+                         f"({row['idempotency_key']}) after {attempts} attempts: {error}")
+
+    def _prune_finished(self, conn, cutoff):
+        conn.execute("DELETE FROM outbox WHERE delivered_at IS NOT NULL AND delivered_at < ?", (cutoff,))
+
+    def replay_due(self, limit: int = REPLAY_BATCH) -> int:
+        """Deliver rows whose retry time has come; returns how many were delivered"""
+        claimed = self._claim_due(limit)
+        delivered = 0
+        for position, row in enumerate(claimed):
+            try:
+                result = self._attempt(row)
+            except RejectedWrite as e:
+                # The CRM is up and answered; only this row is bad
+                self._notify(self.on_dead, row, str(e))
+                continue
+            if result is not None:
+                delivered += 1
+                self._notify(self.on_delivered, row, result)
+                continue
+            if row["attempts"] + 1 >= self.max_attempts:
+                self._notify(self.on_dead, row, f"gave up after {row['attempts'] + 1} attempts")
+            # The CRM is still down; release the rest for a later pass instead of hammering it
+            self._release(claimed[position + 1:])
+            break
+        if delivered:
+            logger.info(f"CRM outbox replayed {delivered} writes")
+        return delivered
+
+    def _notify(self, callback, row: sqlite3.Row, outcome: Any):
+        if callback is None:
+            return
+        try:
+            callback(row["method"], row["endpoint"], json.loads(row["payload"]), outcome)
+        except Exception as e:
+            logger.error(f"CRM outbox callback failed for {row['idempotency_key']}: {e}")
+
+    def process_due(self) -> int:
+        delivered = total = self.replay_due(REPLAY_BATCH)
+        while delivered == REPLAY_BATCH:
+            delivered = self.replay_due(REPLAY_BATCH)
+            total += delivered
+        return total
+
+    def stats(self) -> Dict[str, Any]:
+        """Backlog size and age for health reporting"""
+        try:
+            with self._connect() as conn:
+                pending, oldest = conn.execute(
+                    "SELECT COUNT(*), MIN(created_at) FROM outbox WHERE delivered_at IS NULL AND dead = 0"
+                ).fetchone()
+                dead = conn.execute("SELECT COUNT(*) FROM outbox WHERE dead = 1").fetchone()[0]
+        except sqlite3.Error as e:
+            return {"error": str(e)}
+
+        return {
+            "pending": pending,
+            "dead": dead,
+            "oldest_pending_seconds": round(time.time() - oldest) if oldest else 0,
+            "delivered": self.delivered,
+            "retried": self.retried,
+            "rejected": self.rejected,
+            "replayer_alive": self.workers_alive > 0
+        }
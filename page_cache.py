@@ -0,0 +1,79 @@
+"""
+Precompressed page cache for RinglyPro Voice Assistant
+Static UI pages are rendered once, compressed once (gzip, and brotli when installed) and served
+by dictionary lookup with a strong ETag per encoding
+"""
+
+import gzip
+import hashlib
+import logging
+from typing import Optional, Dict, Any, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Most compact first; identity is always available
+ENCODING_PREFERENCE = ("br", "gzip", "identity")
+
+
+class PrecompressedPage:
+    """One rendered page in every supported encoding, each with its own strong ETag"""
+
+    def __init__(self, html: str, gzip_level: int = 9, brotli_quality: int = 11):
+        body = html.encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()[:20]
+        self.variants = {"identity": (f'"{digest}"', body)}
+        # mtime=0 keeps the gzip bytes, and so the ETag, identical across workers and restarts
+        self.variants["gzip"] = (f'"{digest}-gz"', gzip.compress(body, compresslevel=gzip_level, mtime=0))
+        if brotli is not None:
+            self.variants["br"] = (f'"{digest}-br"', brotli.compress(body, quality=brotli_quality))
+
+    @property
+    def etags(self):
+        return [etag for etag, _ in self.variants.values()]
+
+    def select(self, accepts) -> Tuple[str, str, bytes]:
+        """Pick (encoding, etag, body) for a client; accepts(encoding) returns its quality, 0 meaning refused"""
+        for encoding in ENCODING_PREFERENCE:
+            if encoding in self.variants and (encoding == "identity" or accepts(encoding) > 0):
+                etag, body = self.variants[encoding]
+                return encoding, etag, body
+        etag, body = self.variants["identity"]
+        return "identity", etag, body
+
+
+class PageCache:
+    """Named precompressed pages, built at startup"""
+
+    def __init__(self, gzip_level: int = 9, brotli_quality: int = 11):
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self._pages = {}
+        self.hits = 0
+        self.not_modified = 0
+
+    def add(self, name: str, html: str) -> PrecompressedPage:
+        page = PrecompressedPage(html, self.gzip_level, self.brotli_quality)
+        self._pages[name] = page
+        sizes = ", ".join(f"{encoding} {len(body) // 1024} KB" for encoding, (_, body) in page.variants.items())
+        logger.info(f"Precompressed page '{name}': {sizes}")
+        return page
+
+    def get(self, name: str) -> Optional[PrecompressedPage]:
+        return self._pages.get(name)
+
+    def stats(self) -> Dict[str, Any]:
+        """Page sizes per encoding and conditional-request counters for health reporting"""
+        return {
+            "pages": {
+                name: {encoding: len(body) for encoding, (_, body) in page.variants.items()}
+                for name, page in self._pages.items()
+            },
+            "brotli": brotli is not None,
+            "hits": self.hits,
+            "not_modified": self.not_modified
+        }
@@ -0,0 +1,105 @@
+"""
+Resilience helpers for RinglyPro Voice Assistant upstream calls
+Per-endpoint circuit breakers and rolling latency stats
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, Any
+
+
+class CircuitBreaker:
+    """Closed -> open after consecutive failures, half-open trial after reset_timeout, closed again on success"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may go out now; while open, callers should fail fast"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                # Exactly one probe request decides whether the endpoint has recovered
+                self._trial_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.times_opened += 1
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            retry_in = 0.0
+            if self.state == self.OPEN:
+                retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+                "retry_in_seconds": round(retry_in, 1)
+            }
+
+
+class LatencyStats:
+    """Call counters plus percentiles over the most recent samples"""
+
+    def __init__(self, window: int = 200):
+        self.calls = 0
+        self.errors = 0
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, elapsed_ms: float, ok: bool):
+        with self._lock:
+            self.calls += 1
+            if not ok:
+                self.errors += 1
+            self._samples.append(elapsed_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            samples = sorted(self._samples)
+            calls, errors = self.calls, self.errors
+
+        def percentile(fraction):
+            return round(samples[min(len(samples) - 1, int(fraction * len(samples)))], 1) if samples else None
+
+        return {
+            "calls": calls,
+            "errors": errors,
+            "avg_ms": round(sum(samples) / len(samples), 1) if samples else None,
+            "p50_ms": percentile(0.5),
+            "p95_ms": percentile(0.95),
+            "max_ms": round(samples[-1], 1) if samples else None
+        }
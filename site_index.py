@@ -0,0 +1,211 @@
+"""
+Website knowledge index for RinglyPro Voice Assistant
+Crawls the marketing site in the background, chunks pages into passages and persists them,
+so an FAQ miss is answered with a local lookup instead of a live scrape
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Optional, Dict, Any, List
+from urllib.parse import urljoin, urldefrag, urlsplit
+
+import requests
+
+from faq_index import FAQIndex
+
+logger = logging.getLogger(__name__)
+
+_SKIPPED_TAGS = ["script", "style", "noscript", "svg", "template"]
+_SKIPPED_EXTENSIONS = (".pdf", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".css", ".js", ".zip", ".mp3", ".mp4")
+
+
+def chunk_text(text: str, max_words: int = 60, min_words: int = 8) -> List[str]:
+    """Group consecutive text lines into passages of roughly max_words words"""
+    passages = []
+    current = []
+    for line in text.splitlines():
+        words = line.split()
+        if not words:
+            continue
+        if current and len(current) + len(words) > max_words:
+            passages.append(" ".join(current))
+            current = []
+        current.extend(words)
+    if current:
+        passages.append(" ".join(current))
+    return [passage for passage in passages if len(passage.split()) >= min_words]
+
+
+class SiteKnowledgeIndex:
+    """Periodically crawled, disk-persisted passage index over one website"""
+
+    def __init__(self, start_url: str, cache_path: str, refresh_seconds: int = 6 * 3600,
+                 max_pages: int = 20, timeout: float = 10):
+        self.start_url = start_url
+        self.cache_path = cache_path
+        self.refresh_seconds = refresh_seconds
+        self.max_pages = max_pages
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": "Mozilla/5.0 (compatible; FAQ-Bot)"})
+
+        self._index = None
+        self._passages = {}
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+        self._refresher = None
+        self.pages = 0
+        self.last_error = None
+        self.lookups = 0
+        self.hits = 0
+
+        self.load()
+
+    def _install(self, passages: Dict[str, str], fetched_at: float, pages: int):
+        """Swap in a freshly built index; lookups never see a half-built one"""
+        index = FAQIndex(passages) if passages else None
+        with self._lock:
+            self._index = index
+            self._passages = passages
+            self._fetched_at = fetched_at
+            self.pages = pages
+
+    def load(self) -> bool:
+        """Load the last crawl from disk, e.g. one written by another worker"""
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if data.get("start_url") != self.start_url or data.get("fetched_at", 0) <= self._fetched_at:
+            return False
+
+        self._install(data.get("passages", {}), data["fetched_at"], data.get("pages", 0))
+        logger.info(f"Site index loaded from disk: {len(self._passages)} passages")
+        return True
+
+    def _save(self, passages: Dict[str, str], fetched_at: float, pages: int):
+        temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"start_url": self.start_url, "fetched_at": fetched_at,
+                           "pages": pages, "passages": passages}, f)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Site index save failed: {e}")
+
+    def _same_site(self, url: str) -> bool:
+        parts = urlsplit(url)
+        return (parts.scheme in ("http", "https")
+                and parts.netloc.lower() == urlsplit(self.start_url).netloc.lower()
+                and not parts.path.lower().endswith(_SKIPPED_EXTENSIONS))
+
+    def crawl(self) -> Dict[str, str]:
+        """Breadth-first crawl of same-site pages; returns {passage: page_url}"""
+        # Only the refresher thread parses HTML, so bs4 stays out of worker boot
+        from bs4 import BeautifulSoup
+
+        passages = {}
+        queue = [self.start_url]
+        seen = {self.start_url}
+        pages = 0
+
+        while queue and pages < self.max_pages:
+            url = queue.pop(0)
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Site crawl failed for {url}: {e}")
+                continue
+            if response.status_code != 200 or "html" not in response.headers.get("Content-Type", "html"):
+                continue
+            pages += 1
+
+            soup = BeautifulSoup(response.content, "html.parser")
+            for link in soup.find_all("a", href=True):
+                next_url = urldefrag(urljoin(url, link["href"]))[0]
+                if next_url not in seen and self._same_site(next_url):
+                    seen.add(next_url)
+                    queue.append(next_url)
+
+            for tag in soup(_SKIPPED_TAGS):
+                tag.decompose()
+            # Headers and footers repeat on every page; the first page to mention a passage keeps it
+            for passage in chunk_text(soup.get_text("\n")):
+                passages.setdefault(passage, url)
+
+        self.pages = pages
+        return passages
+
+    def refresh(self) -> bool:
+        """Crawl now and replace the index; the previous index stays on failure"""
+        started = time.time()
+        passages = self.crawl()
+        if not passages:
+            self.last_error = "crawl returned no content"
+            logger.warning(f"Site index refresh found no content at {self.start_url}")
+            return False
+
+        self.last_error = None
+        self._install(passages, started, self.pages)
+        self._save(passages, started, self.pages)
+        logger.info(f"Site index refreshed: {len(passages)} passages from {self.pages} pages "
+                    f"in {time.time() - started:.1f}s")
+        return True
+
+    def is_stale(self) -> bool:
+        return time.time() - self._fetched_at > self.refresh_seconds
+
+    def _refresh_loop(self):
+        while True:
+            try:
+                # Another worker may have crawled recently; only crawl if the disk copy is stale too
+                if self.is_stale() and not (self.load() and not self.is_stale()):
+                    self.refresh()
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"Site index refresh error: {e}")
+            time.sleep(min(self.refresh_seconds, 300))
+
+    def start_refresher(self):
+        """Start the background crawl thread once per process"""
+        if self._refresher and self._refresher.is_alive():
+            return self._refresher
+        self._refresher = threading.Thread(target=self._refresh_loop, name="site-index-refresher", daemon=True)
+        self._refresher.start()
+        return self._refresher
+
+    def lookup(self, query: str, min_coverage: float = 0.6) -> Optional[Dict[str, Any]]:
+        """Return the best matching passage and its page, or None. Never touches the network"""
+        with self._lock:
+            index = self._index
+            passages = self._passages
+        self.lookups += 1
+        if index is None:
+            return None
+
+        match = index.best_passage(query, min_coverage=min_coverage)
+        if not match:
+            return None
+        self.hits += 1
+        passage, coverage = match
+        return {"passage": passage, "url": passages[passage], "coverage": round(coverage, 3)}
+
+    def stats(self) -> Dict[str, Any]:
+        """Index size, age and lookup counters for health reporting"""
+        with self._lock:
+            passages = len(self._passages)
+            fetched_at = self._fetched_at
+        return {
+            "passages": passages,
+            "pages": self.pages,
+            "age_seconds": round(time.time() - fetched_at) if fetched_at else None,
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "last_error": self.last_error
+        }
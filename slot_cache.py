@@ -0,0 +1,100 @@
+"""
+Available-slot cache for RinglyPro Voice Assistant
+Per-date TTL cache in front of the CRM availability call; concurrent misses for one date share a single fetch
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Any, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class _Flight:
+    """One in-progress fetch that late arrivals wait on instead of starting their own"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SlotCache:
+    """Per-date slot lists with TTL expiry, request coalescing and explicit invalidation"""
+
+    def __init__(self, ttl_seconds: float = 30):
+        self.ttl_seconds = ttl_seconds
+        self._entries = {}
+        self._flights = {}
+        self._generation = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    def get_or_load(self, date_str: str, loader: Callable[[str], Tuple[List[str], bool]]) -> List[str]:
+        """Return cached slots for a date, or run loader once for everyone waiting on it.
+
+        loader returns (slots, cacheable); results that are not cacheable (e.g. fallback slots
+        while the CRM is down) are shared with concurrent callers but not stored.
+        """
+        with self._lock:
+            entry = self._entries.get(date_str)
+            if entry and time.monotonic() < entry[0]:
+                self.hits += 1
+                return list(entry[1])
+
+            flight = self._flights.get(date_str)
+            leader = flight is None
+            if leader:
+                flight = self._flights[date_str] = _Flight()
+                generation = self._generation.get(date_str, 0)
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error:
+                raise flight.error
+            return list(flight.result)
+
+        try:
+            slots, cacheable = loader(date_str)
+            flight.result = slots
+            with self._lock:
+                # A booking that invalidated this date mid-fetch makes the fetched list stale
+                if cacheable and self._generation.get(date_str, 0) == generation:
+                    self._entries[date_str] = (time.monotonic() + self.ttl_seconds, list(slots))
+            return list(slots)
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(date_str, None)
+            flight.done.set()
+
+    def invalidate(self, date_str: str):
+        """Forget a date immediately, e.g. after a booking on it"""
+        with self._lock:
+            self._entries.pop(date_str, None)
+            self._generation[date_str] = self._generation.get(date_str, 0) + 1
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters for health reporting"""
+        with self._lock:
+            now = time.monotonic()
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "dates": sum(1 for expires_at, _ in self._entries.values() if expires_at > now),
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "invalidations": self.invalidations,
+                "hit_ratio": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0
+            }
@@ -0,0 +1,157 @@
+"""
+Outbound SMS dispatcher for RinglyPro Voice Assistant
+Request handlers hand messages to a queue; worker threads send them through the shared Twilio client,
+pacing each sender number and dropping repeats of the same text to the same number within a window
+"""
+
+import hashlib
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+class _SenderRate:
+    """Token bucket per sender number: `burst` messages at once, then one every 1/rate seconds"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a token, returning how long the caller must wait before using it"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class SMSDispatcher:
+    """Bounded SMS queue with per-sender rate limits and duplicate suppression; submit() never blocks"""
+
+    def __init__(self, send: Callable[[str, str, str], str], rate_per_second: float = 1.0, burst: int = 3,
+                 dedup_window: float = 300, workers: int = 2, maxsize: int = 500):
+        self.send = send
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.dedup_window = dedup_window
+        self.workers = workers
+        self.maxsize = maxsize
+
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._rates = {}
+        self._recent = {}
+        self._lock = threading.Lock()
+        self._threads = []
+        self._start_lock = threading.Lock()
+
+        self.sent = 0
+        self.failed = 0
+        self.duplicates = 0
+        self.dropped = 0
+        self.throttled = 0
+
+    def start(self):
+        """Start the send workers once per process"""
+        with self._start_lock:
+            if self._threads and all(thread.is_alive() for thread in self._threads):
+                return self._threads
+            self._threads = [
+                threading.Thread(target=self._drain, name=f"sms-dispatcher-{index}", daemon=True)
+                for index in range(self.workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+            return self._threads
+
+    @staticmethod
+    def _dedup_key(to: str, body: str) -> str:
+        return hashlib.sha1(f"{to}\n{body}".encode("utf-8")).hexdigest()
+
+    def submit(self, to: str, body: str, from_: str) -> Future:
+        """Queue a message; the Future resolves to the Twilio SID. A repeat within the window gets the original's Future"""
+        key = self._dedup_key(to, body)
+        now = time.monotonic()
+        with self._lock:
+            recent = self._recent.get(key)
+            if recent and now - recent[0] < self.dedup_window:
+                self.duplicates += 1
+                logger.info(f"Skipping duplicate SMS to {to}")
+                return recent[1]
+            if len(self._recent) > 4 * self.maxsize:
+                self._recent = {k: v for k, v in self._recent.items() if now - v[0] < self.dedup_window}
+
+            future = Future()
+            try:
+                self._queue.put_nowait((key, to, body, from_, future))
+            except queue.Full:
+                self.dropped += 1
+                future.set_exception(RuntimeError(f"SMS queue full ({self.maxsize})"))
+                logger.warning(f"SMS queue full ({self.maxsize}) - dropped message to {to}")
+                return future
+            self._recent[key] = (now, future)
+
+        self.start()
+        return future
+
+    def _wait_for_rate(self, from_: str):
+        with self._lock:
+            rate = self._rates.get(from_)
+            if rate is None:
+                rate = self._rates[from_] = _SenderRate(self.rate_per_second, self.burst)
+            delay = rate.reserve()
+            if delay:
+                self.throttled += 1
+        if delay:
+            time.sleep(delay)
+
+    def _drain(self):
+        while True:
+            key, to, body, from_, future = self._queue.get()
+            try:
+                self._wait_for_rate(from_)
+                sid = self.send(to, body, from_)
+                with self._lock:
+                    self.sent += 1
+                future.set_result(sid)
+            except Exception as e:
+                with self._lock:
+                    self.failed += 1
+                    # A failed send must not suppress the caller's retry
+                    if self._recent.get(key, (None, None))[1] is future:
+                        del self._recent[key]
+                future.set_exception(e)
+                logger.error(f"SMS to {to} failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    def flush(self, timeout: float = 10) -> bool:
+        """Wait until every queued message has been handled, e.g. before shutdown"""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and send counters for health reporting"""
+        with self._lock:
+            return {
+                "depth": self._queue.qsize(),
+                "capacity": self.maxsize,
+                "sent": self.sent,
+                "failed": self.failed,
+                "duplicates": self.duplicates,
+                "dropped": self.dropped,
+                "throttled": self.throttled,
+                "rate_per_second": self.rate_per_second,
+                "workers_alive": sum(1 for thread in self._threads if thread.is_alive())
+            }
@@ -0,0 +1,180 @@
+"""
+SMTP connection pool for RinglyPro Voice Assistant
+Keeps a few authenticated connections warm so each confirmation email is a single send_message,
+with NOOP health checks, reconnect-on-failure and a bounded connection lifetime
+"""
+
+import logging
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from email.message import Message
+from typing import Optional, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+def _is_connection_error(error: Exception) -> bool:
+    """Whether the session itself is unusable, as opposed to e.g. a refused recipient"""
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    if isinstance(error, smtplib.SMTPResponseException):
+        # 421: the server is closing the transmission channel
+        return error.smtp_code == 421
+    # Every SMTPException is an OSError; the bare ones are socket failures
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+class _PooledConnection:
+    """An authenticated SMTP session plus the bookkeeping that decides when to retire it"""
+
+    def __init__(self, smtp: smtplib.SMTP):
+        self.smtp = smtp
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.uses = 0
+
+
+class SMTPConnectionPool:
+    """At most `size` concurrent sessions; idle ones are NOOP-checked before reuse and retired by age or message count"""
+
+    def __init__(self, host: str, port: int, username: Optional[str], password: Optional[str], size: int = 2,
+                 starttls: bool = True, timeout: float = 10, max_age: float = 300, max_messages: int = 100,
+                 idle_check_after: float = 30):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.size = size
+        self.starttls = starttls
+        self.timeout = timeout
+        self.max_age = max_age
+        self.max_messages = max_messages
+        self.idle_check_after = idle_check_after
+
+        self._idle = []
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.reused = 0
+        self.reconnects = 0
+        self.retired = 0
+        self.sent = 0
+
+    def _open(self) -> _PooledConnection:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.starttls:
+                smtp.starttls()
+            if self.username and self.password:
+                smtp.login(self.username, self.password)
+        except Exception:
+            self._close(smtp)
+            raise
+        with self._lock:
+            self.connects += 1
+        return _PooledConnection(smtp)
+
+    @staticmethod
+    def _close(smtp: smtplib.SMTP):
+        try:
+            smtp.quit()
+        except Exception:
+            smtp.close()
+
+    def _expired(self, conn: _PooledConnection) -> bool:
+        return time.monotonic() - conn.created_at > self.max_age or conn.uses >= self.max_messages
+
+    def _healthy(self, conn: _PooledConnection) -> bool:
+        # Servers drop idle sessions silently; a NOOP is far cheaper than a failed send
+        if time.monotonic() - conn.last_used < self.idle_check_after:
+            return True
+        try:
+            return conn.smtp.noop()[0] == 250
+        except Exception:
+            return False
+
+    def _checkout(self) -> _PooledConnection:
+        while True:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                return self._open()
+            if not self._expired(conn) and self._healthy(conn):
+                with self._lock:
+                    self.reused += 1
+                return conn
+            with self._lock:
+                self.retired += 1
+            self._close(conn.smtp)
+
+    def _checkin(self, conn: _PooledConnection, healthy: bool):
+        conn.last_used = time.monotonic()
+        conn.uses += 1
+        if healthy and not self._expired(conn):
+            with self._lock:
+                self._idle.append(conn)
+            return
+        with self._lock:
+            self.retired += 1
+        self._close(conn.smtp)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a warm, authenticated smtplib.SMTP; a connection error discards it instead of returning it"""
+        if not self._slots.acquire(timeout=self.timeout):
+            raise TimeoutError(f"No SMTP connection free within {self.timeout}s")
+        try:
+            conn = self._checkout()
+            healthy = True
+            try:
+                yield conn.smtp
+            except Exception as e:
+                healthy = not _is_connection_error(e)
+                raise
+            finally:
+                self._checkin(conn, healthy)
+        finally:
+            self._slots.release()
+
+    def send_message(self, msg: Message):
+        """Send on a pooled connection, reconnecting once if the server dropped it"""
+        for attempt in range(2):
+            try:
+                with self.connection() as smtp:
+                    smtp.send_message(msg)
+                with self._lock:
+                    self.sent += 1
+                return
+            except Exception as e:
+                if attempt or not _is_connection_error(e):
+                    raise
+                with self._lock:
+                    self.reconnects += 1
+                logger.warning(f"SMTP connection lost ({e}) - reconnecting")
+
+    def check(self) -> bool:
+        """Verify the server accepts our credentials, reusing a pooled session when one is warm"""
+        with self.connection() as smtp:
+            return smtp.noop()[0] == 250
+
+    def close(self):
+        """Quit every idle session, e.g. at shutdown"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            self._close(conn.smtp)
+
+    def stats(self) -> Dict[str, Any]:
+        """Connection reuse counters for health reporting"""
+        with self._lock:
+            return {
+                "size": self.size,
+                "idle": len(self._idle),
+                "connects": self.connects,
+                "reused": self.reused,
+                "reconnects": self.reconnects,
+                "retired": self.retired,
+                "sent": self.sent
+            }
@@ -7,21 +7,31 @@ import logging
 import os
 from typing import Dict, Any
 
-# Initialize Claude client safely
+from metrics import registry as metrics
+
+# Claude client, initialized safely on first use so importing this module doesn't load the SDK
 claude_client = None
+_claude_client_initialized = False
 anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
 
-if anthropic_api_key:
-    try:
-        import anthropic
-        claude_client = anthropic.Anthropic(api_key=anthropic_api_key)
-        logging.info("✅ Claude API client initialized successfully")
-    except Exception as e:
-        logging.error(f"❌ Claude API client initialization failed: {e}")
-        claude_client = None
-else:
+if not anthropic_api_key:
     logging.error("❌ ANTHROPIC_API_KEY not found in environment variables")
 
+def get_claude_client():
+    """Return the shared Claude client, building it on the first call"""
+    global claude_client, _claude_client_initialized
+    if not _claude_client_initialized:
+        _claude_client_initialized = True
+        if anthropic_api_key:
+            try:
+                import anthropic
+                claude_client = anthropic.Anthropic(api_key=anthropic_api_key)
+                logging.info("✅ Claude API client initialized successfully")
+            except Exception as e:
+                logging.error(f"❌ Claude API client initialization failed: {e}")
+                claude_client = None
+    return claude_client
+
 class SpeechOptimizedClaude:
     def __init__(self):
         self.model = "claude-sonnet-4-20250514"
@@ -170,6 +180,7 @@ Example tone: "Hey there! So basically, I'm your AI assistant and I handle all y
     async def generate_speech_response(self, user_message: str, context: str = "neutral", language: str = "english") -> str:
         """Generate optimized response for speech synthesis"""
         
+        claude_client = get_claude_client()
         if not claude_client:
             logging.error("Claude client not available")
             # Return context-appropriate fallback
@@ -194,18 +205,19 @@ Example tone: "Hey there! So basically, I'm your AI assistant and I handle all y
                 language_instruction = "Respond in English using natural American conversation patterns."
             
             # Generate response
-            message = claude_client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens_by_context.get(context, 140),
-                temperature=0.9,  # Higher for more natural variation
-                system=system_prompt + f"\n\nLanguage: {language_instruction}",
-                messages=[
-                    {
-                        "role": "user",
-                        "content": f"User just said: \"{user_message}\"\n\nRespond naturally as if you're having a phone conversation with them. Remember to keep it conversational and under 60 words."
-                    }
-                ]
-            )
+            with metrics.track('claude'):
+                message = claude_client.messages.create(
+                    model=self.model,
+                    max_tokens=self.max_tokens_by_context.get(context, 140),
+                    temperature=0.9,  # Higher for more natural variation
+                    system=system_prompt + f"\n\nLanguage: {language_instruction}",
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": f"User just said: \"{user_message}\"\n\nRespond naturally as if you're having a phone conversation with them. Remember to keep it conversational and under 60 words."
+                        }
+                    ]
+                )
             
             response_text = message.content[0].text.strip()
             
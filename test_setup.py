@@ -219,6 +219,52 @@ def test_speech_optimization():
         print(f"   ❌ Speech optimization error: {e}")
         return False
 
+def test_import_budget():
+    """Check that importing app.py stays within budget and leaves the heavy SDKs unloaded"""
+    print("\n⏱️  Testing Import-Time Budget...")
+    
+    import subprocess
+    
+    budget_ms = float(os.getenv('IMPORT_BUDGET_MS', '1000'))
+    deferred = {'anthropic', 'openai', 'twilio.rest', 'bs4', 'phonenumbers'}
+    
+    env = dict(os.environ)
+    env.setdefault('ANTHROPIC_API_KEY', 'import-budget-check')
+    try:
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import app'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env=env, capture_output=True, text=True, timeout=120
+        )
+    except Exception as e:
+        print(f"   ❌ Could not time import: {e}")
+        return False
+    
+    # Lines look like "import time:   self [us] | cumulative | module", nested modules indented
+    timings = {}
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, module = line.split('|')
+            if cumulative.strip().isdigit():
+                timings[module.strip()] = int(cumulative) / 1000
+    
+    if result.returncode != 0 or 'app' not in timings:
+        print(f"   ❌ app.py failed to import: {result.stderr.strip().splitlines()[-1:]}")
+        return False
+    
+    app_ms = timings['app']
+    loaded = sorted(module for module in deferred if module in timings)
+    slowest = sorted(((ms, module) for module, ms in timings.items() if module != 'app'), reverse=True)[:5]
+    
+    print(f"   {'✅' if app_ms <= budget_ms else '❌'} import app: {app_ms:.0f} ms (budget {budget_ms:.0f} ms)")
+    print(f"   ℹ️  Slowest imports: {', '.join(f'{module} {ms:.0f} ms' for ms, module in slowest)}")
+    if loaded:
+        print(f"   ❌ Loaded at import time but should be deferred: {', '.join(loaded)}")
+    else:
+        print(f"   ✅ Deferred until first use: {', '.join(sorted(deferred))}")
+    
+    return app_ms <= budget_ms and not loaded
+
 def test_flask_app():
     """Test if Flask app can start"""
     print("\n🌐 Testing Flask App Setup...")
@@ -257,6 +303,7 @@ def main():
         ("Enhanced Modules", test_enhanced_modules),
         ("Speech Optimization", test_speech_optimization),
         ("Flask App", test_flask_app),
+        ("Import Budget", test_import_budget),
     ]
     
     results = {}
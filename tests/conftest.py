@@ -0,0 +1,64 @@
+"""
+Shared pytest setup for the RinglyPro component tests
+The modules under test live at the repository root next to app.py
+"""
+
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session")
+def ringlypro_app(tmp_path_factory):
+    """app.py imported with test keys and throwaway local state; background services stay off"""
+    state = tmp_path_factory.mktemp("ringlypro")
+    os.environ.setdefault("ANTHROPIC_API_KEY", "test")
+    os.environ.setdefault("ELEVENLABS_API_KEY", "test")
+    os.environ.setdefault("AUDIO_STREAM_SECRET", "test")
+    os.environ.update({
+        "LOG_FILE": str(state / "ringlypro.log"),
+        "AUDIO_STORE_DIR": str(state / "audio"),
+        "CRM_OUTBOX_PATH": str(state / "outbox.db"),
+        "NOTIFICATION_QUEUE_PATH": str(state / "notifications.db")
+    })
+    import app
+    app._initialized_pid = os.getpid()
+    return app
+
+
+class CRMStubHandler(BaseHTTPRequestHandler):
+    """Answers every CRM request with the configured status and body, recording request paths"""
+    protocol_version = "HTTP/1.1"
+    status = 200
+    body = b'{"success": true}'
+    content_type = "application/json"
+    paths = []
+
+    def _respond(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.paths.append(self.path)
+        self.send_response(self.status)
+        self.send_header("Content-Type", self.content_type)
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    do_GET = do_POST = do_PUT = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def crm_stub():
+    """A local CRM stub; tests set status/body on the returned handler class. Yields (handler, base_url)"""
+    handler = type("CRMStub", (CRMStubHandler,), {"paths": []})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    yield handler, f"http://127.0.0.1:{server.server_address[1]}/api"
+    server.shutdown()
@@ -0,0 +1,73 @@
+"""Tests for extracting inline scripts and styles into fingerprinted assets"""
+
+import re
+
+import pytest
+
+from asset_pipeline import AssetPipeline
+
+PAGE = """<html><head>
+<style>body { color: red; }</style>
+<script src="https://cdn.example.com/lib.js"></script>
+<script type="application/ld+json">{"@type": "Organization"}</script>
+</head><body>
+<script>console.log("hi");</script>
+<script type="module">import "./x.js";</script>
+<script>   </script>
+</body></html>"""
+
+
+@pytest.fixture
+def pipeline():
+    return AssetPipeline(url_prefix="/static/assets/")
+
+
+def test_inline_blocks_become_hashed_asset_references(pipeline):
+    shell = pipeline.extract("voice", PAGE)
+
+    assert re.search(r'<link rel="stylesheet" href="/static/assets/voice\.[0-9a-f]{12}\.css">', shell)
+    assert re.search(r'<script src="/static/assets/voice\.[0-9a-f]{12}\.js"></script>', shell)
+    assert re.search(r'<script src="/static/assets/voice\.[0-9a-f]{12}\.js" type="module"></script>', shell)
+    assert "color: red" not in shell and "console.log" not in shell
+
+
+def test_external_data_and_empty_blocks_stay_in_the_page(pipeline):
+    shell = pipeline.extract("voice", PAGE)
+    assert '<script src="https://cdn.example.com/lib.js"></script>' in shell
+    assert '{"@type": "Organization"}' in shell
+    assert "<script>   </script>" in shell
+
+
+def test_assets_keep_their_content_and_type(pipeline):
+    shell = pipeline.extract("voice", PAGE)
+    filename = re.search(r"(voice\.[0-9a-f]{12}\.css)", shell).group(1)
+    asset = pipeline.get(filename)
+    assert asset.variants["identity"][1] == b"body { color: red; }"
+    assert asset.content_type.startswith("text/css")
+
+
+def test_fingerprint_changes_only_with_content(pipeline):
+    first = pipeline.extract("chat", "<script>a()</script>")
+    assert pipeline.extract("chat", "<script>a()</script>") == first
+    assert pipeline.extract("chat", "<script>b()</script>") != first
+    assert len(pipeline.stats()["assets"]) == 2
+
+
+def test_served_asset_is_immutable_and_revalidates(ringlypro_app):
+    client = ringlypro_app.app.test_client()
+    page = client.get("/chat").get_data(as_text=True)
+    url = re.search(r'src="(/static/assets/[^"]+\.js)"', page).group(1)
+
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "immutable" in response.headers["Cache-Control"]
+    assert response.headers["Content-Type"].startswith("application/javascript")
+    assert client.get(url, headers={"If-None-Match": response.headers["ETag"]}).status_code == 304
+    assert client.get("/static/assets/chat.000000000000.js").status_code == 404
+
+
+@pytest.mark.parametrize("attrs", ['type="text/javascript"', "type='text/javascript'", "type=text/javascript",
+                                   'TYPE="TEXT/JAVASCRIPT"'])
+def test_declared_javascript_type_is_extracted_however_it_is_quoted(pipeline, attrs):
+    shell = pipeline.extract("chat", f"<script {attrs}>run()</script>")
+    assert "run()" not in shell
@@ -0,0 +1,94 @@
+"""Tests for the TTL'd memory/disk audio store"""
+
+import os
+import time
+
+import pytest
+
+from audio_store import AudioStore
+from tts_cache import TTSAudioCache
+
+KEY = "a" * 32
+OTHER = "b" * 32
+
+
+def make_store(directory, **kwargs):
+    return AudioStore(str(directory), TTSAudioCache(), **kwargs)
+
+
+def age(store, key, seconds):
+    """Backdate a clip's file as if it had been idle for `seconds`"""
+    old = time.time() - seconds
+    for path in (store._path(key), store._pinned_path(key)):
+        if os.path.exists(path):
+            os.utime(path, (old, old))
+
+
+def test_clip_written_by_one_worker_is_read_by_another(tmp_path):
+    writer, reader = make_store(tmp_path), make_store(tmp_path)
+    writer.put(KEY, b"audio")
+    assert reader.get(KEY) == b"audio"
+    assert reader.exists(KEY)
+
+
+def test_invalid_keys_are_never_looked_up(tmp_path):
+    store = make_store(tmp_path)
+    assert store.get("../etc/passwd") is None
+    assert not store.exists("not-a-key")
+
+
+def test_sweep_expires_idle_files(tmp_path):
+    store = make_store(tmp_path, ttl_seconds=10)
+    store.put(KEY, b"audio")
+    age(store, KEY, 60)
+
+    store.sweep()
+
+    assert not os.path.exists(store._path(KEY))
+    assert store.stats()["expired"] == 1
+    assert make_store(tmp_path, ttl_seconds=10).get(KEY) is None
+
+
+def test_expired_file_is_not_served_before_the_sweep(tmp_path):
+    make_store(tmp_path, ttl_seconds=10).put(KEY, b"audio")
+    reader = make_store(tmp_path, ttl_seconds=10)
+    age(reader, KEY, 60)
+    assert reader.get(KEY) is None
+    assert not reader.exists(KEY)
+
+
+@pytest.mark.parametrize("pin_after_put", [False, True])
+def test_pinned_clip_survives_another_workers_sweep(tmp_path, pin_after_put):
+    pinning, sweeping = make_store(tmp_path, ttl_seconds=10), make_store(tmp_path, ttl_seconds=10)
+    if pin_after_put:
+        pinning.put(KEY, b"prompt")
+        pinning.pin(KEY)
+    else:
+        pinning.put(KEY, b"prompt", pinned=True)
+    age(pinning, KEY, 60)
+
+    sweeping.sweep()
+
+    assert sweeping.get(KEY) == b"prompt"
+    assert sweeping.stats()["pinned"] == 1
+
+
+def test_disk_cap_trims_oldest_unpinned_files(tmp_path):
+    store = make_store(tmp_path, max_disk_bytes=150)
+    store.put(KEY, b"x" * 100)
+    store.put(OTHER, b"y" * 100)
+    age(store, KEY, 5)
+
+    store.sweep()
+
+    assert not os.path.exists(store._path(KEY))
+    assert os.path.exists(store._path(OTHER))
+    assert store.stats()["trimmed"] == 1
+
+
+def test_discard_removes_both_tiers_and_the_pin(tmp_path):
+    store = make_store(tmp_path)
+    store.put(KEY, b"prompt", pinned=True)
+    store.discard(KEY)
+    assert store.get(KEY) is None
+    assert store.stats()["disk_files"] == 0
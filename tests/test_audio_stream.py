@@ -0,0 +1,62 @@
+"""Tests for signed /audio/stream URLs"""
+
+from urllib.parse import urlsplit, parse_qs
+
+import pytest
+
+AUDIO = b"\xff\xfb" + b"\x00" * 2048
+
+
+@pytest.fixture
+def stream_url(ringlypro_app):
+    """A stream URL as handed to Twilio, with the clip already in the store so no synthesis runs"""
+    phone = ringlypro_app.services.phone
+    url = phone.render_rachel_clip("Thanks for calling RinglyPro, stream test", stream=True)
+    assert url.startswith("/audio/stream/rachel_")
+    cache_key = urlsplit(url).path[len("/audio/stream/rachel_"):-len(".mp3")]
+    ringlypro_app.audio_store.put(cache_key, AUDIO)
+    yield url
+    ringlypro_app.audio_store.discard(cache_key)
+
+
+def test_signed_url_is_served(ringlypro_app, stream_url):
+    response = ringlypro_app.app.test_client().get(stream_url)
+    assert response.status_code == 200
+    assert response.data == AUDIO
+
+
+def test_tampered_signature_is_rejected(ringlypro_app, stream_url):
+    path, query = stream_url.split("?", 1)
+    params = parse_qs(query)
+    response = ringlypro_app.app.test_client().get(
+        path, query_string={"text": params["text"][0], "sig": "0" * 32})
+    assert response.status_code == 403
+
+
+def test_text_must_match_the_signed_key(ringlypro_app, stream_url):
+    path, query = stream_url.split("?", 1)
+    params = parse_qs(query)
+    # Valid signature for the key, but different text would synthesize something we never issued
+    response = ringlypro_app.app.test_client().get(
+        path, query_string={"text": "Say something else entirely", "sig": params["sig"][0]})
+    assert response.status_code == 403
+
+
+def test_missing_text_is_rejected(ringlypro_app, stream_url):
+    path, query = stream_url.split("?", 1)
+    response = ringlypro_app.app.test_client().get(path, query_string={"sig": parse_qs(query)["sig"][0]})
+    assert response.status_code == 403
+
+
+def test_signature_depends_on_the_secret(ringlypro_app, monkeypatch):
+    phone = ringlypro_app.services.phone
+    signature = phone.sign_stream_key("a" * 32)
+    monkeypatch.setattr(ringlypro_app, "AUDIO_STREAM_SECRET", "rotated")
+    assert phone.sign_stream_key("a" * 32) != signature
+
+
+def test_streaming_refused_without_a_secret(ringlypro_app, stream_url, monkeypatch):
+    monkeypatch.setattr(ringlypro_app, "AUDIO_STREAM_SECRET", None)
+    assert ringlypro_app.app.test_client().get(stream_url).status_code == 403
+    with pytest.raises(RuntimeError):
+        ringlypro_app.services.phone.sign_stream_key("a" * 32)
@@ -0,0 +1,74 @@
+"""Tests for booking through the outbox: confirmations only once the CRM has accepted the appointment"""
+
+from types import SimpleNamespace
+
+import pytest
+
+BOOKING = {"name": "Test Caller", "email": "caller@example.com", "phone": "8132441234",
+           "date": "2030-03-05", "time": "10:00"}
+
+
+@pytest.fixture
+def booking(ringlypro_app, crm_stub, monkeypatch):
+    """AppointmentManager against the CRM stub, recording confirmations and slot invalidations"""
+    stub, base_url = crm_stub
+    monkeypatch.setattr(ringlypro_app.crm_client, "base_url", base_url)
+    monkeypatch.setattr(ringlypro_app.crm_client, "breakers", {})
+    monkeypatch.setattr(ringlypro_app.crm_client, "latency", {})
+    # Replays are driven by the test, not the background replayer
+    monkeypatch.setattr(ringlypro_app.crm_outbox, "wake", lambda: None)
+
+    recorded = SimpleNamespace(stub=stub, manager=ringlypro_app.services.appointments, confirmed=[], invalidated=[])
+    monkeypatch.setattr(ringlypro_app.AppointmentManager, "queue_appointment_confirmations",
+                        staticmethod(recorded.confirmed.append))
+    monkeypatch.setattr(ringlypro_app.slot_cache, "invalidate", recorded.invalidated.append)
+    return recorded
+
+
+def replay(ringlypro_app):
+    with ringlypro_app.crm_outbox._connect() as conn:
+        conn.execute("UPDATE outbox SET next_attempt_at = 0")
+    return ringlypro_app.crm_outbox.replay_due()
+
+
+def test_accepted_booking_is_confirmed(booking):
+    booking.stub.body = b'{"success": true, "appointment": {"id": 7}}'
+    success, _, appointment = booking.manager.book_appointment(dict(BOOKING))
+
+    assert success
+    assert (appointment["status"], appointment["id"], appointment["crm_synced"]) == ("confirmed", 7, True)
+    assert booking.confirmed == [appointment]
+    assert booking.invalidated == ["2030-03-05"]
+
+
+def test_rejected_booking_fails_without_confirmations(booking):
+    booking.stub.status, booking.stub.body = 409, b'{"error": "slot taken"}'
+    success, message, _ = booking.manager.book_appointment(dict(BOOKING))
+
+    assert not success and "slot taken" in message
+    assert booking.confirmed == [] and booking.invalidated == []
+
+
+def test_outage_returns_pending_and_confirms_after_replay(ringlypro_app, booking):
+    booking.stub.status = 503
+    success, _, appointment = booking.manager.book_appointment(dict(BOOKING))
+
+    assert success and appointment["status"] == "pending" and not appointment["crm_synced"]
+    assert booking.confirmed == [] and booking.invalidated == []
+
+    booking.stub.status, booking.stub.body = 200, b'{"success": true, "appointment": {"id": 9}}'
+    assert replay(ringlypro_app) == 1
+    confirmed = booking.confirmed
+    assert [(item["confirmation_code"], item["status"], item["id"]) for item in confirmed] == \
+        [(appointment["confirmation_code"], "confirmed", 9)]
+    assert booking.invalidated == ["2030-03-05"]
+
+
+def test_pending_booking_refused_on_replay_is_never_confirmed(ringlypro_app, booking):
+    booking.stub.status = 503
+    booking.manager.book_appointment(dict(BOOKING))
+
+    booking.stub.status, booking.stub.body = 409, b'{"error": "slot taken"}'
+    replay(ringlypro_app)
+
+    assert booking.confirmed == [] and booking.invalidated == []
@@ -0,0 +1,91 @@
+"""Tests for the background call-event pipeline"""
+
+import threading
+
+from call_events import CallEventQueue, BATCH_REJECTED
+
+
+def held(events_queue):
+    """Keep the worker from starting so events pile up in the queue"""
+    events_queue.start = lambda: None
+    return events_queue
+
+
+def release(events_queue):
+    del events_queue.start
+    events_queue.start()
+    assert events_queue.flush(timeout=5)
+
+
+def test_events_are_delivered_in_order_off_the_request_thread():
+    delivered = []
+    threads = set()
+
+    def sender(event):
+        delivered.append(event["n"])
+        threads.add(threading.current_thread().name)
+        return True
+
+    events = CallEventQueue(sender)
+    for n in range(20):
+        assert events.submit({"n": n})
+    assert events.flush(timeout=5)
+
+    assert delivered == list(range(20))
+    assert threads == {"call-event-worker"}
+    assert events.stats()["sent"] == 20
+
+
+def test_full_queue_drops_instead_of_blocking():
+    events = held(CallEventQueue(lambda event: True, maxsize=2))
+    results = [events.submit({"CallSid": f"CA{n}"}) for n in range(3)]
+
+    assert results == [True, True, False]
+    assert events.stats()["dropped"] == 1
+    release(events)
+    assert events.stats()["sent"] == 2
+
+
+def test_failed_sends_are_counted():
+    events = CallEventQueue(lambda event: event["n"] % 2 == 0)
+    for n in range(4):
+        events.submit({"n": n})
+    events.flush(timeout=5)
+    assert (events.stats()["sent"], events.stats()["failed"]) == (2, 2)
+
+
+def test_events_arriving_together_go_out_as_one_batch():
+    batches = []
+    events = held(CallEventQueue(lambda event: True, batch_sender=lambda batch: batches.append(batch) or True,
+                                 batch_size=4, batch_window=0.05))
+    for n in range(6):
+        events.submit({"n": n})
+    release(events)
+
+    assert [[event["n"] for event in batch] for batch in batches] == [[0, 1, 2, 3], [4, 5]]
+    assert events.stats()["avg_batch_size"] == 3.0
+
+
+def test_missing_batch_endpoint_falls_back_to_single_sends():
+    singles = []
+    events = held(CallEventQueue(lambda event: singles.append(event["n"]) or True,
+                                 batch_sender=lambda batch: None))
+    for n in range(3):
+        events.submit({"n": n})
+    release(events)
+
+    assert singles == [0, 1, 2]
+    assert events.stats()["batching"] is False
+
+
+def test_rejected_batch_is_resent_individually_and_batching_stays_on():
+    singles = []
+    events = held(CallEventQueue(lambda event: singles.append(event["n"]) or True,
+                                 batch_sender=lambda batch: BATCH_REJECTED))
+    for n in range(3):
+        events.submit({"n": n})
+    release(events)
+
+    stats = events.stats()
+    assert singles == [0, 1, 2]
+    assert (stats["batching"], stats["rejected_batches"], stats["sent"]) == (True, 1, 3)
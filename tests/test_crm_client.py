@@ -0,0 +1,75 @@
+"""Tests for the pooled CRM API client: breakers per route template and response handling"""
+
+import pytest
+
+from outbox import RejectedWrite
+
+
+@pytest.fixture
+def crm(ringlypro_app, crm_stub):
+    """A CRMAPIClient against the stub: no retries, breaker opens after 2 failures"""
+    _, base_url = crm_stub
+    client = ringlypro_app.CRMAPIClient()
+    client.base_url = base_url
+    client.max_retries = 0
+    client.failure_threshold = 2
+    return client
+
+
+@pytest.fixture
+def stub(crm_stub):
+    return crm_stub[0]
+
+
+@pytest.mark.parametrize("method, endpoint, key", [
+    ("get", "/appointments/confirmation/AB12CD34", "GET /appointments/confirmation/:id"),
+    ("GET", "/appointments/available-slots?date=2030-01-01", "GET /appointments/available-slots"),
+    ("PUT", "appointments/42/", "PUT /appointments/:id"),
+    ("POST", "/calls/webhook", "POST /calls/webhook")
+])
+def test_endpoint_key_uses_the_route_template(ringlypro_app, method, endpoint, key):
+    assert ringlypro_app.CRMAPIClient.endpoint_key(method, endpoint) == key
+
+
+def test_codes_share_one_breaker(crm):
+    crm._make_request("GET", "/appointments/confirmation/AAAA1111")
+    crm._make_request("GET", "/appointments/confirmation/BBBB2222")
+    assert list(crm.stats()) == ["GET /appointments/confirmation/:id"]
+
+
+def test_server_errors_open_the_breaker_and_fail_fast(crm, stub):
+    stub.status = 503
+    assert crm._make_request("GET", "/health") is None
+    assert crm._make_request("GET", "/health") is None
+    assert crm.stats()["GET /health"]["breaker"]["state"] == "open"
+
+    stub.status = 200
+    assert crm._make_request("GET", "/health") is None
+    assert len(stub.paths) == 2
+
+
+def test_client_errors_do_not_count_against_the_breaker(crm, stub):
+    stub.status = 404
+    for _ in range(3):
+        assert crm._make_request("GET", "/appointments/confirmation/NOPE") is None
+    assert crm.stats()["GET /appointments/confirmation/:id"]["breaker"]["state"] == "closed"
+
+
+def test_non_json_success_counts_as_delivered_for_writes_only(crm, stub):
+    stub.status, stub.body, stub.content_type = 201, b"Created", "text/plain"
+    assert crm._make_request("POST", "/inquiries", data={"inquiry": "hi"}) == {"success": True}
+    assert crm._make_request("GET", "/health") is None
+
+
+def test_permanent_rejection_raises_for_outbox_writes(crm, stub):
+    stub.status, stub.body = 409, b'{"error": "slot taken"}'
+    with pytest.raises(RejectedWrite) as excinfo:
+        crm._make_request("POST", "/appointments", data={}, raise_rejections=True)
+    assert (excinfo.value.status_code, excinfo.value.detail) == (409, "slot taken")
+    # Without the flag callers keep the old None contract
+    assert crm._make_request("POST", "/appointments", data={}) is None
+
+
+def test_rate_limit_is_not_a_rejection(crm, stub):
+    stub.status = 429
+    assert crm._make_request("POST", "/appointments", data={}, raise_rejections=True) is None
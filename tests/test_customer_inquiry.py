@@ -0,0 +1,34 @@
+"""Tests for saving chat inquiries with the SMS notification's real Twilio SID"""
+
+from concurrent.futures import Future
+
+import pytest
+
+
+@pytest.fixture
+def saved(ringlypro_app, monkeypatch):
+    saved = []
+    monkeypatch.setattr(ringlypro_app.crm_outbox, "submit",
+                        lambda method, endpoint, payload, **kwargs: saved.append(payload))
+    return saved
+
+
+def test_inquiry_waits_for_the_sid(ringlypro_app, saved):
+    sms_sid = Future()
+    ringlypro_app.save_customer_inquiry_after_sms("+18132441234", "pricing?", sms_sid)
+    assert saved == []
+
+    sms_sid.set_result("SM123")
+    assert [(inquiry["smsSent"], inquiry["smsSid"]) for inquiry in saved] == [(True, "SM123")]
+
+
+def test_failed_sms_is_recorded_without_a_sid(ringlypro_app, saved):
+    sms_sid = Future()
+    sms_sid.set_exception(RuntimeError("SMS queue full (500)"))
+    ringlypro_app.save_customer_inquiry_after_sms("+18132441234", "pricing?", sms_sid)
+    assert [(inquiry["smsSent"], inquiry["smsSid"]) for inquiry in saved] == [(False, "")]
+
+
+def test_without_twilio_nothing_is_queued(ringlypro_app, monkeypatch):
+    monkeypatch.setattr(ringlypro_app, "twilio_account_sid", None)
+    assert ringlypro_app.send_sms_notification("+18132441234", "pricing?") == (False, None)
@@ -0,0 +1,46 @@
+"""Tests for the BM25 FAQ index"""
+
+from faq_index import FAQIndex, tokenize
+
+FAQ = {
+    "what is ringlypro?": "An AI receptionist.",
+    "how much does ringlypro cost?": "Plans start at $97.",
+    "how do i book a demo?": "Use the booking form.",
+    "do you integrate with hubspot?": "Yes, HubSpot sync is built in.",
+    "what are your support hours?": "Support is available 24/7."
+}
+
+
+def test_tokenize_drops_stop_words_and_stems():
+    assert tokenize("What are the Plans?") == ["plan"]
+    # An all-stop-word question stays searchable
+    assert tokenize("what is it") == ["what", "is", "it"]
+
+
+def test_exact_question_matches_with_full_confidence():
+    question, confidence = FAQIndex(FAQ).best_match("How much does RinglyPro cost?")
+    assert question == "how much does ringlypro cost?"
+    assert confidence > 0.99
+
+
+def test_rephrased_question_matches():
+    assert FAQIndex(FAQ).best_match("booking a demo")[0] == "how do i book a demo?"
+
+
+def test_typo_is_corrected_to_an_indexed_word():
+    assert FAQIndex(FAQ).best_match("hubspott integration")[0] == "do you integrate with hubspot?"
+
+
+def test_unrelated_question_has_no_match():
+    index = FAQIndex(FAQ)
+    assert index.best_match("recommend a pizza place downtown") is None
+    assert index.search("zzzz qqqq") == []
+
+
+def test_best_passage_uses_query_coverage():
+    passage = "ringlypro answers calls, books appointments and syncs with hubspot crm records"
+    index = FAQIndex({passage: "https://ringlypro.com/features"})
+    # A long passage never reaches match confidence, but it contains everything the query asks
+    assert index.best_match("does it sync with hubspot") is None
+    assert index.best_passage("does it sync with hubspot")[0] == passage
+    assert index.best_passage("hubspot pricing discount coupon") is None
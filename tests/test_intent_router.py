@@ -0,0 +1,44 @@
+"""Tests for the compiled keyword intent router"""
+
+import re
+
+from intent_router import IntentRouter, _trie_pattern
+
+ROUTER = IntentRouter([
+    ("demo_booking", 1, ["demo", "appointment", "book"]),
+    ("pricing", 2, ["price", "pricing", "cost"]),
+    ("subscription", 3, ["subscribe", "want to subscribe", "sign up"]),
+    ("support", 4, ["help", "support"])
+])
+
+
+def test_trie_pattern_matches_every_keyword_and_prefers_the_longest():
+    keywords = ["book", "book an", "booking", "bot"]
+    pattern = re.compile(_trie_pattern(keywords))
+    for keyword in keywords:
+        assert pattern.fullmatch(keyword)
+    assert pattern.match("book an appointment").group() == "book an"
+
+
+def test_lower_priority_number_wins():
+    assert ROUTER.intent("What does it cost to book a demo?") == "demo_booking"
+    assert ROUTER.intent("Can you help me with pricing") == "pricing"
+
+
+def test_no_keyword_means_no_intent():
+    assert ROUTER.intent("hello there") is None
+    assert ROUTER.classify("hello there") is None
+
+
+def test_longer_keyword_keeps_the_intents_of_keywords_it_contains():
+    result = ROUTER.classify("I WANT TO SUBSCRIBE")
+    assert result["intent"] == "subscription"
+    assert [hit["keyword"] for hit in result["matches"]] == ["want to subscribe"]
+
+
+def test_classify_agrees_with_intent_and_reports_spans():
+    text = "need support, then pricing and support again"
+    result = ROUTER.classify(text)
+    assert result["intent"] == ROUTER.intent(text) == "pricing"
+    assert result["spans"] == [(19, 26)]
+    assert {hit["intent"] for hit in result["matches"]} == {"pricing", "support"}
@@ -0,0 +1,78 @@
+"""Tests for the queued logging pipeline and hot-path sampling"""
+
+import io
+import logging
+import queue
+
+import pytest
+
+from log_pipeline import DroppingQueueHandler, LogPipeline, SamplingFilter, parse_sample_rates
+
+
+def record(name, level=logging.INFO):
+    return logging.LogRecord(name, level, __file__, 1, "message", None, None)
+
+
+def test_parse_sample_rates_ignores_malformed_entries():
+    assert parse_sample_rates("ringlypro.hotpath=10, app=5,bad,zero=0,one=1,=3,x=y") == \
+        {"ringlypro.hotpath": 10, "app": 5}
+    assert parse_sample_rates("") == {}
+
+
+def test_keeps_one_in_n_for_the_logger_and_its_children():
+    sampler = SamplingFilter({"ringlypro.hotpath": 5})
+    kept = [sampler.filter(record("ringlypro.hotpath.chat")) for _ in range(20)]
+    assert kept.count(True) == 4
+    assert sampler.sampled_out == 16
+
+
+def test_warnings_and_other_loggers_are_never_sampled():
+    sampler = SamplingFilter({"ringlypro.hotpath": 1000})
+    sampler.filter(record("ringlypro.hotpath"))
+    assert sampler.filter(record("ringlypro.hotpath", logging.WARNING))
+    assert sampler.filter(record("ringlypro.hotpathology"))
+    assert sampler.filter(record("app"))
+
+
+def test_scoped_decision_keeps_or_drops_a_whole_request():
+    requests = [{} for _ in range(10)]
+    current = {"request": None}
+    sampler = SamplingFilter({"ringlypro.hotpath": 5}, scope=lambda: current["request"])
+
+    kept_per_request = []
+    for request in requests:
+        current["request"] = request
+        kept_per_request.append([sampler.filter(record("ringlypro.hotpath")) for _ in range(3)])
+
+    assert all(len(set(lines)) == 1 for lines in kept_per_request)
+    assert [lines[0] for lines in kept_per_request].count(True) == 2
+
+
+def test_full_queue_drops_instead_of_blocking():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+    handler.enqueue(record("app"))
+    handler.enqueue(record("app"))
+    assert handler.dropped == 1
+
+
+@pytest.fixture
+def logger():
+    logger = logging.getLogger("tests.log_pipeline")
+    logger.propagate = False
+    yield logger
+    logger.handlers.clear()
+
+
+def test_records_reach_the_file_and_console_through_the_listener(tmp_path, logger):
+    console = io.StringIO()
+    pipeline = LogPipeline(str(tmp_path / "app.log"), stream=console,
+                           sample_rates={"tests.log_pipeline.hot": 2}).install(logger)
+    logger.info("booked %s", "AB12CD34")
+    for n in range(4):
+        logger.getChild("hot").info("hot line %d", n)
+    pipeline.stop()
+
+    written = (tmp_path / "app.log").read_text()
+    assert "booked AB12CD34" in written and "booked AB12CD34" in console.getvalue()
+    assert written.count("hot line") == 2
+    assert pipeline.stats()["sampled_out"] == 2
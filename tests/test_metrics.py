@@ -0,0 +1,140 @@
+"""Tests for the per-thread metrics registry, its Prometheus rendering and the /metrics route"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from metrics import MetricsRegistry, instrument_session
+
+
+def lines_of(registry):
+    return registry.render().splitlines()
+
+
+def test_counters_from_many_threads_are_merged_on_scrape():
+    registry = MetricsRegistry()
+    release = threading.Event()
+    counted = threading.Barrier(5)
+
+    def work():
+        for _ in range(100):
+            registry.inc("jobs_total", queue="sms")
+        counted.wait()
+        release.wait()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    counted.wait()
+    assert 'jobs_total{queue="sms"} 400' in lines_of(registry)
+
+    release.set()
+    for thread in threads:
+        thread.join()
+    registry.inc("jobs_total", queue="sms")
+    # Finished threads' shards are folded into the retired total rather than dropped
+    assert 'jobs_total{queue="sms"} 401' in lines_of(registry)
+    assert len(registry._shards) == 1
+
+
+def test_histogram_buckets_are_cumulative_with_sum_and_count():
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry.describe("latency_seconds", "histogram", "Call latency")
+    for value in (0.05, 0.1, 0.5, 3.0):
+        registry.observe("latency_seconds", value, route="/chat")
+
+    lines = lines_of(registry)
+    assert lines[:2] == ["# HELP latency_seconds Call latency", "# TYPE latency_seconds histogram"]
+    assert lines[2:] == [
+        'latency_seconds_bucket{route="/chat",le="0.1"} 2',
+        'latency_seconds_bucket{route="/chat",le="1"} 3',
+        'latency_seconds_bucket{route="/chat",le="+Inf"} 4',
+        'latency_seconds_sum{route="/chat"} 3.65',
+        'latency_seconds_count{route="/chat"} 4',
+    ]
+
+
+def test_undescribed_counter_gets_a_default_header_and_escaped_labels():
+    registry = MetricsRegistry()
+    registry.inc("odd_total", 2, reason='bad "quote"\n')
+    assert lines_of(registry) == [
+        "# HELP odd_total odd_total",
+        "# TYPE odd_total counter",
+        'odd_total{reason="bad \\"quote\\"\\n"} 2',
+    ]
+
+
+def test_track_records_errors_and_reraises():
+    registry = MetricsRegistry()
+    with registry.track("smtp"):
+        pass
+    with pytest.raises(ValueError):
+        with registry.track("smtp"):
+            raise ValueError("refused")
+
+    lines = lines_of(registry)
+    assert 'ringlypro_upstream_requests_total{outcome="ok",upstream="smtp"} 1' in lines
+    assert 'ringlypro_upstream_requests_total{outcome="error",upstream="smtp"} 1' in lines
+    assert 'ringlypro_upstream_request_duration_seconds_count{upstream="smtp"} 2' in lines
+
+
+def test_failing_collector_is_skipped_and_none_values_are_left_out():
+    registry = MetricsRegistry()
+
+    def broken():
+        raise RuntimeError("database is locked")
+
+    registry.register_collector(broken)
+    registry.register_collector(lambda: [
+        ("queue_depth", "Items waiting", {"queue": "sms"}, 3),
+        ("queue_depth", "Items waiting", {"queue": "outbox"}, None),
+    ])
+    assert lines_of(registry) == [
+        "# HELP queue_depth Items waiting",
+        "# TYPE queue_depth gauge",
+        'queue_depth{queue="sms"} 3',
+    ]
+
+
+def test_instrument_session_counts_5xx_and_exceptions_as_errors():
+    registry = MetricsRegistry()
+    responses = iter([SimpleNamespace(status_code=200), SimpleNamespace(status_code=404),
+                      SimpleNamespace(status_code=503), ConnectionError("reset")])
+
+    def send(prepared, **kwargs):
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    session = instrument_session(SimpleNamespace(send=send), "crm", registry)
+    assert session.send("GET /a").status_code == 200
+    assert session.send("GET /b").status_code == 404
+    assert session.send("GET /c").status_code == 503
+    with pytest.raises(ConnectionError):
+        session.send("GET /d")
+
+    lines = lines_of(registry)
+    assert 'ringlypro_upstream_requests_total{outcome="ok",upstream="crm"} 2' in lines
+    assert 'ringlypro_upstream_requests_total{outcome="error",upstream="crm"} 2' in lines
+
+
+def test_metrics_route_serves_request_counts_and_caps_breaker_labels(ringlypro_app, monkeypatch):
+    breakers = {f"GET /route/{index:03d}": {"breaker": {"state": "open"}, "latency": {}} for index in range(60)}
+    monkeypatch.setattr(ringlypro_app.crm_client, "stats", lambda: breakers)
+    client = ringlypro_app.app.test_client()
+    client.get("/metrics")
+
+    # The first scrape's own request shows up in the second
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    assert response.headers["Cache-Control"] == "no-store"
+
+    lines = response.get_data(as_text=True).splitlines()
+    assert any(line.startswith('ringlypro_http_requests_total{method="GET",route="/metrics",status="200"}')
+               for line in lines)
+    labelled = [line for line in lines if line.startswith("ringlypro_crm_breaker_open{")]
+    assert len(labelled) == ringlypro_app.METRICS_MAX_BREAKER_LABELS
+    assert "ringlypro_crm_breakers_open 60" in lines
@@ -0,0 +1,136 @@
+"""Tests for the booking notification queue and its durable-queue base"""
+
+import threading
+import time
+
+import pytest
+
+from durable_queue import DurableQueue
+from notifications import NotificationQueue
+
+
+class Channel:
+    """Handler stub: succeeds unless `fail` is set, records payloads and the sending thread"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.sent = []
+        self.threads = set()
+
+    def __call__(self, payload):
+        self.threads.add(threading.current_thread().name)
+        if self.fail is True:
+            return False
+        if self.fail:
+            raise RuntimeError(self.fail)
+        self.sent.append(payload["code"])
+        return True
+
+
+@pytest.fixture
+def channels():
+    return {"email": Channel(), "sms": Channel()}
+
+
+@pytest.fixture
+def jobs(tmp_path, channels):
+    queue = NotificationQueue(str(tmp_path / "notifications.db"), channels, max_attempts=3, retry_base=30)
+    # Tests drive the workers themselves
+    queue.wake = lambda: None
+    return queue
+
+
+def make_due(queue):
+    with queue._connect() as conn:
+        conn.execute("UPDATE notification_jobs SET next_attempt_at = 0")
+
+
+def test_base_class_requires_the_row_hooks(tmp_path):
+    class Incomplete(DurableQueue):
+        TABLE = "jobs"
+        SCHEMA = "CREATE TABLE IF NOT EXISTS jobs (id INTEGER PRIMARY KEY)"
+
+    with pytest.raises(TypeError):
+        Incomplete(str(tmp_path / "jobs.db"))
+
+
+def test_one_job_per_channel_and_enqueue_is_idempotent(jobs, channels):
+    assert jobs.enqueue("CODE1", {"code": "CODE1"}) == ["email", "sms"]
+    jobs.enqueue("CODE1", {"code": "CODE1"})
+    assert jobs.run_pending() == 2
+    assert channels["email"].sent == channels["sms"].sent == ["CODE1"]
+    assert {channel: state["status"] for channel, state in jobs.status("CODE1").items()} == \
+        {"email": "sent", "sms": "sent"}
+
+
+def test_failed_send_is_retried_with_backoff(jobs, channels):
+    channels["sms"].fail = "twilio down"
+    jobs.enqueue("CODE1", {"code": "CODE1"})
+    jobs.run_pending()
+
+    sms = jobs.status("CODE1")["sms"]
+    assert (sms["status"], sms["attempts"], sms["last_error"]) == ("retrying", 1, "twilio down")
+    # Not due again until the backoff passes
+    assert jobs.run_pending() == 0
+
+    channels["sms"].fail = False
+    make_due(jobs)
+    assert jobs.run_pending() == 1
+    assert jobs.status("CODE1")["sms"]["status"] == "sent"
+
+
+def test_backoff_doubles_up_to_the_cap(jobs):
+    assert [jobs._backoff(attempts) for attempts in (1, 2, 3)] == [30, 60, 120]
+    assert jobs._backoff(50) == jobs.max_backoff
+
+
+def test_gives_up_after_max_attempts(jobs, channels):
+    channels["email"].fail = True
+    jobs.enqueue("CODE1", {"code": "CODE1"}, ["email"])
+    for _ in range(5):
+        make_due(jobs)
+        jobs.run_pending()
+
+    email = jobs.status("CODE1")["email"]
+    assert (email["status"], email["attempts"]) == ("failed", 3)
+    assert jobs.stats()["failed"] == 1
+
+
+def test_unknown_channel_fails_the_job(jobs):
+    jobs.enqueue("CODE1", {"code": "CODE1"}, ["fax"])
+    jobs.run_pending()
+    assert "no handler" in jobs.status("CODE1")["fax"]["last_error"]
+
+
+def test_worker_threads_send_queued_jobs(tmp_path, channels):
+    queue = NotificationQueue(str(tmp_path / "notifications.db"), channels, poll_interval=0.05)
+    queue.enqueue("CODE1", {"code": "CODE1"})
+    deadline = time.monotonic() + 5
+    while queue.stats()["sent"] < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert queue.stats()["sent"] == 2
+    assert channels["email"].threads <= {"notification-worker-0", "notification-worker-1"}
+
+
+def test_two_processes_never_send_the_same_job(tmp_path, channels):
+    path = str(tmp_path / "notifications.db")
+    first, second = NotificationQueue(path, channels), NotificationQueue(path, channels)
+    first.wake = second.wake = lambda: None
+    first.enqueue("CODE1", {"code": "CODE1"}, ["email"])
+
+    claimed = first._claim_due(1)
+    assert second._claim_due(1) == []
+    first._run(claimed[0])
+    assert second.run_pending() == 0
+    assert channels["email"].sent == ["CODE1"]
+
+
+def test_prune_keeps_pending_jobs(jobs, channels):
+    channels["sms"].fail = "down"
+    jobs.enqueue("CODE1", {"code": "CODE1"})
+    jobs.run_pending()
+    with jobs._connect() as conn:
+        conn.execute("UPDATE notification_jobs SET updated_at = 1")
+    jobs.prune()
+    assert list(jobs.status("CODE1")) == ["sms"]
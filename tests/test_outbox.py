@@ -0,0 +1,180 @@
+"""Tests for the durable CRM outbox: leases, replay, dead-lettering and delivery callbacks"""
+
+import time
+
+import pytest
+
+from outbox import CRMOutbox, RejectedWrite, REPLAY_BATCH
+
+
+class Sender:
+    """Outbox sender stub: returns `result`, raises `error`, records every call"""
+
+    def __init__(self):
+        self.calls = []
+        self.result = {"success": True}
+        self.error = None
+
+    def __call__(self, method, endpoint, payload, idempotency_key):
+        self.calls.append((method, endpoint, payload, idempotency_key))
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.fixture
+def sender():
+    return Sender()
+
+
+@pytest.fixture
+def outbox(tmp_path, sender):
+    box = CRMOutbox(str(tmp_path / "outbox.db"), sender, replay_interval=0.01, max_attempts=3)
+    # Tests drive replays themselves
+    box.wake = lambda: None
+    return box
+
+
+def make_due(outbox):
+    with outbox._connect() as conn:
+        conn.execute("UPDATE outbox SET next_attempt_at = 0")
+
+
+def test_inline_delivery(outbox, sender):
+    delivery = outbox.submit("post", "/inquiries", {"a": 1}, idempotency_key="k1", attempt_inline=True)
+    assert delivery == {"idempotency_key": "k1", "delivered": True, "result": {"success": True}, "rejected": None}
+    assert sender.calls == [("POST", "/inquiries", {"a": 1}, "k1")]
+    assert outbox.stats()["pending"] == 0
+
+
+def test_outage_keeps_the_write_for_replay_with_the_same_key(outbox, sender):
+    sender.result = None
+    delivery = outbox.submit("POST", "/inquiries", {"a": 1}, attempt_inline=True)
+    assert not delivery["delivered"] and delivery["rejected"] is None
+    assert outbox.stats()["pending"] == 1
+
+    sender.result = {"success": True}
+    make_due(outbox)
+    assert outbox.replay_due() == 1
+    assert [call[3] for call in sender.calls] == [delivery["idempotency_key"]] * 2
+    assert outbox.stats()["pending"] == 0
+
+
+def test_resubmitting_a_key_does_not_duplicate_the_row(outbox):
+    outbox.submit("POST", "/appointments", {"a": 1}, idempotency_key="CODE1")
+    outbox.submit("POST", "/appointments", {"a": 1}, idempotency_key="CODE1")
+    assert outbox.stats()["pending"] == 1
+
+
+def test_rows_are_not_replayed_before_their_backoff(outbox, sender):
+    sender.result = None
+    outbox.submit("POST", "/inquiries", {}, attempt_inline=True)
+    assert outbox.replay_due() == 0
+    assert len(sender.calls) == 1
+
+
+def test_leased_row_is_not_claimed_twice(outbox, sender):
+    outbox.submit("POST", "/inquiries", {})
+    first = outbox._claim_due(10)
+    assert len(first) == 1
+    # Another worker (or process) scanning meanwhile finds nothing to send
+    assert outbox._claim_due(10) == []
+    outbox._release(first)
+    assert len(outbox._claim_due(10)) == 1
+
+
+def test_expired_lease_is_reclaimed(outbox):
+    outbox.submit("POST", "/inquiries", {})
+    outbox._claim_due(10)
+    with outbox._connect() as conn:
+        conn.execute("UPDATE outbox SET claimed_until = ?", (time.time() - 1,))
+    assert len(outbox._claim_due(10)) == 1
+
+
+def test_replay_stops_at_the_first_failure_and_releases_the_rest(outbox, sender):
+    for n in range(3):
+        outbox.submit("POST", "/inquiries", {"n": n})
+    sender.result = None
+
+    assert outbox.replay_due() == 0
+    assert len(sender.calls) == 1
+    # The untried rows were released, not left leased until the lease expires
+    assert len(outbox._claim_due(10)) == 2
+
+
+def test_rejected_write_is_dead_lettered_and_later_rows_still_replay(outbox):
+    def sender(method, endpoint, payload, idempotency_key):
+        if payload["n"] == 0:
+            raise RejectedWrite(409, "slot taken")
+        return {"success": True}
+
+    outbox.sender = sender
+    outbox.submit("POST", "/appointments", {"n": 0})
+    outbox.submit("POST", "/appointments", {"n": 1})
+
+    assert outbox.replay_due() == 1
+    stats = outbox.stats()
+    assert (stats["pending"], stats["dead"], stats["rejected"]) == (0, 1, 1)
+
+
+def test_inline_rejection_is_returned_and_not_replayed(outbox, sender):
+    sender.error = RejectedWrite(422, "bad phone")
+    delivery = outbox.submit("POST", "/appointments", {}, attempt_inline=True)
+    assert delivery["rejected"].status_code == 422
+    assert outbox.stats()["dead"] == 1
+    make_due(outbox)
+    assert outbox.replay_due() == 0
+    assert len(sender.calls) == 1
+
+
+def test_gives_up_after_max_attempts(outbox, sender):
+    sender.result = None
+    outbox.submit("POST", "/inquiries", {})
+    for _ in range(3):
+        make_due(outbox)
+        outbox.replay_due()
+    make_due(outbox)
+    outbox.replay_due()
+
+    assert len(sender.calls) == 3
+    assert outbox.stats()["dead"] == 1
+
+
+def test_callbacks_report_replayed_and_dead_writes(outbox, sender):
+    delivered, dead = [], []
+    outbox.on_delivered = lambda method, endpoint, payload, result: delivered.append((endpoint, payload, result))
+    outbox.on_dead = lambda method, endpoint, payload, error: dead.append((endpoint, payload, error))
+
+    outbox.submit("POST", "/appointments", {"code": "A"})
+    outbox.replay_due()
+    sender.error = RejectedWrite(409, "slot taken")
+    outbox.submit("POST", "/appointments", {"code": "B"})
+    outbox.replay_due()
+
+    assert delivered == [("/appointments", {"code": "A"}, {"success": True})]
+    assert dead == [("/appointments", {"code": "B"}, "HTTP 409: slot taken")]
+
+
+def test_inline_delivery_does_not_fire_callbacks(outbox):
+    delivered = []
+    outbox.on_delivered = lambda *args: delivered.append(args)
+    outbox.submit("POST", "/appointments", {}, attempt_inline=True)
+    assert delivered == []
+
+
+def test_process_due_drains_more_than_one_batch(outbox, sender):
+    for n in range(REPLAY_BATCH + 5):
+        outbox.submit("POST", "/inquiries", {"n": n})
+    assert outbox.process_due() == REPLAY_BATCH + 5
+    assert [call[2]["n"] for call in sender.calls] == list(range(REPLAY_BATCH + 5))
+
+
+def test_prune_drops_old_delivered_rows_only(outbox, sender):
+    outbox.submit("POST", "/inquiries", {}, attempt_inline=True)
+    sender.result = None
+    outbox.submit("POST", "/inquiries", {}, attempt_inline=True)
+    with outbox._connect() as conn:
+        conn.execute("UPDATE outbox SET delivered_at = 1 WHERE delivered_at IS NOT NULL")
+    outbox.prune()
+    with outbox._connect() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM outbox").fetchone()[0] == 1
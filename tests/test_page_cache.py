@@ -0,0 +1,87 @@
+"""Tests for the precompressed UI pages: encoding selection, ETags and 304 revalidation"""
+
+import gzip
+
+import pytest
+
+import page_cache
+from page_cache import PageCache, PrecompressedPage
+
+HTML = "<html><body>" + "RinglyPro " * 200 + "</body></html>"
+
+
+def accepting(*encodings):
+    return lambda encoding: 1 if encoding in encodings else 0
+
+
+def test_gzip_variant_and_etag_are_stable_across_builds():
+    first, second = PrecompressedPage(HTML), PrecompressedPage(HTML)
+    assert first.variants["gzip"] == second.variants["gzip"]
+    assert gzip.decompress(first.variants["gzip"][1]) == HTML.encode()
+
+
+def test_each_encoding_has_its_own_etag():
+    page = PrecompressedPage(HTML)
+    assert len(set(page.etags)) == len(page.variants)
+    assert PrecompressedPage(HTML + " ").etags[0] != page.etags[0]
+
+
+def test_select_prefers_the_most_compact_accepted_encoding():
+    page = PrecompressedPage(HTML)
+    assert page.select(accepting("gzip", "deflate"))[0] == "gzip"
+    assert page.select(accepting())[0] == "identity"
+    # gzip;q=0 is a refusal
+    assert page.select(lambda encoding: 0)[0] == "identity"
+
+
+def test_brotli_is_preferred_when_available():
+    pytest.importorskip("brotli")
+    page = PrecompressedPage(HTML)
+    assert page.select(accepting("br", "gzip"))[0] == "br"
+
+
+def test_without_brotli_only_gzip_and_identity_are_built(monkeypatch):
+    monkeypatch.setattr(page_cache, "brotli", None)
+    page = PrecompressedPage(HTML)
+    assert set(page.variants) == {"identity", "gzip"}
+    assert page.select(accepting("br"))[0] == "identity"
+
+
+def test_cache_reports_sizes_per_encoding():
+    cache = PageCache()
+    cache.add("voice", HTML)
+    sizes = cache.stats()["pages"]["voice"]
+    assert sizes["identity"] == len(HTML) and sizes["gzip"] < sizes["identity"]
+    assert cache.get("missing") is None
+
+
+@pytest.fixture
+def client(ringlypro_app):
+    return ringlypro_app.app.test_client()
+
+
+def test_page_is_served_compressed_with_an_etag(client):
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers["ETag"].endswith('-gz"')
+    assert b"<html" in gzip.decompress(response.data).lower()
+
+
+@pytest.mark.parametrize("client_encoding", ["gzip", "identity"])
+def test_current_etag_gets_304_whatever_encoding_it_came_from(client, client_encoding):
+    cached = client.get("/chat", headers={"Accept-Encoding": client_encoding}).headers["ETag"]
+
+    response = client.get("/chat", headers={"Accept-Encoding": "gzip", "If-None-Match": cached})
+    assert response.status_code == 304
+    assert response.data == b""
+
+    weak = client.get("/chat", headers={"Accept-Encoding": "gzip", "If-None-Match": f"W/{cached}"})
+    assert weak.status_code == 304
+
+
+def test_stale_etag_gets_the_page(client):
+    response = client.get("/chat", headers={"If-None-Match": '"0000000000"'})
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
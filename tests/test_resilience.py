@@ -0,0 +1,94 @@
+"""Tests for the circuit breaker and latency stats"""
+
+import pytest
+
+import resilience
+from resilience import CircuitBreaker, LatencyStats
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(resilience.time, "monotonic", clock)
+    return clock
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.snapshot()["rejected"] == 1
+    assert breaker.snapshot()["times_opened"] == 1
+
+
+def test_success_resets_the_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=3)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_allows_exactly_one_trial(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock.now += 29
+    assert not breaker.allow()
+
+    clock.now += 1
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # Concurrent callers fail fast while the trial is in flight
+    assert not breaker.allow()
+
+
+def test_successful_trial_closes(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+    breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow() and breaker.allow()
+
+
+def test_failed_trial_reopens_for_a_full_timeout(clock):
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
+    for _ in range(5):
+        breaker.record_failure()
+    clock.now += 30
+    breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.snapshot()["retry_in_seconds"] == 30
+    assert breaker.snapshot()["times_opened"] == 2
+    assert not breaker.allow()
+
+
+def test_latency_percentiles_over_the_window():
+    stats = LatencyStats(window=100)
+    for elapsed in range(1, 201):
+        stats.record(float(elapsed), ok=elapsed % 10 != 0)
+    snapshot = stats.snapshot()
+    assert (snapshot["calls"], snapshot["errors"]) == (200, 20)
+    # Only the last 100 samples (101..200) count toward percentiles
+    assert (snapshot["p50_ms"], snapshot["p95_ms"], snapshot["max_ms"]) == (151.0, 196.0, 200.0)
+
+
+def test_empty_latency_stats():
+    assert LatencyStats().snapshot()["p50_ms"] is None
@@ -0,0 +1,89 @@
+"""Tests for the crawled website knowledge index"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from site_index import SiteKnowledgeIndex, chunk_text
+
+PAGES = {
+    "/": '<html><body><p>RinglyPro answers every business call with a friendly AI receptionist around the clock.</p>'
+         '<a href="/integrations">Integrations</a><a href="https://elsewhere.example/">Away</a>'
+         '<a href="/brochure.pdf">PDF</a><script>var ignored = "script text is never indexed at all";</script>'
+         '</body></html>',
+    "/integrations": '<html><body><p>RinglyPro syncs every caller and appointment into your HubSpot CRM records '
+                     'automatically.</p></body></html>'
+}
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    requested = []
+
+    def do_GET(self):
+        self.requested.append(self.path)
+        body = PAGES.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    SiteHandler.requested = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SiteHandler)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+
+
+def test_chunk_text_groups_lines_and_drops_fragments():
+    text = "\n".join(["one two three four five"] * 3 + ["", "menu"])
+    assert chunk_text(text, max_words=10, min_words=3) == ["one two three four five one two three four five",
+                                                          "one two three four five menu"]
+    assert chunk_text("Home\n\nMenu", min_words=3) == []
+
+
+def test_crawl_follows_same_site_html_links_only(site, tmp_path):
+    index = SiteKnowledgeIndex(site, str(tmp_path / "site.json"))
+    passages = index.crawl()
+
+    assert sorted(SiteHandler.requested) == ["/", "/integrations"]
+    assert index.pages == 2
+    assert not any("script text" in passage for passage in passages)
+
+
+def test_lookup_answers_from_the_index_and_persists_for_other_workers(site, tmp_path):
+    cache_path = str(tmp_path / "site.json")
+    assert SiteKnowledgeIndex(site, cache_path).refresh()
+
+    # A second worker loads the crawl from disk and never touches the site
+    SiteHandler.requested = []
+    other = SiteKnowledgeIndex(site, cache_path)
+    match = other.lookup("does it sync with hubspot crm")
+
+    assert match["url"] == site + "integrations"
+    assert SiteHandler.requested == []
+    assert other.lookup("pizza delivery coupons") is None
+    assert other.stats()["lookups"] == 2 and other.stats()["hits"] == 1
+
+
+def test_failed_refresh_keeps_the_previous_index(site, tmp_path):
+    index = SiteKnowledgeIndex(site, str(tmp_path / "site.json"))
+    index.refresh()
+    saved = dict(PAGES)
+    PAGES.clear()
+    try:
+        assert not index.refresh()
+    finally:
+        PAGES.update(saved)
+    assert index.lookup("does it sync with hubspot crm") is not None
+    assert index.stats()["last_error"] == "crawl returned no content"
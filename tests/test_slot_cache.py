@@ -0,0 +1,119 @@
+"""Tests for the per-date available-slot cache"""
+
+import threading
+import time
+
+import pytest
+
+import slot_cache
+from slot_cache import SlotCache
+
+DATE = "2030-03-05"
+
+
+class Loader:
+    """Slot loader stub; set `gate` to hold fetches until the test releases them"""
+
+    def __init__(self, slots=("09:00", "10:00"), cacheable=True):
+        self.slots = list(slots)
+        self.cacheable = cacheable
+        self.calls = 0
+        self.gate = None
+        self.started = threading.Event()
+
+    def __call__(self, date_str):
+        self.calls += 1
+        self.started.set()
+        if self.gate is not None:
+            self.gate.wait(5)
+        return list(self.slots), self.cacheable
+
+
+def test_second_lookup_is_a_hit():
+    cache, loader = SlotCache(), Loader()
+    assert cache.get_or_load(DATE, loader) == ["09:00", "10:00"]
+    assert cache.get_or_load(DATE, loader) == ["09:00", "10:00"]
+    assert loader.calls == 1
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 1)
+
+
+def test_callers_get_copies():
+    cache = SlotCache()
+    cache.get_or_load(DATE, Loader()).clear()
+    assert cache.get_or_load(DATE, Loader()) == ["09:00", "10:00"]
+
+
+def test_entries_expire_after_the_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(slot_cache.time, "monotonic", lambda: now[0])
+    cache, loader = SlotCache(ttl_seconds=30), Loader()
+    cache.get_or_load(DATE, loader)
+    now[0] += 31
+    cache.get_or_load(DATE, loader)
+    assert loader.calls == 2
+
+
+def test_fallback_slots_are_not_cached():
+    cache, loader = SlotCache(), Loader(cacheable=False)
+    cache.get_or_load(DATE, loader)
+    cache.get_or_load(DATE, loader)
+    assert loader.calls == 2
+
+
+def test_invalidate_forgets_the_date():
+    cache, loader = SlotCache(), Loader()
+    cache.get_or_load(DATE, loader)
+    cache.invalidate(DATE)
+    loader.slots = ["09:00"]
+    assert cache.get_or_load(DATE, loader) == ["09:00"]
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_invalidation_during_a_fetch_keeps_the_stale_result_out_of_the_cache():
+    cache, loader = SlotCache(), Loader()
+    loader.gate = threading.Event()
+    result = []
+    fetch = threading.Thread(target=lambda: result.append(cache.get_or_load(DATE, loader)))
+    fetch.start()
+    assert loader.started.wait(5)
+
+    # A booking lands while the CRM answer (which still lists 10:00) is in flight
+    cache.invalidate(DATE)
+    loader.gate.set()
+    fetch.join(5)
+
+    assert result == [["09:00", "10:00"]]
+    loader.gate, loader.slots = None, ["09:00"]
+    assert cache.get_or_load(DATE, loader) == ["09:00"]
+    assert loader.calls == 2
+
+
+def test_concurrent_misses_share_one_fetch():
+    cache, loader = SlotCache(), Loader()
+    loader.gate = threading.Event()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load(DATE, loader))) for _ in range(5)]
+    threads[0].start()
+    assert loader.started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while cache.stats()["coalesced"] < 4 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    loader.gate.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert loader.calls == 1
+    assert results == [["09:00", "10:00"]] * 5
+
+
+def test_loader_error_propagates_and_is_not_cached():
+    cache = SlotCache()
+
+    def failing(date_str):
+        raise RuntimeError("CRM down")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load(DATE, failing)
+    assert cache.get_or_load(DATE, Loader()) == ["09:00", "10:00"]
@@ -0,0 +1,123 @@
+"""Tests for the outbound SMS dispatcher: duplicate suppression and per-sender rate limits"""
+
+import threading
+import time
+
+import pytest
+
+import sms_dispatcher
+from sms_dispatcher import SMSDispatcher, _SenderRate
+
+SENDER = "+15550000000"
+
+
+class Twilio:
+    """Send stub returning SIDs; set `error` to fail sends, `gate` to hold them"""
+
+    def __init__(self):
+        self.sent = []
+        self.error = None
+        self.gate = None
+
+    def __call__(self, to, body, from_):
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.error is not None:
+            raise self.error
+        self.sent.append((to, body, from_, time.monotonic()))
+        return f"SM{len(self.sent)}"
+
+
+@pytest.fixture
+def twilio():
+    return Twilio()
+
+
+def test_message_is_sent_in_the_background_and_resolves_to_the_sid(twilio):
+    dispatcher = SMSDispatcher(twilio)
+    future = dispatcher.submit("+18132441234", "hello", SENDER)
+    assert future.result(timeout=5) == "SM1"
+    assert dispatcher.stats()["sent"] == 1
+
+
+def test_duplicate_within_the_window_shares_the_original(twilio):
+    dispatcher = SMSDispatcher(twilio, dedup_window=300)
+    first = dispatcher.submit("+18132441234", "hello", SENDER)
+    second = dispatcher.submit("+18132441234", "hello", SENDER)
+    other = dispatcher.submit("+18132441235", "hello", SENDER)
+
+    assert second is first
+    assert other is not first
+    dispatcher.flush()
+    assert len(twilio.sent) == 2
+    assert dispatcher.stats()["duplicates"] == 1
+
+
+def test_duplicate_after_the_window_is_sent_again(twilio, monkeypatch):
+    now = [1000.0]
+    dispatcher = SMSDispatcher(twilio, dedup_window=300)
+    monkeypatch.setattr(sms_dispatcher.time, "monotonic", lambda: now[0])
+    dispatcher.submit("+18132441234", "hello", SENDER)
+    now[0] += 301
+    dispatcher.submit("+18132441234", "hello", SENDER)
+    monkeypatch.undo()
+    assert dispatcher.flush()
+    assert len(twilio.sent) == 2
+
+
+def test_failed_send_does_not_suppress_a_retry(twilio):
+    dispatcher = SMSDispatcher(twilio)
+    twilio.error = RuntimeError("twilio down")
+    failed = dispatcher.submit("+18132441234", "hello", SENDER)
+    with pytest.raises(RuntimeError):
+        failed.result(timeout=5)
+
+    twilio.error = None
+    retry = dispatcher.submit("+18132441234", "hello", SENDER)
+    assert retry is not failed
+    assert retry.result(timeout=5) == "SM1"
+
+
+def test_full_queue_fails_the_future_without_blocking(twilio):
+    twilio.gate = threading.Event()
+    dispatcher = SMSDispatcher(twilio, workers=1, maxsize=1)
+    dispatcher.submit("+18132441234", "one", SENDER)
+    deadline = time.monotonic() + 5
+    while dispatcher.stats()["depth"] and time.monotonic() < deadline:
+        time.sleep(0.001)
+    dispatcher.submit("+18132441234", "two", SENDER)
+
+    dropped = dispatcher.submit("+18132441234", "three", SENDER)
+    with pytest.raises(RuntimeError, match="queue full"):
+        dropped.result(timeout=0)
+    twilio.gate.set()
+    assert dispatcher.flush()
+    assert dispatcher.stats()["dropped"] == 1
+
+
+def test_token_bucket_allows_a_burst_then_paces():
+    rate = _SenderRate(rate=10, burst=3)
+    delays = [rate.reserve() for _ in range(5)]
+    assert delays[:3] == [0.0, 0.0, 0.0]
+    assert delays[3] == pytest.approx(0.1, abs=0.01)
+    assert delays[4] == pytest.approx(0.2, abs=0.01)
+
+
+def test_sends_from_one_number_are_paced(twilio):
+    dispatcher = SMSDispatcher(twilio, rate_per_second=20, burst=2, workers=2)
+    for n in range(4):
+        dispatcher.submit(f"+1813244123{n}", "hello", SENDER)
+    assert dispatcher.flush()
+
+    times = sorted(sent[3] for sent in twilio.sent)
+    # Two go out at once, the next two wait for tokens at 20/s
+    assert times[3] - times[0] >= 0.09
+    assert dispatcher.stats()["throttled"] == 2
+
+
+def test_different_senders_have_separate_buckets(twilio):
+    dispatcher = SMSDispatcher(twilio, rate_per_second=1, burst=1)
+    dispatcher.submit("+18132441234", "hello", "+15550000001")
+    dispatcher.submit("+18132441234", "hello", "+15550000002")
+    assert dispatcher.flush(timeout=0.5)
+    assert dispatcher.stats()["throttled"] == 0
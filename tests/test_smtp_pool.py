@@ -0,0 +1,111 @@
+"""Tests for the pooled SMTP connections"""
+
+import smtplib
+from email.message import EmailMessage
+
+import pytest
+
+import smtp_pool
+from smtp_pool import SMTPConnectionPool
+
+
+class FakeSMTP:
+    """smtplib.SMTP stand-in; `send_errors` are raised by the next send_message calls in order"""
+    instances = []
+    send_errors = []
+    noop_code = 250
+
+    def __init__(self, host, port, timeout=None):
+        self.calls = []
+        self.closed = False
+        self.instances.append(self)
+
+    def starttls(self):
+        self.calls.append("starttls")
+
+    def login(self, username, password):
+        self.calls.append("login")
+
+    def noop(self):
+        self.calls.append("noop")
+        return self.noop_code, b"OK"
+
+    def send_message(self, msg):
+        if self.send_errors:
+            raise self.send_errors.pop(0)
+        self.calls.append("send")
+
+    def quit(self):
+        self.closed = True
+
+    close = quit
+
+
+@pytest.fixture
+def smtp(monkeypatch):
+    smtp = type("SMTP", (FakeSMTP,), {"instances": [], "send_errors": []})
+    monkeypatch.setattr(smtp_pool.smtplib, "SMTP", smtp)
+    return smtp
+
+
+@pytest.fixture
+def pool(smtp):
+    return SMTPConnectionPool("smtp.example.com", 587, "user", "secret", size=2)
+
+
+def message():
+    msg = EmailMessage()
+    msg["To"] = "caller@example.com"
+    msg.set_content("Your appointment is confirmed")
+    return msg
+
+
+def test_connection_is_authenticated_once_and_reused(pool, smtp):
+    for _ in range(3):
+        pool.send_message(message())
+
+    assert len(smtp.instances) == 1
+    assert smtp.instances[0].calls == ["starttls", "login", "send", "send", "send"]
+    assert (pool.stats()["connects"], pool.stats()["reused"], pool.stats()["sent"]) == (1, 2, 3)
+
+
+def test_dropped_connection_is_replaced_and_the_send_retried(pool, smtp):
+    pool.send_message(message())
+    smtp.send_errors.append(smtplib.SMTPServerDisconnected("gone"))
+    pool.send_message(message())
+
+    first, second = smtp.instances
+    assert first.closed and not second.closed
+    assert pool.stats()["reconnects"] == 1 and pool.stats()["sent"] == 2
+
+
+def test_recipient_errors_keep_the_connection_and_propagate(pool, smtp):
+    smtp.send_errors.append(smtplib.SMTPRecipientsRefused({"caller@example.com": (550, b"no")}))
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+        pool.send_message(message())
+    pool.send_message(message())
+    assert len(smtp.instances) == 1
+
+
+def test_idle_connection_failing_noop_is_retired(pool, smtp):
+    pool.idle_check_after = 0
+    pool.send_message(message())
+    smtp.noop_code = 421
+    pool.send_message(message())
+
+    assert len(smtp.instances) == 2
+    assert smtp.instances[0].closed
+    assert pool.stats()["retired"] == 1
+
+
+def test_connection_retired_after_max_messages(pool, smtp):
+    pool.max_messages = 2
+    for _ in range(3):
+        pool.send_message(message())
+    assert len(smtp.instances) == 2
+
+
+def test_421_counts_as_a_connection_error():
+    assert smtp_pool._is_connection_error(smtplib.SMTPResponseException(421, b"closing"))
+    assert not smtp_pool._is_connection_error(smtplib.SMTPResponseException(550, b"mailbox unavailable"))
+    assert smtp_pool._is_connection_error(ConnectionResetError())
@@ -0,0 +1,46 @@
+"""Tests for the content-addressed TTS audio cache"""
+
+from tts_cache import TTSAudioCache, normalize_tts_text
+
+
+def test_key_ignores_whitespace_differences():
+    settings = {"stability": 0.5}
+    assert TTSAudioCache.make_key("v", "m", settings, "Hello   there\n") == \
+        TTSAudioCache.make_key("v", "m", settings, "Hello there")
+    assert normalize_tts_text("  a \n\t b ") == "a b"
+
+
+def test_key_changes_with_voice_and_settings():
+    base = TTSAudioCache.make_key("v", "m", {"stability": 0.5}, "Hi")
+    assert TTSAudioCache.make_key("other", "m", {"stability": 0.5}, "Hi") != base
+    assert TTSAudioCache.make_key("v", "m", {"stability": 0.6}, "Hi") != base
+
+
+def test_lru_eviction_under_byte_budget():
+    cache = TTSAudioCache(max_bytes=10)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    assert cache.get("a") == b"1234"  # a is now most recently used
+    cache.put("c", b"1234")
+
+    assert cache.peek("b") is None
+    assert cache.peek("a") is not None and cache.peek("c") is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 8
+
+
+def test_oversized_clip_is_not_cached():
+    cache = TTSAudioCache(max_bytes=4)
+    cache.put("a", b"12345")
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_hit_ratio_counts_get_but_not_peek():
+    cache = TTSAudioCache()
+    cache.put("a", b"x")
+    cache.get("a")
+    cache.get("missing")
+    cache.peek("a")
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
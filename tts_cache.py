@@ -0,0 +1,102 @@
+"""
+Content-addressed TTS audio cache for RinglyPro Voice Assistant
+Keeps synthesized clips in memory with LRU eviction under a byte budget
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_tts_text(text: str) -> str:
+    """Collapse whitespace so indented prompt literals map to the same clip"""
+    return _WHITESPACE_RE.sub(" ", text or "").strip()
+
+
+class TTSAudioCache:
+    """Thread-safe LRU cache of MP3 bytes keyed by synthesis parameters"""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(voice_id: str, model_id: str, voice_settings: Dict[str, Any], text: str) -> str:
+        """Build the content address for a clip from everything that changes the audio"""
+        material = json.dumps({
+            "voice_id": voice_id,
+            "model_id": model_id,
+            "voice_settings": voice_settings or {},
+            "text": normalize_tts_text(text)
+        }, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached audio and mark it most recently used"""
+        with self._lock:
+            audio = self._entries.get(key)
+            if audio is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return audio
+
+    def peek(self, key: str) -> Optional[bytes]:
+        """Return cached audio without touching counters or recency"""
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: str, audio: bytes):
+        """Store audio, evicting least recently used clips past the byte budget"""
+        size = len(audio)
+        if size > self.max_bytes:
+            logger.warning(f"TTS clip {key} ({size} bytes) exceeds cache budget - not cached")
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+
+            self._entries[key] = audio
+            self._bytes += size
+
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def discard(self, key: str):
+        """Drop a clip from memory if present"""
+        with self._lock:
+            audio = self._entries.pop(key, None)
+            if audio is not None:
+                self._bytes -= len(audio)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of cache counters for health reporting"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0
+            }
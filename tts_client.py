@@ -0,0 +1,126 @@
+"""
+Pooled ElevenLabs TTS client for RinglyPro Voice Assistant
+One keep-alive session per worker so the TLS handshake is paid once, not per utterance
+"""
+
+import logging
+import time
+from typing import Optional, Dict, Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+RACHEL_VOICE_ID = "21m00Tcm4TlvDq8ikWAM"
+DEFAULT_MODEL_ID = "eleven_monolingual_v1"
+DEFAULT_VOICE_SETTINGS = {
+    "stability": 0.5,
+    "similarity_boost": 0.75
+}
+# Anything shorter is an error body or a truncated clip, not speech
+MIN_AUDIO_BYTES = 1000
+
+
+class ElevenLabsClient:
+    """Thin ElevenLabs text-to-speech client built on a pooled requests.Session"""
+
+    def __init__(self, api_key: Optional[str], base_url: str = "https://api.elevenlabs.io",
+                 pool_size: int = 10, timeout: float = 10):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept": "audio/mpeg",
+            "Content-Type": "application/json",
+            "Connection": "keep-alive"
+        })
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.api_key)
+
+    def _post(self, path: str, text: str, voice_id: str, model_id: str,
+              voice_settings: Optional[Dict[str, Any]], timeout: Optional[float], stream: bool):
+        tts_data = {
+            "text": text,
+            "model_id": model_id,
+            "voice_settings": voice_settings or DEFAULT_VOICE_SETTINGS
+        }
+        return self.session.post(
+            f"{self.base_url}/v1/text-to-speech/{voice_id}{path}",
+            json=tts_data,
+            headers={"xi-api-key": self.api_key},
+            timeout=timeout or self.timeout,
+            stream=stream
+        )
+
+    def synthesize(self, text: str, voice_id: str = RACHEL_VOICE_ID, model_id: str = DEFAULT_MODEL_ID,
+                   voice_settings: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Synthesize a full clip. Returns success, audio, status_code, elapsed_ms and error"""
+        if not self.api_key:
+            return {"success": False, "audio": None, "status_code": None, "elapsed_ms": 0.0,
+                    "error": "ElevenLabs API key not configured"}
+
+        started = time.perf_counter()
+        try:
+            response = self._post("", text, voice_id, model_id, voice_settings, timeout, stream=False)
+            elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+
+            if response.status_code == 200 and len(response.content) > MIN_AUDIO_BYTES:
+                return {"success": True, "audio": response.content, "status_code": 200,
+                        "elapsed_ms": elapsed_ms, "error": None}
+            if response.status_code == 200:
+                logger.warning(f"ElevenLabs TTS returned only {len(response.content)} bytes in {elapsed_ms} ms")
+                return {"success": False, "audio": None, "status_code": 200, "elapsed_ms": elapsed_ms,
+                        "error": f"ElevenLabs returned {len(response.content)} bytes of audio"}
+
+            logger.warning(f"ElevenLabs TTS failed: {response.status_code} in {elapsed_ms} ms")
+            return {"success": False, "audio": None, "status_code": response.status_code,
+                    "elapsed_ms": elapsed_ms, "error": f"ElevenLabs returned {response.status_code}"}
+
+        except requests.exceptions.Timeout:
+            elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+            logger.error(f"ElevenLabs TTS timeout after {elapsed_ms} ms")
+            return {"success": False, "audio": None, "status_code": None,
+                    "elapsed_ms": elapsed_ms, "error": "ElevenLabs request timed out"}
+        except Exception as e:
+            elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+            logger.error(f"ElevenLabs TTS error: {e}")
+            return {"success": False, "audio": None, "status_code": None,
+                    "elapsed_ms": elapsed_ms, "error": str(e)}
+
+    def stream(self, text: str, voice_id: str = RACHEL_VOICE_ID, model_id: str = DEFAULT_MODEL_ID,
+               voice_settings: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None,
+               chunk_size: int = 4096) -> Dict[str, Any]:
+        """Start streaming synthesis. On success, chunks is a generator of MP3 bytes that releases the connection when exhausted"""
+        if not self.api_key:
+            return {"success": False, "chunks": None, "status_code": None,
+                    "error": "ElevenLabs API key not configured"}
+
+        try:
+            response = self._post("/stream", text, voice_id, model_id, voice_settings, timeout, stream=True)
+        except Exception as e:
+            logger.error(f"ElevenLabs streaming TTS error: {e}")
+            return {"success": False, "chunks": None, "status_code": None, "error": str(e)}
+
+        if response.status_code != 200:
+            logger.warning(f"ElevenLabs streaming TTS failed: {response.status_code}")
+            response.close()
+            return {"success": False, "chunks": None, "status_code": response.status_code,
+                    "error": f"ElevenLabs returned {response.status_code}"}
+
+        def generate():
+            try:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if chunk:
+                        yield chunk
+            finally:
+                response.close()
+
+        return {"success": True, "chunks": generate(), "status_code": 200, "error": None}